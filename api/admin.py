@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, Response
 from sqlmodel import Session
 
 import core.services.admin_service as service
@@ -9,11 +11,13 @@ from bounded_contexts.team.schemas import (
     RenewSubscriptionResponse,
 )
 from bounded_contexts.user.models import User
-from core.exceptions import SuperAdminRequired
-from core.services import migrations_service
+from core.exceptions import ProfileNotFound, SuperAdminRequired
+from core.schemas import ProfileSummary
+from core.services import migrations_service, team_snapshot
 from core.services.auth import validate_user_token
 from core.settings import MIGRATIONS_PWD
 from infra.database import get_session
+from infra.profiler import RequestProfileReadRepo
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -67,3 +71,77 @@ async def publish_terms_of_use(
         raise SuperAdminRequired()
 
     return service.publish_terms_of_use(password, session)
+
+
+@router.get("/teams/{team_id}/snapshot", status_code=200)
+async def export_team_snapshot(
+    team_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> Response:
+    if not current_user.is_super_admin:
+        raise SuperAdminRequired()
+
+    content = team_snapshot.export_team_snapshot(team_id, session)
+    return Response(
+        content=content,
+        media_type="application/gzip",
+        headers={
+            "Content-Disposition": f'attachment; filename="team-{team_id}.json.gz"'
+        },
+    )
+
+
+@router.post("/teams/restore/{password}", status_code=200)
+async def restore_team_snapshot(
+    password: str,
+    snapshot: UploadFile,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> dict:
+    if not current_user.is_super_admin:
+        raise SuperAdminRequired()
+
+    if password != MIGRATIONS_PWD:
+        raise HTTPException(status_code=401, detail="Invalid password")
+
+    return team_snapshot.restore_team_snapshot(await snapshot.read(), session)
+
+
+@router.get("/profiles", status_code=200)
+async def list_profiles(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> list[ProfileSummary]:
+    if not current_user.is_super_admin:
+        raise SuperAdminRequired()
+
+    return [
+        ProfileSummary.model_validate(profile)
+        for profile in RequestProfileReadRepo(session).get_latest()
+    ]
+
+
+@router.get("/profiles/{profile_id}", status_code=200)
+async def download_profile(
+    profile_id: str,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> Response:
+    """Collapsed stacks, e.g. for flamegraph.pl or speedscope."""
+    if not current_user.is_super_admin:
+        raise SuperAdminRequired()
+
+    profile = RequestProfileReadRepo(session).get_by_id(profile_id)
+    if not profile:
+        raise ProfileNotFound()
+
+    return Response(
+        content=profile.collapsed,
+        media_type="text/plain",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="profile-{profile_id}.collapsed"'
+            )
+        },
+    )
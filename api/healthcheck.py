@@ -1,10 +1,11 @@
 import sys
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlmodel import Session
 from sqlalchemy import text
 
 from infra.database import get_session
+from infra.logger import logging_stats
 
 router = APIRouter(tags=["Healthcheck"])
 
@@ -19,7 +20,7 @@ async def database_startup_check(session: Session = Depends(get_session)):
 
 
 @router.get("/status", status_code=200)
-async def status(session: Session = Depends(get_session)):
+async def status(request: Request, session: Session = Depends(get_session)):
     query = text("""
             SELECT 
                 (SELECT COUNT(*) FROM pg_stat_activity) AS active_connections,
@@ -32,4 +33,6 @@ async def status(session: Session = Depends(get_session)):
         "active_connections": row.active_connections,
         "max_connections": row.max_connections,
         "python_version": sys.version,
+        "warmup": getattr(request.app.state, "warmup", None),
+        "logging": logging_stats(),
     }
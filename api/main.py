@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.openapi.docs import get_swagger_ui_html
@@ -20,18 +22,38 @@ from bounded_contexts.game_and_stats.stats.routers import router as stats_router
 from bounded_contexts.game_and_stats.availability.routers import (
     router as availability_router,
 )
+from bounded_contexts.game_and_stats.export.routers import router as export_router
+from bounded_contexts.game_and_stats.game_import.routers import (
+    router as game_import_router,
+)
 from bounded_contexts.terms_of_use.routers import router as terms_router
+from core.responses import PrecompressedBody
+from infra.compression import CompressionMiddleware
+from infra.database import engine
 from infra.logger import configure_logger
+from infra.request_context import RequestContextMiddleware
+from infra.tracing import configure_tracing
+from infra.warmup import warm_up
 
 security = HTTPBasic()
 configure_logger()
 
+INDEX_HTML_BODY = PrecompressedBody.from_content(INDEX_HTML, media_type="text/html")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.warmup = warm_up(app, engine)
+    yield
+
+
 app = FastAPI(
     title="Team Manager Backend",
     version="1.0.0",
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
+    lifespan=lifespan,
 )
 
 origins = [
@@ -46,6 +68,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE_BYTES,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
+app.add_middleware(RequestContextMiddleware)
 
 app.include_router(admin_router)
 app.include_router(team_router)
@@ -57,9 +85,14 @@ app.include_router(player_router)
 app.include_router(game_router)
 app.include_router(stats_router)
 app.include_router(availability_router)
+app.include_router(export_router)
+app.include_router(game_import_router)
 app.include_router(terms_router)
 app.include_router(cron_router)
 
+# After the routers, whose services and repos it instruments
+configure_tracing(app, engine)
+
 
 @app.exception_handler(Exception)
 async def internal_server_error_handler(request: Request, exc: Exception):
@@ -71,8 +104,8 @@ async def internal_server_error_handler(request: Request, exc: Exception):
 
 
 @app.get("/", response_class=HTMLResponse)
-async def index():
-    return HTMLResponse(content=INDEX_HTML, status_code=200)
+async def index(request: Request):
+    return INDEX_HTML_BODY.response(request)
 
 
 def _verify_credentials(credentials: HTTPBasicCredentials = Depends(security)):
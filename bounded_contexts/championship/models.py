@@ -9,6 +9,9 @@ from core.models.base import BaseTable
 from libs.base_types.interval import Interval
 from libs.datetime import brasilia_now
 
+# Not a column: kept on the instance, out of the mapped/validated fields
+_COMPUTED_STATUS_KEY = "_computed_status"
+
 
 class ChampionshipStatus(str, Enum):
     NAO_INICIADO = "não iniciado"
@@ -44,6 +47,9 @@ class Championship(BaseTable, table=True):
 
     @property
     def status(self) -> ChampionshipStatus:
+        if computed_status := self.__dict__.get(_COMPUTED_STATUS_KEY):
+            return computed_status
+
         today = brasilia_now().date()
         if self.start_date > today:
             return ChampionshipStatus.NAO_INICIADO
@@ -52,6 +58,10 @@ class Championship(BaseTable, table=True):
         else:
             return ChampionshipStatus.EM_ANDAMENTO
 
+    def set_computed_status(self, status: str) -> None:
+        """Status computed by the query (ChampionshipReadRepo.status_column)."""
+        self.__dict__[_COMPUTED_STATUS_KEY] = ChampionshipStatus(status)
+
     @property
     def date_range(self) -> tuple[date, date | None]:
         return self.start_date, self.end_date
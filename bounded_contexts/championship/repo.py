@@ -1,6 +1,6 @@
 from datetime import date
 
-from sqlalchemy import ColumnElement, delete
+from sqlalchemy import Case, ColumnElement, Row, Select, case, delete, func
 
 from bounded_contexts.championship.models import (
     Championship,
@@ -12,7 +12,10 @@ from bounded_contexts.championship.schemas import (
     ChampionshipUpdate,
     ChampionshipFilter,
 )
-from core.repo import BaseRepo
+from bounded_contexts.game_and_stats.models import Game, GamePlayerStat, StatOptions
+from bounded_contexts.player.models import Player
+from bounded_contexts.team.repo import TeamWriteRepo
+from core.repo import BaseRepo, cached_lookup
 
 from uuid import UUID
 from sqlmodel import select, desc, and_, or_, asc
@@ -60,67 +63,41 @@ class ChampionshipWriteRepo(BaseRepo):
         self.session.merge(championship)
         self.session.commit()
 
-    def hard_delete_all_by_team_id(self, team_id: UUID) -> None:
+    def hard_delete_all_by_team_id_without_commit(self, team_id: UUID) -> None:
         self.session.exec(
             delete(Championship).where(Championship.team_id == team_id)  # type: ignore
         )
-        self.session.commit()
+        TeamWriteRepo(self.session).bump_data_versions_without_commit({team_id})
 
 
 class ChampionshipReadRepo(BaseRepo):
 
     @classmethod
-    def query_in_progress(cls, team_id: UUID, today: date = None) -> select:
-        if not today:
-            # defaulting on method's signature doesn't work with time_machine tests
-            today = brasilia_now().date()
-        return (
-            select(Championship)
-            .where(
-                and_(
-                    Championship.team_id == team_id,
-                    Championship.deleted == False,
-                    Championship.start_date <= today,
-                    or_(Championship.end_date == None, Championship.end_date >= today),
-                )
-            )
-            .order_by(desc(Championship.start_date))
-        )
-
-    @classmethod
-    def query_upcoming(cls, team_id: UUID, today: date = None) -> select:
-        if not today:
-            # defaulting on method's signature doesn't work with time_machine tests
-            today = brasilia_now().date()
-        return (
-            select(Championship)
-            .where(
-                and_(
-                    Championship.team_id == team_id,
-                    Championship.deleted == False,
-                    Championship.start_date > today,
-                )
-            )
-            .order_by(asc(Championship.start_date))
-        )
-
-    @classmethod
-    def query_finished(cls, team_id: UUID, today: date = None) -> select:
+    def status_column(cls, today: date = None) -> Case:
+        """Same rule as Championship.status, in SQL."""
         if not today:
             # defaulting on method's signature doesn't work with time_machine tests
             today = brasilia_now().date()
-        return (
-            select(Championship)
-            .where(
-                and_(
-                    Championship.team_id == team_id,
-                    Championship.deleted == False,
-                    Championship.end_date < today,
-                )
-            )
-            .order_by(desc(Championship.start_date))
+        return case(
+            (Championship.start_date > today, ChampionshipStatus.NAO_INICIADO.value),
+            (
+                and_(Championship.end_date != None, Championship.end_date < today),
+                ChampionshipStatus.FINALIZADO.value,
+            ),
+            else_=ChampionshipStatus.EM_ANDAMENTO.value,
         )
 
+    def _exec_with_status(self, query: Select, status: Case) -> list[Championship]:
+        championships = []
+        # execute: exec would keep only the first column of the rows
+        for championship, championship_status in self.session.execute(
+            query.add_columns(status)
+        ):
+            championship.set_computed_status(championship_status)
+            championships.append(championship)
+        return championships
+
+    @cached_lookup
     def get_by_id(self, champ_id: UUID | str) -> Championship:
         if isinstance(champ_id, str):
             champ_id = UUID(champ_id)
@@ -132,6 +109,7 @@ class ChampionshipReadRepo(BaseRepo):
             )
         ).first()
 
+    @cached_lookup
     def get_by_name(self, name: str, team_id: UUID) -> Championship | None:
         return self.session.exec(
             select(Championship).where(  # type: ignore
@@ -141,18 +119,132 @@ class ChampionshipReadRepo(BaseRepo):
             )
         ).first()
 
+    def get_all_by_team_id(self, team_id: UUID) -> list[Championship]:
+        return self.session.exec(
+            select(Championship).where(  # type: ignore
+                Championship.team_id == team_id,
+                Championship.deleted == False,
+            )
+        ).all()
+
     def get_all_order_by_status_and_start_date(
         self, team_id: UUID
     ) -> list[Championship]:
-        in_progress_query = self.query_in_progress(team_id)
-        upcoming_query = self.query_upcoming(team_id)
-        finished_query = self.query_finished(team_id)
-
-        return (
-            self.session.exec(in_progress_query).all()
-            + self.session.exec(upcoming_query).all()
-            + self.session.exec(finished_query).all()
+        """
+        In progress (latest first), upcoming (soonest first), then finished
+        (latest first).
+        """
+        today = brasilia_now().date()
+        status = self.status_column(today)
+        status_rank = case(
+            (status == ChampionshipStatus.EM_ANDAMENTO.value, 0),
+            (status == ChampionshipStatus.NAO_INICIADO.value, 1),
+            else_=2,
+        )
+        query = (
+            select(Championship)
+            .where(
+                Championship.team_id == team_id,
+                Championship.deleted == False,
+            )
+            .order_by(
+                status_rank,
+                # Only set for the upcoming ones, the only ascending bucket
+                asc(case((Championship.start_date > today, Championship.start_date))),
+                desc(Championship.start_date),
+            )
+        )
+        return self._exec_with_status(query, status)
+
+    def get_results_by_stage(self, team_id: UUID) -> list[Row]:
+        """
+        One row per team championship and game stage (None for league games
+        and championships without games), results as in Game.result.
+        """
+        has_score = Game.team_score != None
+        is_win = and_(
+            has_score, or_(Game.is_wo == True, Game.team_score > Game.adversary_score)
+        )
+        is_loss = and_(
+            has_score, Game.is_wo == False, Game.team_score < Game.adversary_score
+        )
+        is_draw = and_(
+            has_score, Game.is_wo == False, Game.team_score == Game.adversary_score
+        )
+
+        def _sum(condition, value=1):
+            return func.coalesce(func.sum(case((condition, value), else_=0)), 0)
+
+        return self.session.execute(
+            select(
+                Championship.id.label("championship_id"),
+                Game.stage,
+                func.count(Game.id).label("games"),
+                _sum(is_win).label("wins"),
+                _sum(is_draw).label("draws"),
+                _sum(is_loss).label("losses"),
+                _sum(has_score, Game.team_score).label("goals_for"),
+                _sum(has_score, Game.adversary_score).label("goals_against"),
+            )
+            .select_from(Championship)
+            .outerjoin(
+                Game,
+                and_(
+                    Game.championship_id == Championship.id,
+                    Game.deleted == False,
+                ),
+            )
+            .where(
+                Championship.team_id == team_id,
+                Championship.deleted == False,
+            )
+            .group_by(Championship.id, Game.stage)
+        ).all()
+
+    def get_stat_leaders(self, team_id: UUID, stats: list[StatOptions]) -> list[Row]:
+        """
+        Per team championship and stat, the players with the highest total
+        (all of them on ties). Own goals aren't counted.
+        """
+        total = func.sum(GamePlayerStat.quantity)
+        totals = (
+            select(
+                Game.championship_id,
+                GamePlayerStat.stat,
+                GamePlayerStat.player_id,
+                total.label("total"),
+                func.rank()
+                .over(
+                    partition_by=(Game.championship_id, GamePlayerStat.stat),
+                    order_by=total.desc(),
+                )
+                .label("position"),
+            )
+            .join(Game, Game.id == GamePlayerStat.game_id)
+            .where(
+                GamePlayerStat.team_id == team_id,
+                GamePlayerStat.deleted == False,
+                GamePlayerStat.player_id != None,
+                GamePlayerStat.stat.in_(stats),
+                Game.deleted == False,
+            )
+            .group_by(
+                Game.championship_id, GamePlayerStat.stat, GamePlayerStat.player_id
+            )
+            .subquery()
         )
+        return self.session.execute(
+            select(
+                totals.c.championship_id,
+                totals.c.stat,
+                totals.c.player_id,
+                Player.name.label("player_name"),
+                totals.c.total,
+            )
+            .join(Player, Player.id == totals.c.player_id)
+            .where(totals.c.position == 1)
+            .order_by(Player.name)
+        ).all()
 
     def get_by_filters(
         self, team_id: UUID, filters: ChampionshipFilter
@@ -162,8 +254,8 @@ class ChampionshipReadRepo(BaseRepo):
             Championship.deleted == False,
         )
 
+        today = brasilia_now().date()
         if filters.status:
-            today = brasilia_now().date()
             status_conditions = []
             if ChampionshipStatus.NAO_INICIADO in filters.status:
                 status_conditions.append(Championship.start_date > today)
@@ -233,4 +325,4 @@ class ChampionshipReadRepo(BaseRepo):
             else:
                 query = query.order_by(field_to_order.asc())
 
-        return self.session.exec(query).all()
+        return self._exec_with_status(query, self.status_column(today))
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlmodel import Session
 
 from bounded_contexts.championship import service
@@ -9,13 +9,21 @@ from bounded_contexts.championship.schemas import (
     ChampionshipResponse,
     ChampionshipUpdate,
     ChampionshipFilter,
+    ChampionshipSummary,
 )
 from bounded_contexts.user.models import User
 from core.exceptions import AdminRequired
+from core.responses import fast_json_response
 from core.services.auth import validate_user_token
+from core.services.profiling import profile_request
+from core.services.etag import TeamETag
 from infra.database import get_session
 
-router = APIRouter(prefix="/championships", tags=["Championship"])
+router = APIRouter(
+    prefix="/championships",
+    tags=["Championship"],
+    dependencies=[Depends(profile_request)],
+)
 
 
 @router.post("/", status_code=201)
@@ -31,14 +39,39 @@ async def create_championship(
     return ChampionshipResponse.model_validate(championship)
 
 
-@router.get("/", status_code=200)
+@router.get("/", status_code=200, dependencies=[Depends(TeamETag(vary_by_date=True))])
 async def get_championships(
+    response: Response,
     session: Session = Depends(get_session),
     current_user: User = Depends(validate_user_token),
 ) -> list[ChampionshipResponse]:
     championships = service.get_championships_by_team(current_user.team_id, session)
 
-    return [ChampionshipResponse.model_validate(champ) for champ in championships]
+    return fast_json_response(
+        [ChampionshipResponse.model_validate(champ) for champ in championships],
+        response,
+    )
+
+
+@router.get("/summaries", status_code=200, dependencies=[Depends(TeamETag())])
+async def get_championships_summaries(
+    response: Response,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> list[ChampionshipSummary]:
+    summaries = service.get_championships_summaries(current_user.team_id, session)
+    return fast_json_response(summaries, response)
+
+
+@router.get("/{champ_id}/summary", status_code=200, dependencies=[Depends(TeamETag())])
+async def get_championship_summary(
+    champ_id: UUID,
+    response: Response,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> ChampionshipSummary:
+    summary = service.get_championship_summary(champ_id, current_user.team_id, session)
+    return fast_json_response(summary, response)
 
 
 @router.post("/filter", status_code=200)
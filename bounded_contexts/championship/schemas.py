@@ -106,3 +106,33 @@ class ChampionshipFilter(BaseModel):
         if v not in options:
             raise ValueError(f"order_by must be one of {options}")
         return v
+
+
+class ChampionshipResults(BaseModel):
+    games: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+
+
+class ChampionshipStageProgress(ChampionshipResults):
+    stage: StageOptions
+
+
+class ChampionshipStatLeader(BaseModel):
+    player_id: UUID
+    player_name: str
+    total: int
+
+
+class ChampionshipSummary(ChampionshipResults):
+    championship_id: UUID
+    # Knockout format only, in StageOptions order
+    stages: list[ChampionshipStageProgress] = []
+    furthest_stage: StageOptions | None = None
+    # Lists for ties
+    top_scorers: list[ChampionshipStatLeader] = []
+    top_assisters: list[ChampionshipStatLeader] = []
+    top_mvps: list[ChampionshipStatLeader] = []
@@ -1,5 +1,7 @@
+from threading import Lock
 from uuid import UUID
 
+from cachetools import TTLCache
 from sqlmodel import Session
 
 from bounded_contexts.championship.exceptions import (
@@ -20,13 +22,40 @@ from bounded_contexts.championship.schemas import (
     ChampionshipCreate,
     ChampionshipUpdate,
     ChampionshipFilter,
+    ChampionshipResults,
+    ChampionshipStageProgress,
+    ChampionshipStatLeader,
+    ChampionshipSummary,
 )
 from bounded_contexts.game_and_stats.game.repo import GameReadRepo
+from bounded_contexts.game_and_stats.models import StatOptions
 from bounded_contexts.team.exceptions import TeamNotFound
 from bounded_contexts.team.repo import TeamReadRepo
 from bounded_contexts.user.models import User
+from core.enums import StageOptions
 from core.exceptions import AdminRequired
-from core.settings import FRIENDLY_CHAMPIONSHIP_NAME, BEFORE_SYSTEM_CHAMPIONSHIP_NAME
+from core.settings import (
+    FRIENDLY_CHAMPIONSHIP_NAME,
+    BEFORE_SYSTEM_CHAMPIONSHIP_NAME,
+    CHAMPIONSHIP_SUMMARIES_CACHE_MAXSIZE,
+    CHAMPIONSHIP_SUMMARIES_CACHE_TTL_SECONDS,
+)
+
+# team_id -> (team data_version, summaries by championship id). Any write to
+# the team's games or stats bumps the data_version, which invalidates it. The
+# TTL bounds how long a write that missed the bump can go unseen
+_summaries_cache: TTLCache = TTLCache(
+    maxsize=CHAMPIONSHIP_SUMMARIES_CACHE_MAXSIZE,
+    ttl=CHAMPIONSHIP_SUMMARIES_CACHE_TTL_SECONDS,
+)
+_summaries_lock = Lock()
+
+_LEADERS_FIELD_BY_STAT = {
+    StatOptions.GOAL: "top_scorers",
+    StatOptions.ASSIST: "top_assisters",
+    StatOptions.MVP: "top_mvps",
+}
+_STAGES_ORDER = list(StageOptions)
 
 
 def create_championship(
@@ -51,6 +80,73 @@ def get_championships_by_team(team_id: UUID, session: Session) -> list[Champions
     )
 
 
+def get_championships_summaries(
+    team_id: UUID, session: Session
+) -> list[ChampionshipSummary]:
+    return list(_get_summaries_by_championship(team_id, session).values())
+
+
+def get_championship_summary(
+    champ_id: UUID, team_id: UUID, session: Session
+) -> ChampionshipSummary:
+    summary = _get_summaries_by_championship(team_id, session).get(champ_id)
+    if not summary:
+        raise ChampionshipNotFound()
+    return summary
+
+
+def _get_summaries_by_championship(
+    team_id: UUID, session: Session
+) -> dict[UUID, ChampionshipSummary]:
+    data_version = TeamReadRepo(session).get_data_version(team_id)
+    with _summaries_lock:
+        cached = _summaries_cache.get(team_id)
+    if cached and cached[0] == data_version:
+        return cached[1]
+
+    summaries = _build_summaries(team_id, session)
+    with _summaries_lock:
+        _summaries_cache[team_id] = (data_version, summaries)
+    return summaries
+
+
+def _build_summaries(
+    team_id: UUID, session: Session
+) -> dict[UUID, ChampionshipSummary]:
+    """Two aggregate queries for all the team's championships."""
+    repo = ChampionshipReadRepo(session)
+    summaries: dict[UUID, ChampionshipSummary] = {}
+    for row in repo.get_results_by_stage(team_id):
+        summary = summaries.setdefault(
+            row.championship_id,
+            ChampionshipSummary(championship_id=row.championship_id),
+        )
+        results = {
+            field: getattr(row, field) for field in ChampionshipResults.model_fields
+        }
+        for field, value in results.items():
+            setattr(summary, field, getattr(summary, field) + value)
+        if row.stage:
+            summary.stages.append(ChampionshipStageProgress(stage=row.stage, **results))
+
+    for summary in summaries.values():
+        summary.stages.sort(key=lambda progress: _STAGES_ORDER.index(progress.stage))
+        if summary.stages:
+            summary.furthest_stage = summary.stages[-1].stage
+
+    for row in repo.get_stat_leaders(team_id, list(_LEADERS_FIELD_BY_STAT)):
+        if summary := summaries.get(row.championship_id):
+            getattr(summary, _LEADERS_FIELD_BY_STAT[row.stat]).append(
+                ChampionshipStatLeader(
+                    player_id=row.player_id,
+                    player_name=row.player_name,
+                    total=row.total,
+                )
+            )
+
+    return summaries
+
+
 def filter_championships(
     team_id: UUID, filter_data: ChampionshipFilter, session: Session
 ) -> list[Championship]:
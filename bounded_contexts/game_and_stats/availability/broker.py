@@ -0,0 +1,88 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager, AbstractAsyncContextManager
+from threading import Lock
+from typing import AsyncIterator, Protocol
+from uuid import UUID
+
+from loguru import logger
+
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class AvailabilityBroker(Protocol):
+    """
+    Per-game pub/sub channel of availability events (already serialized).
+
+    publish is called from the (sync) services after the commit, subscribe
+    from the SSE stream. A multi-instance deployment plugs a broker backed by
+    a shared channel (e.g. Postgres LISTEN/NOTIFY) through
+    set_availability_broker.
+    """
+
+    def publish(self, game_id: UUID, message: str) -> None: ...
+
+    def subscribe(
+        self, game_id: UUID
+    ) -> AbstractAsyncContextManager[asyncio.Queue[str]]: ...
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def put(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("Availability subscriber queue full, dropping event")
+
+
+class InProcessBroker:
+    """Broker for a single instance: one asyncio queue per subscriber."""
+
+    def __init__(self):
+        self._subscribers: dict[UUID, set[_Subscriber]] = defaultdict(set)
+        self._lock = Lock()
+
+    def publish(self, game_id: UUID, message: str) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(game_id, ()))
+
+        for subscriber in subscribers:
+            # Publishers may run outside the subscriber's loop (threadpool)
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.put, message)
+            except RuntimeError:
+                # Loop already closed, the subscriber is going away
+                continue
+
+    @asynccontextmanager
+    async def subscribe(self, game_id: UUID) -> AsyncIterator[asyncio.Queue[str]]:
+        subscriber = _Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[game_id].add(subscriber)
+        try:
+            yield subscriber.queue
+        finally:
+            with self._lock:
+                self._subscribers[game_id].discard(subscriber)
+                if not self._subscribers[game_id]:
+                    del self._subscribers[game_id]
+
+    def subscribers_count(self, game_id: UUID) -> int:
+        with self._lock:
+            return len(self._subscribers.get(game_id, ()))
+
+
+_broker: AvailabilityBroker = InProcessBroker()
+
+
+def get_availability_broker() -> AvailabilityBroker:
+    return _broker
+
+
+def set_availability_broker(broker: AvailabilityBroker) -> None:
+    global _broker
+    _broker = broker
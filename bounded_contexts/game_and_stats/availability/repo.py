@@ -1,7 +1,9 @@
-from uuid import UUID
+from typing import Iterable
+from uuid import UUID, uuid4
 
 from sqlmodel import select
-from sqlalchemy import func, delete
+from sqlalchemy import func, delete, and_, update, or_
+from sqlalchemy.dialects import postgresql, sqlite
 
 from bounded_contexts.game_and_stats.availability.schemas import (
     GamePlayerAvailabilityCreate,
@@ -10,19 +12,27 @@ from bounded_contexts.game_and_stats.availability.schemas import (
 from bounded_contexts.game_and_stats.models import (
     GamePlayerAvailability,
     AvailabilityStatus,
+    Game,
 )
+from bounded_contexts.player.models import Player
+from bounded_contexts.team.repo import TeamWriteRepo
 from core.repo import BaseRepo
 from libs.datetime import utcnow
 
 
 class AvailabilityWriteRepo(BaseRepo):
+    """
+    The single game writes return the game's confirmed players count, as
+    recounted in their own transaction (for the availability change events).
+    """
+
     def create(
         self,
         create_data: GamePlayerAvailabilityCreate,
         team_id: UUID,
         player_id: UUID,
         current_user_id: UUID,
-    ) -> GamePlayerAvailability:
+    ) -> int:
         create_data = create_data.model_dump()
         create_data["team_id"] = team_id
         create_data["player_id"] = player_id
@@ -30,16 +40,17 @@ class AvailabilityWriteRepo(BaseRepo):
         availability = GamePlayerAvailability(**create_data)
         availability.created_by = current_user_id
         self.session.add(availability)
+        self.session.flush()
+        counts = self.refresh_game_counters_without_commit([availability.game_id])
         self.session.commit()
-        self.session.refresh(availability)
-        return availability
+        return counts[availability.game_id]
 
     def update(
         self,
         availability: GamePlayerAvailability,
         update_data: GamePlayerAvailabilityUpdate,
         current_user_id: UUID,
-    ):
+    ) -> int:
         for key, value in update_data.model_dump().items():
             if key == "id":
                 continue
@@ -49,18 +60,22 @@ class AvailabilityWriteRepo(BaseRepo):
         availability.updated_by = current_user_id
 
         self.session.merge(availability)
+        self.session.flush()
+        counts = self.refresh_game_counters_without_commit([availability.game_id])
         self.session.commit()
-        self.session.refresh(availability)
-        return availability
+        return counts[availability.game_id]
 
     def delete(
         self, availability: GamePlayerAvailability, current_user_id: UUID
-    ) -> None:
+    ) -> int:
         availability.deleted = True
         availability.updated_at = utcnow()
         availability.updated_by = current_user_id
         self.session.merge(availability)
+        self.session.flush()
+        counts = self.refresh_game_counters_without_commit([availability.game_id])
         self.session.commit()
+        return counts[availability.game_id]
 
     def delete_many_without_commit(
         self, availabilities: list[GamePlayerAvailability], current_user_id: UUID
@@ -71,27 +86,170 @@ class AvailabilityWriteRepo(BaseRepo):
             availability.updated_by = current_user_id
             self.session.merge(availability)
         self.session.flush()
+        self.refresh_game_counters_without_commit(
+            {availability.game_id for availability in availabilities}
+        )
 
     def reactivate(
         self,
         availability: GamePlayerAvailability,
         new_status: AvailabilityStatus,
         current_user_id: UUID,
-    ) -> None:
+    ) -> int:
         availability.deleted = False
         availability.status = new_status
         availability.updated_at = utcnow()
         availability.updated_by = current_user_id
         self.session.merge(availability)
+        self.session.flush()
+        counts = self.refresh_game_counters_without_commit([availability.game_id])
+        self.session.commit()
+        return counts[availability.game_id]
+
+    def upsert_many(
+        self,
+        game_id: UUID,
+        team_id: UUID,
+        statuses: dict[UUID, AvailabilityStatus],
+        current_user_id: UUID,
+    ) -> int:
+        """
+        Sets the players' availability in a single INSERT ... ON CONFLICT DO
+        UPDATE over uq_gpa_game_id_player_id. Existing rows (soft deleted ones
+        included, which get reactivated) keep their id and creation data.
+
+        :param statuses: Player id -> status.
+        """
+        now = utcnow()
+        rows = [
+            {
+                "id": uuid4(),
+                "team_id": team_id,
+                "game_id": game_id,
+                "player_id": player_id,
+                "status": status,
+                "deleted": False,
+                "created_at": now,
+                "updated_at": now,
+                "created_by": current_user_id,
+            }
+            for player_id, status in statuses.items()
+        ]
+
+        # Core statements don't go through the flush that bumps it. Bumped
+        # first, as that flush does: the team row is locked before the game's
+        TeamWriteRepo(self.session).bump_data_versions_without_commit({team_id})
+
+        dialect = (
+            postgresql if self.session.bind.dialect.name == "postgresql" else sqlite
+        )
+        statement = dialect.insert(GamePlayerAvailability).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=["game_id", "player_id"],
+            set_={
+                "status": statement.excluded.status,
+                "deleted": False,
+                "updated_at": now,
+                "updated_by": current_user_id,
+            },
+        )
+        self.session.exec(statement)  # type: ignore
+
+        counts = self.refresh_game_counters_without_commit([game_id])
         self.session.commit()
+        return counts[game_id]
 
-    def hard_delete_all_by_team_id(self, team_id: UUID) -> None:
+    def hard_delete_all_by_team_id_without_commit(self, team_id: UUID) -> None:
         self.session.exec(
             delete(GamePlayerAvailability).where(
                 GamePlayerAvailability.team_id == team_id  # type: ignore
             )
         )
+        self.session.exec(
+            update(Game)  # type: ignore
+            .where(Game.team_id == team_id)
+            .values(available_count=0, not_available_count=0, doubt_count=0)
+        )
+        TeamWriteRepo(self.session).bump_data_versions_without_commit({team_id})
+
+    def refresh_game_counters_without_commit(
+        self, game_ids: Iterable[UUID]
+    ) -> dict[UUID, int]:
+        """
+        Recounts (instead of incrementing) the games' availability counters,
+        in the caller's transaction. Pending availability changes must be
+        flushed before.
+
+        The games are locked first, in a statement of their own: under READ
+        COMMITTED a recount UPDATE that waited on another writer's row lock
+        would re-apply its subqueries with its old snapshot, missing that
+        writer's rows. The recount that follows the lock sees them.
+
+        :return: Game id -> its new available_count.
+        """
+        if not game_ids:
+            return {}
+
+        # No-op on SQLite, whose writes are serialized anyway
+        self.session.exec(
+            select(Game.id)
+            .where(Game.id.in_(game_ids))
+            .order_by(Game.id)
+            .with_for_update()
+        ).all()
+        rows = self.session.exec(
+            update(Game)  # type: ignore
+            .where(Game.id.in_(game_ids))
+            .values(_game_counters_values())
+            .returning(Game.id, Game.available_count)
+            .execution_options(synchronize_session=False)
+        ).all()
+        return {game_id: available_count for game_id, available_count in rows}
+
+    def repair_game_counters(self) -> int:
+        """
+        Reconciles the counters of every game that drifted from its
+        availabilities (e.g. rows written outside this repo).
+
+        :return: Number of games fixed.
+        """
+        counters = _game_counters_values()
+        drifted = or_(
+            *(getattr(Game, column) != count for column, count in counters.items())
+        )
+        # The teams are locked (bumped) before their games, as in every write
+        team_ids = set(self.session.exec(select(Game.team_id).where(drifted)).all())
+        if not team_ids:
+            return 0
+        TeamWriteRepo(self.session).bump_data_versions_without_commit(team_ids)
+
+        result = self.session.exec(
+            update(Game)  # type: ignore
+            .where(drifted)
+            .values(counters)
+            .execution_options(synchronize_session=False)
+        )
         self.session.commit()
+        return result.rowcount
+
+
+def _game_counters_values() -> dict:
+    def _count(status: AvailabilityStatus):
+        return (
+            select(func.count())
+            .where(
+                GamePlayerAvailability.game_id == Game.id,
+                GamePlayerAvailability.status == status,
+                GamePlayerAvailability.deleted == False,
+            )
+            .scalar_subquery()
+        )
+
+    return {
+        "available_count": _count(AvailabilityStatus.AVAILABLE),
+        "not_available_count": _count(AvailabilityStatus.NOT_AVAILABLE),
+        "doubt_count": _count(AvailabilityStatus.DOUBT),
+    }
 
 
 class AvailabilityReadRepo(BaseRepo):
@@ -103,6 +261,45 @@ class AvailabilityReadRepo(BaseRepo):
             )
         ).all()
 
+    def get_players_availability_by_game(
+        self, game_id: UUID
+    ) -> list[tuple[UUID, str, str]] | None:
+        """
+        (player_id, player_name, status) of the game's availabilities, in a
+        single round-trip - the game is the driving table, so its existence is
+        checked by the same query.
+
+        :return: None if the game does not exist. A game without availabilities
+            comes back as one row of Nones, filtered out here.
+        """
+        rows = self.session.exec(
+            select(  # type: ignore
+                Game.id,
+                GamePlayerAvailability.player_id,
+                Player.name,
+                GamePlayerAvailability.status,
+            )
+            .outerjoin(
+                GamePlayerAvailability,
+                and_(
+                    GamePlayerAvailability.game_id == Game.id,
+                    GamePlayerAvailability.deleted == False,
+                ),
+            )
+            .outerjoin(Player, Player.id == GamePlayerAvailability.player_id)
+            .where(Game.id == game_id, Game.deleted == False)
+            .order_by(GamePlayerAvailability.created_at)
+        ).all()
+
+        if not rows:
+            return None
+
+        return [
+            (player_id, player_name, status)
+            for _, player_id, player_name, status in rows
+            if player_id is not None
+        ]
+
     def get_by_game_and_player(
         self, game_id: UUID, player_id: UUID, deleted: bool = False
     ) -> GamePlayerAvailability:
@@ -113,12 +310,3 @@ class AvailabilityReadRepo(BaseRepo):
                 GamePlayerAvailability.deleted == deleted,
             )
         ).first()
-
-    def count_confirmed_players_by_game(self, game_id: UUID) -> int:
-        return self.session.exec(
-            select(func.count()).where(  # type: ignore
-                GamePlayerAvailability.game_id == game_id,
-                GamePlayerAvailability.status == AvailabilityStatus.AVAILABLE,
-                GamePlayerAvailability.deleted == False,
-            )
-        ).one()
@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 from bounded_contexts.game_and_stats.availability import service
@@ -8,6 +9,7 @@ from bounded_contexts.game_and_stats.availability.schemas import (
     GamePlayerAvailabilityCreate,
     GamePlayersAvailabilityResponse,
     GamePlayerAvailabilityUpdate,
+    GamePlayersAvailabilityBulkUpsert,
 )
 from bounded_contexts.user.models import User
 from core.services.auth import validate_user_token
@@ -25,6 +27,18 @@ async def create_game_player_availability(
     return service.create_game_player_availability(create_data, session, current_user)
 
 
+@router.put("/{game_id}/bulk", status_code=200)
+async def upsert_game_players_availability(
+    game_id: UUID,
+    upsert_data: GamePlayersAvailabilityBulkUpsert,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> None:
+    return service.upsert_game_players_availability(
+        game_id, upsert_data, session, current_user
+    )
+
+
 @router.get("/{game_id}", status_code=200)
 async def get_game_players_availability(
     game_id: UUID,
@@ -34,6 +48,22 @@ async def get_game_players_availability(
     return service.get_game_players_availability(game_id, session, current_user)
 
 
+@router.get("/{game_id}/events", status_code=200)
+async def stream_game_players_availability(
+    game_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> StreamingResponse:
+    events = await service.subscribe_to_game_players_availability(
+        game_id, session, current_user
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.patch("/{game_id}", status_code=200)
 async def update_game_player_availability(
     game_id: UUID,
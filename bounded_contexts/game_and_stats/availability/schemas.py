@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 from bounded_contexts.game_and_stats.models import AvailabilityStatus
 
@@ -14,9 +14,34 @@ class GamePlayerAvailabilityUpdate(BaseModel):
     status: AvailabilityStatus
 
 
+class PlayerAvailabilityIn(BaseModel):
+    player_id: UUID
+    status: AvailabilityStatus
+
+
+class GamePlayersAvailabilityBulkUpsert(BaseModel):
+    players: list[PlayerAvailabilityIn] = Field(min_length=1, max_length=200)
+
+    @model_validator(mode="after")
+    def validate_unique_players(self):
+        player_ids = [item.player_id for item in self.players]
+        if len(player_ids) != len(set(player_ids)):
+            raise ValueError("Each player can only appear once.")
+        return self
+
+
 class GamePlayersAvailabilityResponse(BaseModel):
     current_player: AvailabilityStatus | None
 
     available: list[str]
     not_available: list[str]
     doubt: list[str]
+
+
+class AvailabilityChangedEvent(BaseModel):
+    game_id: UUID
+    player_id: UUID
+    player_name: str
+    # None when the player removed the availability
+    status: AvailabilityStatus | None
+    confirmed_players: int
@@ -1,7 +1,12 @@
+import asyncio
+from typing import AsyncIterator
 from uuid import UUID
 
 from sqlmodel import Session
 
+from bounded_contexts.game_and_stats.availability.broker import (
+    get_availability_broker,
+)
 from bounded_contexts.game_and_stats.availability.repo import (
     AvailabilityWriteRepo,
     AvailabilityReadRepo,
@@ -10,15 +15,22 @@ from bounded_contexts.game_and_stats.availability.schemas import (
     GamePlayerAvailabilityCreate,
     GamePlayersAvailabilityResponse,
     GamePlayerAvailabilityUpdate,
+    AvailabilityChangedEvent,
+    GamePlayersAvailabilityBulkUpsert,
 )
 from bounded_contexts.game_and_stats.exceptions import (
     GameNotFound,
     UserNeedsAssociatedPlayer,
     AvailabilityNotFound,
+    SomePlayersNotFound,
 )
 from bounded_contexts.game_and_stats.game.repo import GameReadRepo
 from bounded_contexts.game_and_stats.models import AvailabilityStatus
+from bounded_contexts.player.models import Player
+from bounded_contexts.player.repo import PlayerReadRepo
 from bounded_contexts.user.models import User
+from core.exceptions import AdminRequired
+from core.settings import AVAILABILITY_EVENTS_HEARTBEAT_SECONDS
 
 
 def create_game_player_availability(
@@ -37,47 +49,85 @@ def create_game_player_availability(
     )
 
     if deleted_availability:
-        AvailabilityWriteRepo(session).reactivate(
+        confirmed_players = AvailabilityWriteRepo(session).reactivate(
             availability=deleted_availability,
             new_status=create_data.status,
             current_user_id=current_user.id,
         )
     else:
-        AvailabilityWriteRepo(session).create(
+        confirmed_players = AvailabilityWriteRepo(session).create(
             create_data=create_data,
             team_id=current_user.team_id,
             player_id=user_player.id,
             current_user_id=current_user.id,
         )
 
+    _publish_availability_change(
+        create_data.game_id, user_player, create_data.status, confirmed_players
+    )
+
+
+def upsert_game_players_availability(
+    game_id: UUID,
+    upsert_data: GamePlayersAvailabilityBulkUpsert,
+    session: Session,
+    current_user: User,
+) -> None:
+    if not current_user.has_admin_privileges:
+        raise AdminRequired()
+
+    team_id = current_user.team_id
+    game = GameReadRepo(session).get_by_id(game_id)
+    if not game or game.team_id != team_id:
+        raise GameNotFound()
+
+    statuses = {item.player_id: item.status for item in upsert_data.players}
+    players_names = PlayerReadRepo(session).get_names_by_ids_and_team_id(
+        list(statuses), team_id
+    )
+    if len(players_names) != len(statuses):
+        raise SomePlayersNotFound()
+
+    confirmed_players = AvailabilityWriteRepo(session).upsert_many(
+        game_id, team_id, statuses, current_user.id
+    )
+    for player_id, status in statuses.items():
+        event = AvailabilityChangedEvent(
+            game_id=game_id,
+            player_id=player_id,
+            player_name=players_names[player_id],
+            status=status,
+            confirmed_players=confirmed_players,
+        )
+        get_availability_broker().publish(game_id, event.model_dump_json())
+
 
 def get_game_players_availability(
     game_id: UUID, session: Session, current_user: User
 ) -> GamePlayersAvailabilityResponse:
-    if not GameReadRepo(session).get_by_id(game_id):
+    players_availability = AvailabilityReadRepo(
+        session
+    ).get_players_availability_by_game(game_id)
+    if players_availability is None:
         raise GameNotFound()
 
-    availabilities = AvailabilityReadRepo(session).get_by_game_id(game_id)
-
-    user_player = current_user.player
+    user_player_id = current_user.player_id
 
     available, not_available, doubt = [], [], []
     user_player_availability = None
     user_player_name = None
-    for availability in availabilities:
-        player = availability.player
-
-        if user_player and player.id == user_player.id:
-            user_player_availability = availability.status
-            user_player_name = player.name
+    for player_id, player_name, status in players_availability:
+        if user_player_id and player_id == user_player_id:
+            user_player_availability = status
+            user_player_name = player_name
             continue
 
-        if availability.status == AvailabilityStatus.AVAILABLE:
-            available.append(player.name)
-        elif availability.status == AvailabilityStatus.NOT_AVAILABLE:
-            not_available.append(player.name)
-        elif availability.status == AvailabilityStatus.DOUBT:
-            doubt.append(player.name)
+        if status == AvailabilityStatus.AVAILABLE:
+            available.append(player_name)
+        elif status == AvailabilityStatus.NOT_AVAILABLE:
+            not_available.append(player_name)
+        elif status == AvailabilityStatus.DOUBT:
+            doubt.append(player_name)
 
     if user_player_availability and user_player_name:
         if user_player_availability == AvailabilityStatus.AVAILABLE:
@@ -95,6 +145,75 @@ def get_game_players_availability(
     )
 
 
+async def subscribe_to_game_players_availability(
+    game_id: UUID, session: Session, current_user: User
+) -> AsyncIterator[str]:
+    """
+    Server-Sent Events stream of the game's availability: the current listing
+    first, then every change published by the write services.
+
+    Subscribes before reading the listing, so a change committed meanwhile is
+    pushed after it rather than lost. Both happen here, before the response
+    starts, so a missing game is still a 404.
+    """
+    events = _availability_events(game_id, session, current_user)
+    snapshot_event = await anext(events)
+    return _prepended(snapshot_event, events)
+
+
+async def _availability_events(
+    game_id: UUID, session: Session, current_user: User
+) -> AsyncIterator[str]:
+    async with get_availability_broker().subscribe(game_id) as queue:
+        snapshot = get_game_players_availability(game_id, session, current_user)
+        # The stream stays open for minutes, it must not hold a pooled connection
+        session.close()
+
+        yield _server_sent_event("snapshot", snapshot.model_dump_json())
+
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), timeout=AVAILABILITY_EVENTS_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                # Keeps proxies from closing an idle connection
+                yield ": ping\n\n"
+                continue
+
+            yield _server_sent_event("availability", message)
+
+
+async def _prepended(first: str, rest: AsyncIterator[str]) -> AsyncIterator[str]:
+    try:
+        yield first
+        async for item in rest:
+            yield item
+    finally:
+        # Leaves the subscription when the client goes away
+        await rest.aclose()
+
+
+def _server_sent_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _publish_availability_change(
+    game_id: UUID,
+    player: Player,
+    status: AvailabilityStatus | None,
+    confirmed_players: int,
+) -> None:
+    event = AvailabilityChangedEvent(
+        game_id=game_id,
+        player_id=player.id,
+        player_name=player.name,
+        status=status,
+        confirmed_players=confirmed_players,
+    )
+    get_availability_broker().publish(game_id, event.model_dump_json())
+
+
 def update_game_player_availability(
     update_data: GamePlayerAvailabilityUpdate,
     game_id: UUID,
@@ -111,12 +230,16 @@ def update_game_player_availability(
     if not availability:
         raise AvailabilityNotFound()
 
-    AvailabilityWriteRepo(session).update(
+    confirmed_players = AvailabilityWriteRepo(session).update(
         availability=availability,
         update_data=update_data,
         current_user_id=current_user.id,
     )
 
+    _publish_availability_change(
+        game_id, user_player, update_data.status, confirmed_players
+    )
+
 
 def delete_game_player_availability(
     game_id: UUID, session: Session, current_user: User
@@ -131,11 +254,13 @@ def delete_game_player_availability(
     if not availability:
         raise AvailabilityNotFound()
 
-    AvailabilityWriteRepo(session).delete(
+    confirmed_players = AvailabilityWriteRepo(session).delete(
         availability=availability,
         current_user_id=current_user.id,
     )
 
+    _publish_availability_change(game_id, user_player, None, confirmed_players)
+
 
 def delete_game_players_availability(
     game_id: UUID, current_user_id: UUID, session: Session
@@ -3,7 +3,7 @@ from datetime import date
 
 from fastapi import HTTPException
 
-from core.settings import BEFORE_SYSTEM_CHAMPIONSHIP_NAME
+from core.settings import BEFORE_SYSTEM_CHAMPIONSHIP_NAME, GAMES_IMPORT_MAX_ROWS
 
 
 @dataclass
@@ -81,3 +81,15 @@ class CantCreateGamesInBeforeSystemChampionship(HTTPException):
     detail = (
         f"Não é possível criar jogos no campeonato {BEFORE_SYSTEM_CHAMPIONSHIP_NAME}."
     )
+
+
+@dataclass
+class InvalidGamesImportFile(HTTPException):
+    status_code = 400
+    detail = "Arquivo de importação inválido. Envie um CSV ou JSON com os jogos."
+
+
+@dataclass
+class TooManyGamesToImport(HTTPException):
+    status_code = 400
+    detail = f"Máximo de {GAMES_IMPORT_MAX_ROWS} jogos por importação."
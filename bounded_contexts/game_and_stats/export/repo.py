@@ -0,0 +1,150 @@
+import calendar
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Integer, Result, case, func, null
+from sqlmodel import select
+
+from bounded_contexts.championship.models import Championship
+from bounded_contexts.game_and_stats.models import Game, GamePlayerStat, StatOptions
+from bounded_contexts.player.models import Player
+from core.repo import BaseRepo
+from core.settings import EXPORT_ROWS_PER_CHUNK
+from libs.datetime import BRT
+
+STATS_COLUMNS = {
+    StatOptions.PLAYED: "played",
+    StatOptions.GOAL: "goals",
+    StatOptions.ASSIST: "assists",
+    StatOptions.YELLOW_CARD: "yellow_cards",
+    StatOptions.RED_CARD: "red_cards",
+    StatOptions.MVP: "mvps",
+}
+
+
+class ExportReadRepo(BaseRepo):
+    """
+    Results are read in chunks of EXPORT_ROWS_PER_CHUNK rows (result.partitions())
+    from a server-side cursor - yield_per turns stream_results on - instead of
+    being fetched all at once.
+    """
+
+    def stream_games(self, team_id: UUID) -> Result:
+        return self._stream(
+            select(
+                Game.id,
+                Game.date_hour,
+                Championship.name.label("championship"),
+                Game.adversary,
+                Game.is_home,
+                Game.is_wo,
+                Game.round,
+                Game.stage,
+                Game.team_score,
+                Game.adversary_score,
+                Game.team_penalty_score,
+                Game.adversary_penalty_score,
+            )
+            .join(Championship, Championship.id == Game.championship_id)
+            .where(Game.team_id == team_id, Game.deleted == False)
+            .order_by(Game.date_hour, Game.id)
+        )
+
+    def stream_players_game_stats(self, team_id: UUID) -> Result:
+        return self._stream(
+            select(
+                Game.id.label("game_id"),
+                Game.date_hour,
+                Championship.name.label("championship"),
+                Game.adversary,
+                Player.id.label("player_id"),
+                Player.name.label("player"),
+                *_stats_sums(),
+            )
+            .join(Game, Game.id == GamePlayerStat.game_id)
+            .join(Championship, Championship.id == Game.championship_id)
+            .join(Player, Player.id == GamePlayerStat.player_id)
+            .where(
+                GamePlayerStat.team_id == team_id,
+                GamePlayerStat.deleted == False,
+                Game.deleted == False,
+            )
+            .group_by(
+                Game.id,
+                Game.date_hour,
+                Championship.name,
+                Game.adversary,
+                Player.id,
+                Player.name,
+            )
+            .order_by(Game.date_hour, Game.id, Player.name)
+        )
+
+    def stream_players_season_stats(
+        self, team_id: UUID, season_start_date: date | None
+    ) -> Result:
+        """
+        :param season_start_date: The team's, its month and day start every
+            season (January 1st without one).
+        """
+        season = self._season_column(team_id, season_start_date).label("season")
+        return self._stream(
+            select(
+                season,
+                Player.id.label("player_id"),
+                Player.name.label("player"),
+                *_stats_sums(),
+            )
+            .join(Game, Game.id == GamePlayerStat.game_id)
+            .join(Player, Player.id == GamePlayerStat.player_id)
+            .where(
+                GamePlayerStat.team_id == team_id,
+                GamePlayerStat.deleted == False,
+                Game.deleted == False,
+            )
+            .group_by(season, Player.id, Player.name)
+            .order_by(season, Player.name)
+        )
+
+    def _season_column(
+        self, team_id: UUID, season_start_date: date | None
+    ) -> ColumnElement:
+        """
+        The year the game's season started in: the games are compared to the
+        seasons' starts at midnight in Brasília, over the team's games years.
+        """
+        first_game, last_game = self.session.exec(
+            select(func.min(Game.date_hour), func.max(Game.date_hour)).where(
+                Game.team_id == team_id, Game.deleted == False
+            )
+        ).one()
+        if not first_game:
+            return null().cast(Integer)
+
+        start = season_start_date or date(first_game.year, 1, 1)
+        # The first game can be in the season started the year before
+        years = range(last_game.year, first_game.year - 2, -1)
+        return case(
+            *((Game.date_hour >= _season_start(year, start), year) for year in years),
+            else_=null(),
+        )
+
+    def _stream(self, statement) -> Result:
+        return self.session.exec(
+            statement.execution_options(yield_per=EXPORT_ROWS_PER_CHUNK)
+        )
+
+
+def _stats_sums() -> list:
+    return [
+        func.sum(
+            case((GamePlayerStat.stat == stat, GamePlayerStat.quantity), else_=0)
+        ).label(column)
+        for stat, column in STATS_COLUMNS.items()
+    ]
+
+
+def _season_start(year: int, start: date) -> datetime:
+    # A season starting on February 29th starts on the 28th on common years
+    day = min(start.day, calendar.monthrange(year, start.month)[1])
+    return datetime(year, start.month, day, tzinfo=BRT)
@@ -0,0 +1,50 @@
+from typing import Iterator
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from bounded_contexts.game_and_stats.export import service
+from bounded_contexts.user.models import User
+from core.services.auth import validate_user_token
+from infra.database import get_session
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+
+@router.get("/games.csv", status_code=200)
+async def export_games(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> StreamingResponse:
+    return _csv_response(service.export_games(session, current_user), "jogos.csv")
+
+
+@router.get("/players-game-stats.csv", status_code=200)
+async def export_players_game_stats(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> StreamingResponse:
+    return _csv_response(
+        service.export_players_game_stats(session, current_user),
+        "estatisticas-por-jogo.csv",
+    )
+
+
+@router.get("/players-season-stats.csv", status_code=200)
+async def export_players_season_stats(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> StreamingResponse:
+    return _csv_response(
+        service.export_players_season_stats(session, current_user),
+        "estatisticas-por-temporada.csv",
+    )
+
+
+def _csv_response(chunks: Iterator[str], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
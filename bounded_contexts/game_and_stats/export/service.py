@@ -0,0 +1,65 @@
+import csv
+import io
+from typing import Callable, Iterator
+
+from sqlalchemy import Result
+from sqlmodel import Session
+
+from bounded_contexts.game_and_stats.export.repo import ExportReadRepo
+from bounded_contexts.team.repo import TeamReadRepo
+from bounded_contexts.user.models import User
+
+
+def export_games(session: Session, current_user: User) -> Iterator[str]:
+    team_id = current_user.team_id
+    return _csv_chunks(lambda: ExportReadRepo(session).stream_games(team_id), session)
+
+
+def export_players_game_stats(session: Session, current_user: User) -> Iterator[str]:
+    """One line per game and player, with the player's stats in the game."""
+    team_id = current_user.team_id
+    return _csv_chunks(
+        lambda: ExportReadRepo(session).stream_players_game_stats(team_id), session
+    )
+
+
+def export_players_season_stats(session: Session, current_user: User) -> Iterator[str]:
+    """
+    One line per season and player, with the stats summed. Seasons start on
+    the team's season_start_date (month and day) each year and are named
+    after the year they start in.
+    """
+    team_id = current_user.team_id
+
+    def _execute() -> Result:
+        team = TeamReadRepo(session).get_by_id(team_id)
+        return ExportReadRepo(session).stream_players_season_stats(
+            team_id, team.season_start_date
+        )
+
+    return _csv_chunks(_execute, session)
+
+
+def _csv_chunks(execute: Callable[[], Result], session: Session) -> Iterator[str]:
+    """
+    The query only runs once the response starts streaming (get_session has
+    already closed the session by then, it reconnects on demand), and each
+    chunk of rows is written out before the next one is fetched.
+    """
+    try:
+        result = execute()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(result.keys())
+        for rows in result.partitions():
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        # Header only, for teams without data
+        if buffer.tell():
+            yield buffer.getvalue()
+    finally:
+        session.close()
@@ -1,17 +1,21 @@
 from uuid import UUID
 
-from sqlalchemy import func, delete
+from sqlalchemy import func, delete, and_
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
-from bounded_contexts.game_and_stats.models import Game
+from bounded_contexts.championship.models import Championship
+from bounded_contexts.game_and_stats.models import Game, GamePlayerStat
+from bounded_contexts.player.models import Player
+from bounded_contexts.team.models import Team
+from bounded_contexts.team.repo import TeamWriteRepo
 from bounded_contexts.game_and_stats.game.schemas import (
     GameCreate,
     GameInfoIn,
     GameFilter,
     GameBaseWithoutValidation,
 )
-from core.repo import BaseRepo
+from core.repo import BaseRepo, cached_lookup
 from libs.base_types.interval import Interval
 from libs.datetime import utcnow
 
@@ -33,6 +37,14 @@ class GameWriteRepo(BaseRepo):
         self.session.refresh(game)
         return game
 
+    def create_many_without_commit(
+        self, games: list[Game], stats: list[GamePlayerStat]
+    ) -> None:
+        # One flush: the unit of work batches each table in multi-row INSERTs
+        self.session.add_all(games)
+        self.session.add_all(stats)
+        self.session.flush()
+
     def update_without_commit(
         self, game: Game, update_data: GameInfoIn, current_user_id: UUID
     ):
@@ -60,9 +72,9 @@ class GameWriteRepo(BaseRepo):
         self.session.merge(game)
         self.session.flush()
 
-    def hard_delete_all_by_team_id(self, team_id: UUID) -> None:
+    def hard_delete_all_by_team_id_without_commit(self, team_id: UUID) -> None:
         self.session.exec(delete(Game).where(Game.team_id == team_id))  # type: ignore
-        self.session.commit()
+        TeamWriteRepo(self.session).bump_data_versions_without_commit({team_id})
 
 
 class GameReadRepo(BaseRepo):
@@ -82,6 +94,41 @@ class GameReadRepo(BaseRepo):
             .limit(limit)
         )
 
+    def get_team_championship_and_players_ids(
+        self, team_id: UUID, championship_id: UUID | None, player_ids: list[UUID]
+    ) -> tuple[Team | None, Championship | None, set[UUID]]:
+        """
+        Single round-trip: the team row outer joined to its championship and to
+        its players among player_ids (one row per player found).
+        """
+        rows = self.session.exec(
+            select(Team, Championship, Player.id)  # type: ignore
+            .outerjoin(
+                Championship,
+                and_(
+                    Championship.id == championship_id,
+                    Championship.team_id == Team.id,
+                    Championship.deleted == False,
+                ),
+            )
+            .outerjoin(
+                Player,
+                and_(
+                    Player.id.in_(player_ids),
+                    Player.team_id == Team.id,
+                    Player.deleted == False,
+                ),
+            )
+            .where(Team.id == team_id, Team.deleted == False)
+        ).all()
+        if not rows:
+            return None, None, set()
+
+        team, championship, _ = rows[0]
+        players_ids = {player_id for _, _, player_id in rows if player_id}
+        return team, championship, players_ids
+
+    @cached_lookup
     def get_by_id(self, game_id: UUID, deleted: bool = False) -> Game | None:
         return self.session.exec(
             select(Game).where(  # type: ignore
@@ -226,9 +273,12 @@ class GameReadRepo(BaseRepo):
             )
         ).one()
 
-    def get_next_game(self, team_id: UUID) -> Game | None:
+    def get_next_game_and_championship_name(
+        self, team_id: UUID
+    ) -> tuple[Game, str] | None:
         return self.session.exec(
-            select(Game)  # type: ignore
+            select(Game, Championship.name)  # type: ignore
+            .join(Championship, Championship.id == Game.championship_id)
             .where(
                 Game.team_id == team_id,
                 Game.deleted == False,
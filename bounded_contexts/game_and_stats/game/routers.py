@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlmodel import Session
 
 from bounded_contexts.game_and_stats.game import service
@@ -15,10 +15,14 @@ from bounded_contexts.game_and_stats.game.schemas import (
 )
 from bounded_contexts.user.models import User
 from core.exceptions import AdminRequired
+from core.responses import fast_json_response
 from core.services.auth import validate_user_token
+from core.services.profiling import profile_request
 from infra.database import get_session
 
-router = APIRouter(prefix="/games", tags=["Game"])
+router = APIRouter(
+    prefix="/games", tags=["Game"], dependencies=[Depends(profile_request)]
+)
 
 
 @router.post("/", status_code=201)
@@ -33,14 +37,16 @@ async def create_game_and_stats(
 @router.post("/filter", status_code=200)
 async def get_games_filtered_and_paginated(
     filter_data: GameFilter,
+    response: Response,
     limit: int = Query(5, ge=1, le=100),
     offset: int = Query(0, ge=0),
     session: Session = Depends(get_session),
     current_user: User = Depends(validate_user_token),
 ) -> GamesPageResponse:
-    return service.get_games_filtered_and_paginated(
+    games_page = service.get_games_filtered_and_paginated(
         current_user.team_id, filter_data, limit, offset, session
     )
+    return fast_json_response(games_page, response)
 
 
 @router.get("/to-update/{game_id}", status_code=200)
@@ -4,17 +4,12 @@ from sqlmodel import Session
 
 from bounded_contexts.championship.exceptions import ChampionshipNotFound
 from bounded_contexts.championship.repo import ChampionshipReadRepo
-from bounded_contexts.game_and_stats.availability.repo import AvailabilityReadRepo
 from bounded_contexts.game_and_stats.availability.service import (
     delete_game_players_availability,
 )
-from bounded_contexts.game_and_stats.exceptions import (
-    GameDateOutsideChampionshipRange,
-    InvalidChampionshipFormat,
-    GameNotFound,
-    CantCreateGamesInBeforeSystemChampionship,
-)
+from bounded_contexts.game_and_stats.exceptions import GameNotFound
 from bounded_contexts.game_and_stats.game.repo import GameWriteRepo, GameReadRepo
+from bounded_contexts.game_and_stats.game.validation import GameValidationContext
 from bounded_contexts.game_and_stats.game.schemas import (
     GameCreate,
     GameResponse,
@@ -39,8 +34,6 @@ from bounded_contexts.game_and_stats.stats.service import (
     delete_game_stats,
     reactivate_game_stats,
 )
-from bounded_contexts.team.exceptions import TeamNotFound
-from bounded_contexts.team.repo import TeamReadRepo
 from bounded_contexts.user.models import User
 from core.exceptions import AdminRequired, SuperAdminRequired
 from core.schemas import StatsSchema
@@ -53,29 +46,21 @@ def create_game_and_stats(
 ) -> UUID:
     if not current_user.has_admin_privileges:
         raise AdminRequired()
-    if not TeamReadRepo(session=session).get_by_id(current_user.team_id):
-        raise TeamNotFound()
-
-    championship = ChampionshipReadRepo(session).get_by_id(create_data.championship_id)
-    if not championship:
-        raise ChampionshipNotFound()
-    if (championship.is_league_format and create_data.stage) or (
-        not championship.is_league_format and create_data.round
-    ):
-        raise InvalidChampionshipFormat()
-    if championship.name == BEFORE_SYSTEM_CHAMPIONSHIP_NAME:
-        raise CantCreateGamesInBeforeSystemChampionship()
 
-    game_date = create_data.date_hour.date()
-    if not championship.date_is_within_championship(game_date):
-        raise GameDateOutsideChampionshipRange(champ_date_range=championship.date_range)
+    context = GameValidationContext.load(
+        current_user.team_id,
+        create_data.championship_id,
+        create_data.players,
+        session,
+    )
+    context.validate_game_info(create_data, new_game=True)
 
     game = GameWriteRepo(session).create_without_commit(
         create_data, current_user.team_id, current_user.id
     )
 
     stats_data = GameStatsIn(**create_data.model_dump())
-    create_game_stats(stats_data, game.id, current_user, session)
+    create_game_stats(stats_data, game.id, current_user, session, context)
 
     session.commit()
     return game.id
@@ -209,15 +194,22 @@ def update_game_and_stats(
     if not has_game_update and not update_data.has_stats_update:
         return
 
+    context = GameValidationContext.load(
+        current_user.team_id,
+        update_game_data.championship_id if has_game_update else None,
+        update_stats_data.players if update_data.has_stats_update else None,
+        session,
+    )
+
     if has_game_update:
-        _validate_game_update_request(update_game_data, session)
+        context.validate_game_info(update_game_data, new_game=False)
 
         GameWriteRepo(session).update_without_commit(
             game, update_game_data, current_user.id
         )
 
     if update_data.has_stats_update:
-        update_game_stats(update_stats_data, game_id, current_user, session)
+        update_game_stats(update_stats_data, game_id, current_user, session, context)
 
     session.commit()
 
@@ -234,21 +226,6 @@ def _verify_game_changes(game: Game, update_game_data: GameInfoIn) -> bool:
     return has_game_update
 
 
-def _validate_game_update_request(update_data: GameInfoIn, session: Session) -> None:
-    championship = ChampionshipReadRepo(session).get_by_id(update_data.championship_id)
-    if not championship:
-        raise ChampionshipNotFound()
-
-    if (championship.is_league_format and update_data.stage) or (
-        not championship.is_league_format and update_data.round
-    ):
-        raise InvalidChampionshipFormat()
-
-    game_date = update_data.date_hour.date()
-    if not championship.date_is_within_championship(game_date):
-        raise GameDateOutsideChampionshipRange(champ_date_range=championship.date_range)
-
-
 def delete_game_and_dependent_tables(
     game_id: UUID, current_user: User, session: Session
 ) -> None:
@@ -293,21 +270,18 @@ def reactivate_game_and_stats(
 
 
 def get_next_game(team_id: UUID, session: Session) -> NextGameResponse | None:
-    next_game = GameReadRepo(session).get_next_game(team_id)
-    if not next_game:
+    result = GameReadRepo(session).get_next_game_and_championship_name(team_id)
+    if not result:
         return None
 
-    confirmed_players = AvailabilityReadRepo(session).count_confirmed_players_by_game(
-        next_game.id
-    )
-
+    next_game, championship_name = result
     return NextGameResponse(
         id=next_game.id,
-        championship_name=next_game.championship.name[:40],
+        championship_name=championship_name[:40],
         adversary=next_game.adversary[:30],
         date_hour=next_game.date_hour,
         is_home=next_game.is_home,
-        confirmed_players=confirmed_players,
+        confirmed_players=next_game.available_count,
     )
 
 
@@ -380,8 +354,11 @@ def create_before_system_game_and_stats(
         game_data, current_user.team_id, current_user.id
     )
 
+    context = GameValidationContext.load(
+        current_user.team_id, None, [player_id], session
+    )
     stats_data = GameStatsIn(**game_data.model_dump())
-    create_game_stats(stats_data, game.id, current_user, session)
+    create_game_stats(stats_data, game.id, current_user, session, context)
 
     session.commit()
     return game.id
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import Self
+from uuid import UUID
+
+from sqlmodel import Session
+
+from bounded_contexts.championship.exceptions import ChampionshipNotFound
+from bounded_contexts.championship.models import Championship
+from bounded_contexts.game_and_stats.exceptions import (
+    CantCreateGamesInBeforeSystemChampionship,
+    GameDateOutsideChampionshipRange,
+    InvalidChampionshipFormat,
+    InvalidYellowCardsQuantity,
+    SomePlayersNotFound,
+    StatPlayerNotInGamePlayers,
+)
+from bounded_contexts.game_and_stats.game.repo import GameReadRepo
+from bounded_contexts.game_and_stats.game.schemas import GameInfoIn, GameStatsIn
+from bounded_contexts.team.exceptions import TeamNotFound
+from bounded_contexts.team.models import Team
+from core.settings import BEFORE_SYSTEM_CHAMPIONSHIP_NAME
+
+
+@dataclass(frozen=True)
+class GameValidationContext:
+    """
+    What a game create/update request is validated against, loaded once (in a
+    single query) and shared by the game and stats validations, of the games
+    endpoints and of the games import alike.
+    """
+
+    team: Team
+    championship: Championship | None
+    # Requested game players that belong to the team
+    players_ids: frozenset[UUID]
+
+    @classmethod
+    def load(
+        cls,
+        team_id: UUID,
+        championship_id: UUID | None,
+        player_ids: list[UUID] | None,
+        session: Session,
+    ) -> Self:
+        team, championship, players_ids = GameReadRepo(
+            session
+        ).get_team_championship_and_players_ids(
+            team_id, championship_id, player_ids or []
+        )
+        if not team:
+            raise TeamNotFound()
+        return cls(
+            team=team, championship=championship, players_ids=frozenset(players_ids)
+        )
+
+    def get_championship(self) -> Championship:
+        if not self.championship:
+            raise ChampionshipNotFound()
+        return self.championship
+
+    def validate_players(self, player_ids: list[UUID]) -> None:
+        if not self.players_ids.issuperset(player_ids):
+            raise SomePlayersNotFound()
+
+    def validate_game_info(self, game_data: GameInfoIn, new_game: bool) -> None:
+        championship = self.get_championship()
+        if (championship.is_league_format and game_data.stage) or (
+            not championship.is_league_format and game_data.round
+        ):
+            raise InvalidChampionshipFormat()
+        if new_game and championship.name == BEFORE_SYSTEM_CHAMPIONSHIP_NAME:
+            raise CantCreateGamesInBeforeSystemChampionship()
+
+        if not championship.date_is_within_championship(game_data.date_hour.date()):
+            raise GameDateOutsideChampionshipRange(
+                champ_date_range=championship.date_range
+            )
+
+    def validate_stats(self, stats_data: GameStatsIn) -> None:
+        """Games without players have no stats to validate (nor to save)."""
+        if not stats_data.players:
+            return
+        self.validate_players(stats_data.players)
+
+        # Assists may be given by players out of the game's list
+        stats_players_ids = {
+            *(goal.goal_player_id for goal in stats_data.goals_and_assists or []),
+            *(card.player_id for card in stats_data.yellow_cards or []),
+            *(stats_data.red_cards or []),
+            *(mvp.player_id for mvp in stats_data.mvps or []),
+        } - {None}
+        if not self.players_ids.issuperset(stats_players_ids):
+            raise StatPlayerNotInGamePlayers()
+
+        if not stats_data.is_before_system and any(
+            card.quantity > 2 for card in stats_data.yellow_cards or []
+        ):
+            raise InvalidYellowCardsQuantity()
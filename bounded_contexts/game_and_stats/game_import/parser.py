@@ -0,0 +1,87 @@
+"""
+Reads the games of an import file into raw rows, validated later one by one.
+
+JSON: a list of objects shaped like ImportedGame.
+
+CSV: one line per game, with a header with the ImportedGame fields. Lists are
+separated by ";" and empty cells take the field's default:
+    players: "Ana;Bia;Carla"
+    goals_and_assists: "Ana;Bia/Carla;Contra" - scorer, "scorer/assistant" or
+        OWN_GOAL for own goals
+    yellow_cards, mvps: "Ana;Bia:2" - player, or "player:quantity"
+    red_cards: "Ana;Bia"
+"""
+
+import csv
+import io
+import json
+
+from bounded_contexts.game_and_stats.exceptions import InvalidGamesImportFile
+
+OWN_GOAL = "Contra"
+LIST_SEPARATOR = ";"
+
+
+def parse_games_file(content: bytes, filename: str) -> list[dict]:
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise InvalidGamesImportFile()
+
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension == "json":
+        return _parse_json(text)
+    if extension == "csv":
+        return _parse_csv(text)
+    raise InvalidGamesImportFile()
+
+
+def _parse_json(text: str) -> list[dict]:
+    try:
+        rows = json.loads(text)
+    except ValueError:
+        raise InvalidGamesImportFile()
+
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise InvalidGamesImportFile()
+    return rows
+
+
+def _parse_csv(text: str) -> list[dict]:
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames or "championship" not in reader.fieldnames:
+        raise InvalidGamesImportFile()
+
+    rows = []
+    for line in reader:
+        row = {
+            key.strip(): value.strip()
+            for key, value in line.items()
+            if key and value and value.strip()
+        }
+        for key in ("players", "red_cards"):
+            if key in row:
+                row[key] = _split(row[key])
+        if "goals_and_assists" in row:
+            row["goals_and_assists"] = [
+                _goal_and_assist(item) for item in _split(row["goals_and_assists"])
+            ]
+        for key in ("yellow_cards", "mvps"):
+            if key in row:
+                row[key] = [_player_and_quantity(item) for item in _split(row[key])]
+        rows.append(row)
+    return rows
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip() for item in value.split(LIST_SEPARATOR) if item.strip()]
+
+
+def _goal_and_assist(item: str) -> dict:
+    goal, _, assist = (part.strip() for part in item.partition("/"))
+    return {"goal": None if goal == OWN_GOAL else goal, "assist": assist or None}
+
+
+def _player_and_quantity(item: str) -> dict:
+    player, _, quantity = (part.strip() for part in item.partition(":"))
+    return {"player": player, "quantity": quantity or 1}
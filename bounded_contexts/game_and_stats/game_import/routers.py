@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, UploadFile
+from sqlmodel import Session
+
+from bounded_contexts.game_and_stats.game_import import service
+from bounded_contexts.game_and_stats.game_import.schemas import GamesImportResponse
+from bounded_contexts.user.models import User
+from core.services.auth import validate_user_token
+from infra.database import get_session
+
+router = APIRouter(prefix="/import", tags=["Import"])
+
+
+@router.post("/games", status_code=200)
+async def import_games(
+    file: UploadFile,
+    dry_run: bool = False,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(validate_user_token),
+) -> GamesImportResponse:
+    return service.import_games(
+        await file.read(), file.filename or "", current_user, session, dry_run
+    )
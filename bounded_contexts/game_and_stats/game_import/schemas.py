@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from core.enums import StageOptions
+
+
+class ImportedGoal(BaseModel):
+    goal: str | None  # None for own goals
+    assist: str | None = None
+
+
+class ImportedPlayerQuantity(BaseModel):
+    player: str
+    quantity: int = 1
+
+
+class ImportedGame(BaseModel):
+    """Game of a spreadsheet: championship and players referenced by name."""
+
+    championship: str
+    adversary: str
+    date_hour: datetime
+    round: int | None = None
+    stage: StageOptions | None = None
+    is_home: bool = True
+    is_wo: bool = False
+    team_score: int | None = None
+    adversary_score: int | None = None
+    team_penalty_score: int | None = None
+    adversary_penalty_score: int | None = None
+
+    players: list[str] = Field(default_factory=list)
+    goals_and_assists: list[ImportedGoal] = Field(default_factory=list)
+    yellow_cards: list[ImportedPlayerQuantity] = Field(default_factory=list)
+    red_cards: list[str] = Field(default_factory=list)
+    mvps: list[ImportedPlayerQuantity] = Field(default_factory=list)
+
+
+class GameImportRowError(BaseModel):
+    row: int  # 1-based, CSV header not counted
+    errors: list[str]
+
+
+class GamesImportResponse(BaseModel):
+    imported: int
+    errors: list[GameImportRowError]
@@ -0,0 +1,235 @@
+from dataclasses import replace
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlmodel import Session
+
+from bounded_contexts.championship.models import Championship
+from bounded_contexts.championship.repo import ChampionshipReadRepo
+from bounded_contexts.game_and_stats.exceptions import TooManyGamesToImport
+from bounded_contexts.game_and_stats.game.repo import GameWriteRepo
+from bounded_contexts.game_and_stats.game.validation import GameValidationContext
+from bounded_contexts.game_and_stats.game.schemas import (
+    GameCreate,
+    GameInfoIn,
+    GoalAndAssist,
+    PlayerAndQuantity,
+)
+from bounded_contexts.game_and_stats.game_import.parser import parse_games_file
+from bounded_contexts.game_and_stats.game_import.schemas import (
+    ImportedGame,
+    GameImportRowError,
+    GamesImportResponse,
+)
+from bounded_contexts.game_and_stats.models import Game, GamePlayerStat, StatOptions
+from bounded_contexts.player.repo import PlayerReadRepo
+from bounded_contexts.user.models import User
+from core.exceptions import AdminRequired
+from core.settings import GAMES_IMPORT_MAX_ROWS
+
+
+class _RowError(Exception):
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+
+
+def import_games(
+    content: bytes,
+    filename: str,
+    current_user: User,
+    session: Session,
+    dry_run: bool = False,
+) -> GamesImportResponse:
+    """
+    Validates every game in memory, against a single fetch of the team's
+    championships and players, then inserts the valid ones at once. Invalid
+    games are reported (by row) and skipped, they don't abort the import.
+
+    :param dry_run: Only validates, nothing is saved.
+    """
+    if not current_user.has_admin_privileges:
+        raise AdminRequired()
+
+    rows = parse_games_file(content, filename)
+    if len(rows) > GAMES_IMPORT_MAX_ROWS:
+        raise TooManyGamesToImport()
+
+    team_id = current_user.team_id
+    context = GameValidationContext.load(team_id, None, None, session)
+    championships_by_name = {
+        championship.name: championship
+        for championship in ChampionshipReadRepo(session).get_all_by_team_id(team_id)
+    }
+    players_ids_by_name: dict[str, list[UUID]] = {}
+    for player in PlayerReadRepo(session).get_all_players_only_name_and_shirt(team_id):
+        players_ids_by_name.setdefault(player.name, []).append(player.id)
+
+    games, stats, errors = [], [], []
+    for row_number, row in enumerate(rows, start=1):
+        try:
+            game_data = _validate_row(
+                row, context, championships_by_name, players_ids_by_name
+            )
+        except _RowError as e:
+            errors.append(GameImportRowError(row=row_number, errors=e.errors))
+            continue
+
+        game = Game(
+            **GameInfoIn(**game_data.model_dump()).model_dump(),
+            team_id=team_id,
+            created_by=current_user.id,
+        )
+        games.append(game)
+        stats += _build_game_stats(game_data, game.id, team_id, current_user.id)
+
+    if games and not dry_run:
+        GameWriteRepo(session).create_many_without_commit(games, stats)
+        session.commit()
+
+    return GamesImportResponse(imported=0 if dry_run else len(games), errors=errors)
+
+
+def _validate_row(
+    row: dict,
+    context: GameValidationContext,
+    championships_by_name: dict[str, Championship],
+    players_ids_by_name: dict[str, list[UUID]],
+) -> GameCreate:
+    try:
+        imported = ImportedGame.model_validate(row)
+    except ValidationError as e:
+        raise _RowError(_validation_messages(e))
+
+    championship = championships_by_name.get(imported.championship.strip())
+    if not championship:
+        raise _RowError([f"Campeonato não encontrado: {imported.championship}."])
+
+    names = {
+        *imported.players,
+        *(goal.goal for goal in imported.goals_and_assists if goal.goal),
+        *(goal.assist for goal in imported.goals_and_assists if goal.assist),
+        *(card.player for card in imported.yellow_cards),
+        *imported.red_cards,
+        *(mvp.player for mvp in imported.mvps),
+    }
+    name_errors = []
+    for name in sorted(names):
+        ids = players_ids_by_name.get(name, [])
+        if not ids:
+            name_errors.append(f"Jogador não encontrado: {name}.")
+        elif len(ids) > 1:
+            name_errors.append(f"Mais de um jogador com o nome {name}.")
+    if name_errors:
+        raise _RowError(name_errors)
+
+    def _id(name: str | None) -> UUID | None:
+        return players_ids_by_name[name][0] if name else None
+
+    try:
+        game_data = GameCreate(
+            championship_id=championship.id,
+            adversary=imported.adversary,
+            date_hour=imported.date_hour,
+            round=imported.round,
+            stage=imported.stage,
+            is_home=imported.is_home,
+            is_wo=imported.is_wo,
+            team_score=imported.team_score,
+            adversary_score=imported.adversary_score,
+            team_penalty_score=imported.team_penalty_score,
+            adversary_penalty_score=imported.adversary_penalty_score,
+            players=[_id(name) for name in imported.players] or None,
+            goals_and_assists=[
+                GoalAndAssist(
+                    goal_player_id=_id(goal.goal), assist_player_id=_id(goal.assist)
+                )
+                for goal in imported.goals_and_assists
+            ]
+            or None,
+            yellow_cards=[
+                PlayerAndQuantity(player_id=_id(card.player), quantity=card.quantity)
+                for card in imported.yellow_cards
+            ]
+            or None,
+            red_cards=[_id(name) for name in imported.red_cards] or None,
+            mvps=[
+                PlayerAndQuantity(player_id=_id(mvp.player), quantity=mvp.quantity)
+                for mvp in imported.mvps
+            ]
+            or None,
+        )
+        # The players were looked up among the team's
+        game_context = replace(
+            context,
+            championship=championship,
+            players_ids=frozenset(game_data.players or []),
+        )
+        game_context.validate_game_info(game_data, new_game=True)
+        game_context.validate_stats(game_data)
+    except ValidationError as e:
+        raise _RowError(_validation_messages(e))
+    except HTTPException as e:
+        raise _RowError([e.detail])
+
+    return game_data
+
+
+def _build_game_stats(
+    game_data: GameCreate, game_id: UUID, team_id: UUID, created_by: UUID
+) -> list[GamePlayerStat]:
+    def _stat(
+        stat: StatOptions,
+        player_id: UUID | None,
+        quantity: int = 1,
+        related_stat_id: UUID | None = None,
+    ) -> GamePlayerStat:
+        return GamePlayerStat(
+            id=uuid4(),
+            team_id=team_id,
+            game_id=game_id,
+            player_id=player_id,
+            related_stat_id=related_stat_id,
+            stat=stat,
+            quantity=quantity,
+            created_by=created_by,
+        )
+
+    stats = [
+        _stat(StatOptions.PLAYED, player_id) for player_id in game_data.players or []
+    ]
+    for goal_and_assist in game_data.goals_and_assists or []:
+        goal = _stat(StatOptions.GOAL, goal_and_assist.goal_player_id)
+        stats.append(goal)
+        if goal_and_assist.assist_player_id:
+            stats.append(
+                _stat(
+                    StatOptions.ASSIST,
+                    goal_and_assist.assist_player_id,
+                    related_stat_id=goal.id,
+                )
+            )
+    stats += [
+        _stat(StatOptions.YELLOW_CARD, card.player_id, card.quantity)
+        for card in game_data.yellow_cards or []
+    ]
+    stats += [
+        _stat(StatOptions.RED_CARD, player_id)
+        for player_id in game_data.red_cards or []
+    ]
+    stats += [
+        _stat(StatOptions.MVP, mvp.player_id, mvp.quantity)
+        for mvp in game_data.mvps or []
+    ]
+    return stats
+
+
+def _validation_messages(error: ValidationError) -> list[str]:
+    return [
+        (
+            f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}"
+            if e["loc"]
+            else e["msg"]
+        )
+        for e in error.errors()
+    ]
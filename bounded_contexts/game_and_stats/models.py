@@ -4,6 +4,7 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
+from sqlalchemy import UniqueConstraint
 from sqlmodel import Field, Relationship
 
 from core.consts import DEFAULT_ADVERSARY
@@ -36,6 +37,13 @@ class Game(BaseTable, table=True):
         ge=0, le=100, nullable=True, default=None
     )
 
+    # Denormalized from game_player_availability, kept by AvailabilityWriteRepo
+    available_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    not_available_count: int = Field(
+        default=0, sa_column_kwargs={"server_default": "0"}
+    )
+    doubt_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+
     championship: "Championship" = Relationship(back_populates="game")
 
     @property
@@ -58,6 +66,9 @@ class AvailabilityStatus(str, Enum):
 
 class GamePlayerAvailability(BaseTable, table=True):
     __tablename__ = "game_player_availability"
+    __table_args__ = (
+        UniqueConstraint("game_id", "player_id", name="uq_gpa_game_id_player_id"),
+    )
 
     team_id: UUID = Field(foreign_key="team.id", ondelete="CASCADE")
     game_id: UUID = Field(foreign_key="game.id", ondelete="CASCADE")
@@ -1,39 +1,34 @@
+from typing import Iterable
 from uuid import UUID, uuid4
 
 from sqlalchemy import delete, func, desc, asc
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
-from bounded_contexts.game_and_stats.exceptions import (
-    StatPlayerNotInGamePlayers,
-    InvalidYellowCardsQuantity,
-)
 from bounded_contexts.game_and_stats.game.schemas import (
     GoalAndAssist,
     PlayerAndQuantity,
 )
 from bounded_contexts.game_and_stats.models import GamePlayerStat, StatOptions, Game
 from bounded_contexts.player.models import Player
+from bounded_contexts.team.repo import TeamWriteRepo
 from core.repo import BaseRepo
 from libs.datetime import utcnow, current_month_range
 
 
 class GamePlayerStatWriteRepo(BaseRepo):
+    """The stats are validated beforehand, by GameValidationContext.validate_stats."""
+
     def create_goals_and_assists_without_commit(
         self,
         team_id: UUID,
         game_id: UUID,
         stats_data: list[GoalAndAssist],
-        game_players_ids: list[UUID],
         current_user_id: UUID,
         is_before_system: bool,
     ) -> None:
         stats = []
         for stat_data in stats_data:
-            goal_player_id = stat_data.goal_player_id
-            if goal_player_id and goal_player_id not in game_players_ids:
-                raise StatPlayerNotInGamePlayers()
-
             goal_id = None
             if not stat_data.ignore_goal:
                 goal_id = uuid4()
@@ -42,7 +37,7 @@ class GamePlayerStatWriteRepo(BaseRepo):
                         id=goal_id,
                         team_id=team_id,
                         game_id=game_id,
-                        player_id=goal_player_id,
+                        player_id=stat_data.goal_player_id,
                         stat=StatOptions.GOAL,
                         quantity=1,
                         created_by=current_user_id,
@@ -71,17 +66,13 @@ class GamePlayerStatWriteRepo(BaseRepo):
         stat_type: StatOptions,
         team_id: UUID,
         game_id: UUID,
-        player_ids: list[UUID],
+        player_ids: Iterable[UUID],
         current_user_id: UUID,
         is_before_system: bool,
-        game_players_ids: list[UUID] = None,
         forced_quantity: int | None = None,
     ) -> None:
         stats = []
         for player_id in player_ids:
-            if game_players_ids and player_id not in game_players_ids:
-                raise StatPlayerNotInGamePlayers()
-
             stats.append(
                 GamePlayerStat(
                     team_id=team_id,
@@ -102,21 +93,11 @@ class GamePlayerStatWriteRepo(BaseRepo):
         team_id: UUID,
         game_id: UUID,
         stats_data: list[PlayerAndQuantity],
-        game_players_ids: list[UUID],
         current_user_id: UUID,
         is_before_system: bool,
     ) -> None:
         stats = []
         for stat_data in stats_data:
-            if stat_data.player_id not in game_players_ids:
-                raise StatPlayerNotInGamePlayers()
-            if (
-                stat_type == StatOptions.YELLOW_CARD
-                and stat_data.quantity > 2
-                and not is_before_system
-            ):
-                raise InvalidYellowCardsQuantity()
-
             stats.append(
                 GamePlayerStat(
                     team_id=team_id,
@@ -133,12 +114,21 @@ class GamePlayerStatWriteRepo(BaseRepo):
         self.session.flush()
 
     def hard_delete_without_commit_by_game_id(self, game_id: UUID) -> None:
-        self.session.exec(
-            delete(GamePlayerStat).where(
-                GamePlayerStat.game_id == game_id,
-                GamePlayerStat.deleted == False,
+        team_ids = (
+            self.session.execute(
+                delete(GamePlayerStat)
+                .where(
+                    GamePlayerStat.game_id == game_id,
+                    GamePlayerStat.deleted == False,
+                )
+                .returning(GamePlayerStat.team_id)
             )
+            .scalars()
+            .all()
         )
+        # Core statements don't go through the flush that bumps it
+        if team_ids:
+            TeamWriteRepo(self.session).bump_data_versions_without_commit(set(team_ids))
         self.session.flush()
 
     def soft_delete_without_commit(
@@ -161,13 +151,13 @@ class GamePlayerStatWriteRepo(BaseRepo):
             self.session.merge(stat)
         self.session.flush()
 
-    def hard_delete_all_by_team_id(self, team_id: UUID) -> None:
+    def hard_delete_all_by_team_id_without_commit(self, team_id: UUID) -> None:
         self.session.exec(
             delete(GamePlayerStat).where(
                 GamePlayerStat.team_id == team_id  # type: ignore
             )
         )
-        self.session.commit()
+        TeamWriteRepo(self.session).bump_data_versions_without_commit({team_id})
 
 
 class GamePlayerStatReadRepo(BaseRepo):
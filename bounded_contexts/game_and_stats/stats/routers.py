@@ -11,12 +11,16 @@ from bounded_contexts.game_and_stats.stats.schemas import (
 )
 from bounded_contexts.user.models import User
 from core.services.auth import validate_user_token
+from core.services.profiling import profile_request
+from core.services.etag import TeamETag
 from infra.database import get_session
 
-router = APIRouter(prefix="/stats", tags=["Stats"])
+router = APIRouter(
+    prefix="/stats", tags=["Stats"], dependencies=[Depends(profile_request)]
+)
 
 
-@router.get("/game/{game_id}", status_code=200)
+@router.get("/game/{game_id}", status_code=200, dependencies=[Depends(TeamETag())])
 async def get_games_stats(
     game_id: UUID,
     session: Session = Depends(get_session),
@@ -2,9 +2,10 @@ from uuid import UUID
 
 from sqlmodel import Session
 
-from bounded_contexts.game_and_stats.exceptions import SomePlayersNotFound, GameNotFound
+from bounded_contexts.game_and_stats.exceptions import GameNotFound
 from bounded_contexts.game_and_stats.game.repo import GameReadRepo
 from bounded_contexts.game_and_stats.game.schemas import GameStatsIn
+from bounded_contexts.game_and_stats.game.validation import GameValidationContext
 from bounded_contexts.game_and_stats.models import StatOptions, GameResult
 from bounded_contexts.game_and_stats.stats.repo import (
     GamePlayerStatReadRepo,
@@ -16,7 +17,6 @@ from bounded_contexts.game_and_stats.stats.schemas import (
     SeasonStatsSummaryResponse,
     SeasonMVP,
 )
-from bounded_contexts.player.repo import PlayerReadRepo
 from bounded_contexts.team.exceptions import TeamNotFound
 from bounded_contexts.team.repo import TeamReadRepo
 from bounded_contexts.user.models import User
@@ -24,15 +24,16 @@ from libs.base_types.interval import Interval
 
 
 def create_game_stats(
-    create_data: GameStatsIn, game_id: UUID, current_user: User, session: Session
+    create_data: GameStatsIn,
+    game_id: UUID,
+    current_user: User,
+    session: Session,
+    context: GameValidationContext,
 ) -> None:
     if not create_data.players:
         return
 
-    game_players = PlayerReadRepo(session).get_by_ids(create_data.players)
-    game_players_ids = [p.id for p in game_players]
-    if len(game_players) != len(create_data.players):
-        raise SomePlayersNotFound()
+    context.validate_stats(create_data)
 
     team_id = current_user.team_id
     current_user_id = current_user.id
@@ -46,7 +47,7 @@ def create_game_stats(
             StatOptions.PLAYED,
             team_id,
             game_id,
-            game_players_ids,
+            create_data.players,
             current_user_id,
             create_data.is_before_system,
             forced_quantity=forced_played_quantity,
@@ -57,7 +58,6 @@ def create_game_stats(
             team_id,
             game_id,
             create_data.goals_and_assists,
-            game_players_ids,
             current_user_id,
             create_data.is_before_system,
         )
@@ -70,7 +70,6 @@ def create_game_stats(
             team_id,
             game_id,
             create_data.yellow_cards,
-            game_players_ids,
             current_user_id,
             create_data.is_before_system,
         )
@@ -83,7 +82,6 @@ def create_game_stats(
             create_data.red_cards,
             current_user_id,
             create_data.is_before_system,
-            game_players_ids=game_players_ids,
         )
 
     if create_data.mvps:
@@ -94,7 +92,6 @@ def create_game_stats(
             team_id,
             game_id,
             create_data.mvps,
-            game_players_ids,
             current_user_id,
             create_data.is_before_system,
         )
@@ -149,11 +146,15 @@ def get_game_stats(game_id: UUID, session: Session) -> GameStatsResponse:
 
 
 def update_game_stats(
-    update_data: GameStatsIn, game_id: UUID, current_user: User, session: Session
+    update_data: GameStatsIn,
+    game_id: UUID,
+    current_user: User,
+    session: Session,
+    context: GameValidationContext,
 ) -> None:
     try:
         GamePlayerStatWriteRepo(session).hard_delete_without_commit_by_game_id(game_id)
-        create_game_stats(update_data, game_id, current_user, session)
+        create_game_stats(update_data, game_id, current_user, session, context)
     except Exception as e:
         session.rollback()
         raise e
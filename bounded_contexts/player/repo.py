@@ -17,7 +17,8 @@ from bounded_contexts.player.schemas import (
     PlayersStatsFilter,
     PlayerResponse,
 )
-from core.repo import BaseRepo
+from bounded_contexts.team.repo import TeamWriteRepo
+from core.repo import BaseRepo, cached_lookup
 from core.settings import FRIENDLY_CHAMPIONSHIP_NAME, BEFORE_SYSTEM_CHAMPIONSHIP_NAME
 from libs.datetime import utcnow, BRT, UTC
 
@@ -81,11 +82,11 @@ class PlayerWriteRepo(BaseRepo):
         self.session.merge(player)
         self.session.commit()
 
-    def hard_delete_all_by_team_id(self, team_id: UUID) -> None:
+    def hard_delete_all_by_team_id_without_commit(self, team_id: UUID) -> None:
         self.session.exec(
             delete(Player).where(Player.team_id == team_id)  # type: ignore
         )
-        self.session.commit()
+        TeamWriteRepo(self.session).bump_data_versions_without_commit({team_id})
 
 
 class PlayerReadRepo(BaseRepo):
@@ -101,6 +102,7 @@ class PlayerReadRepo(BaseRepo):
             ).order_by(Player.name)
         ).all()
 
+    @cached_lookup
     def get_by_id(self, player_id: UUID) -> Player | None:
         return self.session.exec(
             select(Player).where(  # type: ignore
@@ -117,6 +119,18 @@ class PlayerReadRepo(BaseRepo):
             )
         ).all()
 
+    def get_names_by_ids_and_team_id(
+        self, player_ids: list[UUID], team_id: UUID
+    ) -> dict[UUID, str]:
+        rows = self.session.exec(
+            select(Player.id, Player.name).where(  # type: ignore
+                Player.id.in_(player_ids),
+                Player.team_id == team_id,
+                Player.deleted == False,
+            )
+        ).all()
+        return {player_id: name for player_id, name in rows}
+
     def count_by_team_id(self, team_id: UUID) -> int:
         return self.session.exec(
             select(func.count()).where(  # type: ignore
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlmodel import Session
 
 from bounded_contexts.player import service
@@ -15,10 +15,15 @@ from bounded_contexts.player.schemas import (
 )
 from bounded_contexts.user.models import User
 from core.exceptions import AdminRequired
+from core.responses import fast_json_response
 from core.services.auth import validate_user_token
+from core.services.profiling import profile_request
+from core.services.etag import TeamETag
 from infra.database import get_session
 
-router = APIRouter(prefix="/players", tags=["Player"])
+router = APIRouter(
+    prefix="/players", tags=["Player"], dependencies=[Depends(profile_request)]
+)
 
 
 @router.post("/", status_code=201)
@@ -31,14 +36,16 @@ async def create_player(
     return PlayerResponse.model_validate(player)
 
 
-@router.get("/", status_code=200)
+@router.get("/", status_code=200, dependencies=[Depends(TeamETag())])
 async def get_players(
+    response: Response,
     session: Session = Depends(get_session),
     current_user: User = Depends(validate_user_token),
 ) -> list[PlayerResponse]:
-    return service.get_players_and_stats(
+    players = service.get_players_and_stats(
         current_user.team_id, session, current_user.player_id
     )
+    return fast_json_response(players, response)
 
 
 @router.get("/without-user", status_code=200)
@@ -54,7 +61,7 @@ async def get_players_without_user(
     return [PlayerWithoutUserResponse.model_validate(player) for player in players]
 
 
-@router.get("/all-name-and-shirt", status_code=200)
+@router.get("/all-name-and-shirt", status_code=200, dependencies=[Depends(TeamETag())])
 async def get_players_name_and_shirt(
     session: Session = Depends(get_session),
     current_user: User = Depends(validate_user_token),
@@ -18,6 +18,8 @@ class Team(BaseTable, table=True):
     season_end_date: date | None = Field(nullable=True, default=None)
     primary_color: str | None = Field(nullable=True, default=DEFAULT_PRIMARY_COLOR)
     code: str = Field(nullable=True, min_length=6, max_length=255, unique=True)
+    # Bumped on every flush touching the team's rows, used as ETag source
+    data_version: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
     # Only so the backwards relation works (user.team)
     users: Optional["User"] = Relationship(
@@ -1,4 +1,7 @@
 from datetime import date
+from itertools import chain
+
+from sqlalchemy import event
 
 from bounded_contexts.team.models import Team, IntentionToSubscribe
 from bounded_contexts.team.schemas import (
@@ -7,10 +10,11 @@ from bounded_contexts.team.schemas import (
     IntentionToSubscribeCreate,
 )
 from bounded_contexts.user.models import User
-from core.repo import BaseRepo
+from core.models.request_profile import RequestProfile
+from core.repo import BaseRepo, cached_lookup
 
 from uuid import UUID
-from sqlmodel import select, update
+from sqlmodel import select, update, Session
 
 from libs.datetime import utcnow
 
@@ -52,8 +56,17 @@ class TeamWriteRepo(BaseRepo):
         team.updated_by = current_user_id
         self.session.merge(team)
 
+    def bump_data_versions_without_commit(self, team_ids: set[UUID]) -> None:
+        # Core statement: runs inside flush events and skips the identity map
+        self.session.connection().execute(
+            update(Team.__table__)
+            .where(Team.__table__.c.id.in_(team_ids))
+            .values(data_version=Team.__table__.c.data_version + 1)
+        )
+
 
 class TeamReadRepo(BaseRepo):
+    @cached_lookup
     def get_by_id(self, team_id: UUID) -> Team:
         return self.session.exec(
             select(Team).where(  # type: ignore
@@ -70,9 +83,16 @@ class TeamReadRepo(BaseRepo):
             )
         ).all()
 
+    @cached_lookup
+    def get_data_version(self, team_id: UUID) -> int | None:
+        return self.session.exec(
+            select(Team.data_version).where(Team.id == team_id)  # type: ignore
+        ).first()
+
     def get_all_codes(self) -> list[str]:
         return self.session.exec(select(Team.code)).all()
 
+    @cached_lookup
     def get_by_code(self, code: str) -> Team | None:
         return self.session.exec(
             select(Team).where(  # type: ignore
@@ -82,6 +102,32 @@ class TeamReadRepo(BaseRepo):
         ).first()
 
 
+@event.listens_for(Session, "after_flush")
+def _bump_flushed_teams_data_version(session: Session, _flush_context) -> None:
+    """
+    Every write repo ends in a flush, so any row carrying a team_id (or the
+    team itself) bumps that team's data_version in the same transaction.
+
+    Core INSERT/UPDATE/DELETE statements never reach it: the repos running
+    them on team rows bump the teams themselves.
+
+    Request profiles carry the profiled team's id, but aren't team data.
+    """
+    team_ids = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        if isinstance(obj, RequestProfile):
+            continue
+        if isinstance(obj, Team):
+            team_ids.add(obj.id)
+        elif team_id := getattr(obj, "team_id", None):
+            team_ids.add(team_id)
+
+    if team_ids:
+        TeamWriteRepo(session).bump_data_versions_without_commit(team_ids)
+
+
 class IntentionToSubscribeWriteRepo(BaseRepo):
     def create(self, intention_data: IntentionToSubscribeCreate) -> None:
         intention = IntentionToSubscribe(**intention_data.model_dump())
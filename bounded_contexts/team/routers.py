@@ -13,6 +13,7 @@ from bounded_contexts.team.schemas import (
 from bounded_contexts.user.models import User
 from core.exceptions import AdminRequired, SuperAdminRequired
 from core.services.auth import validate_user_token
+from core.services.etag import TeamETag
 from infra.database import get_session
 
 router = APIRouter(prefix="/teams", tags=["Team"])
@@ -30,7 +31,7 @@ async def create_team(
     return service.create_team(team_data, session)
 
 
-@router.get("/me", status_code=200)
+@router.get("/me", status_code=200, dependencies=[Depends(TeamETag())])
 async def get_current_team(
     session: Session = Depends(get_session),
     current_user: User = Depends(validate_user_token),
@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Request
 from sqlmodel import Session
 from starlette.responses import JSONResponse
 
 from bounded_contexts.terms_of_use import service
 from bounded_contexts.terms_of_use.schemas import AcceptTermsData, TermsOfUseResponse
+from core.services.etag import NotModified, etag_matches
 from infra.database import get_session
 
 router = APIRouter(prefix="/terms_of_use", tags=["Terms of Use"])
@@ -18,7 +19,15 @@ async def accept_terms_of_use(
 
 @router.get("/active", status_code=200)
 async def get_active_terms_of_use(
+    request: Request,
+    if_none_match: str | None = Header(None),
     session: Session = Depends(get_session),
 ) -> TermsOfUseResponse:
     terms_of_use = service.get_active_terms_of_use(session)
-    return TermsOfUseResponse.model_validate(terms_of_use)
+    if etag_matches(if_none_match, terms_of_use.etag):
+        raise NotModified(etag=terms_of_use.etag, cache_control="public, no-cache")
+
+    return terms_of_use.body.response(
+        request,
+        headers={"ETag": terms_of_use.etag, "Cache-Control": "public, no-cache"},
+    )
@@ -1,16 +1,35 @@
+from dataclasses import dataclass
+from threading import Lock
+
+from cachetools import TTLCache
 from sqlmodel import Session
 from starlette.responses import JSONResponse
 
 from bounded_contexts.terms_of_use.exceptions import TermsNotFound
-from bounded_contexts.terms_of_use.models import TermsOfUse
 from bounded_contexts.terms_of_use.repo import (
     UserTermsAcceptanceWriteRepo,
     TermsOfUseReadRepo,
 )
-from bounded_contexts.terms_of_use.schemas import AcceptTermsData
+from bounded_contexts.terms_of_use.schemas import AcceptTermsData, TermsOfUseResponse
 from bounded_contexts.user.exceptions import UserNotFound
 from bounded_contexts.user.repo import UserReadRepo, UserWriteRepo
+from core.responses import PrecompressedBody
 from core.services.auth import create_refresh_token
+from core.services.etag import make_etag
+from core.settings import ACTIVE_TERMS_CACHE_TTL_SECONDS
+
+
+@dataclass(frozen=True)
+class ActiveTermsOfUse:
+    version: int
+    body: PrecompressedBody
+    etag: str
+
+
+# Explicitly invalidated on publish, the TTL covers the other instances
+_active_terms_cache: TTLCache = TTLCache(maxsize=1, ttl=ACTIVE_TERMS_CACHE_TTL_SECONDS)
+_active_terms_lock = Lock()
+_ACTIVE_TERMS_KEY = "active"
 
 
 def accept_terms_of_use(
@@ -35,15 +54,46 @@ def accept_terms_of_use(
     )
 
     # Create and set refresh token in response because is part of login flow
-    return create_refresh_token(
-        response, user.id, acceptance_data.is_demo_user, session
-    )
+    return create_refresh_token(response, user, acceptance_data.is_demo_user, session)
 
 
-def get_active_terms_of_use(session: Session) -> TermsOfUse:
-    active_terms = TermsOfUseReadRepo(session).get_active_terms_of_use()
+def get_active_terms_of_use(session: Session) -> ActiveTermsOfUse:
+    active_terms = _get_cached_active_terms(session)
 
     if not active_terms:
         raise TermsNotFound()
 
     return active_terms
+
+
+def get_active_terms_version(session: Session) -> int | None:
+    active_terms = _get_cached_active_terms(session)
+    return active_terms.version if active_terms else None
+
+
+def invalidate_active_terms_cache() -> None:
+    with _active_terms_lock:
+        _active_terms_cache.clear()
+
+
+def _get_cached_active_terms(session: Session) -> ActiveTermsOfUse | None:
+    with _active_terms_lock:
+        if _ACTIVE_TERMS_KEY in _active_terms_cache:
+            return _active_terms_cache[_ACTIVE_TERMS_KEY]
+
+    terms = TermsOfUseReadRepo(session).get_active_terms_of_use()
+
+    active_terms = None
+    if terms:
+        response = TermsOfUseResponse.model_validate(terms)
+        active_terms = ActiveTermsOfUse(
+            version=terms.version,
+            body=PrecompressedBody.from_content(
+                response.model_dump_json(), media_type="application/json"
+            ),
+            etag=make_etag(terms.id, terms.version),
+        )
+
+    with _active_terms_lock:
+        _active_terms_cache[_ACTIVE_TERMS_KEY] = active_terms
+    return active_terms
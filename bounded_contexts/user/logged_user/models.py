@@ -14,8 +14,9 @@ class LoggedUser(SQLModel, table=True):
         primary_key=True,
     )
     user_id: UUID = Field(foreign_key="user.id", ondelete="CASCADE")
-    refresh_token: str = Field(unique=True)
-    expires_at: datetime
+    # sha256 hex digest of the refresh token, the raw token is never stored
+    token_hash: str = Field(min_length=64, max_length=64, unique=True, index=True)
+    expires_at: datetime = Field(index=True)
     created_at: datetime = Field(default_factory=utcnow)
 
     user: "User" = Relationship(back_populates="logged_user")
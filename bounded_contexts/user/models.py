@@ -17,6 +17,8 @@ class User(BaseTable, table=True):
     is_super_admin: bool = Field(default=False)
     is_initial_user: bool = Field(default=False)
     terms_accepted_version: int | None = Field(default=None)
+    # Bumped to revoke the user's stateless refresh tokens
+    session_generation: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
 
     player: Optional["Player"] = Relationship(back_populates="user")
     logged_user: Optional["LoggedUser"] = Relationship(
@@ -1,16 +1,18 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 
+from bounded_contexts.team.models import Team
+from bounded_contexts.team.repo import TeamWriteRepo
 from bounded_contexts.user.models import User
 from bounded_contexts.user.logged_user.models import LoggedUser
 from bounded_contexts.user.schemas import UserCreate, UserUpdate
-from core.repo import BaseRepo
+from core.repo import BaseRepo, cached_lookup
 
 from uuid import UUID
 from sqlmodel import select
-from sqlalchemy import func, delete
+from sqlalchemy import func, delete, update
 
 from core.services.password import hash_password
-from core.settings import REFRESH_TOKEN_EXPIRE_DAYS
+from core.settings import REFRESH_TOKEN_EXPIRE_DAYS, DEMO_REFRESH_TOKEN_EXPIRE_HOURS
 from libs.datetime import utcnow
 
 
@@ -36,16 +38,16 @@ class UserWriteRepo(BaseRepo):
         return user
 
     def create_logged_user(
-        self, user_id: UUID, refresh_token: str, is_demo_user: bool
+        self, user_id: UUID, token_hash: str, is_demo_user: bool
     ) -> None:
         if not is_demo_user:
             expire_delta = timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
         else:
-            expire_delta = timedelta(hours=2)
+            expire_delta = timedelta(hours=DEMO_REFRESH_TOKEN_EXPIRE_HOURS)
 
         logged = LoggedUser(
             user_id=user_id,
-            refresh_token=refresh_token,
+            token_hash=token_hash,
             expires_at=utcnow() + expire_delta,
         )
         self.session.add(logged)
@@ -92,19 +94,26 @@ class UserWriteRepo(BaseRepo):
         self.session.delete(logged)
         self.session.commit()
 
-    def clear_expired_logged_users(self) -> int:
-        # Clear logged users that have expired with more than 1 day
-        expired_logged_users = self.session.exec(
-            select(LoggedUser).where(  # type: ignore
-                LoggedUser.expires_at < (utcnow() - timedelta(days=1))
-            )
-        ).all()
-
-        for logged in expired_logged_users:
-            self.session.delete(logged)
+    def revoke_sessions(self, user_id: UUID) -> None:
+        self.session.exec(
+            delete(LoggedUser).where(LoggedUser.user_id == user_id)  # type: ignore
+        )
+        # No team bump: session_generation isn't part of any team response
+        self.session.exec(
+            update(User)  # type: ignore
+            .where(User.id == user_id)
+            .values(session_generation=User.session_generation + 1)
+        )
         self.session.commit()
 
-        return len(expired_logged_users)
+    def delete_expired_logged_users(self, expired_before: datetime) -> int:
+        result = self.session.exec(
+            delete(LoggedUser).where(  # type: ignore
+                LoggedUser.expires_at < expired_before
+            )
+        )
+        self.session.commit()
+        return result.rowcount
 
     def remove_player_without_commit(self, user: User, current_user_id: UUID) -> None:
         user.player_id = None
@@ -113,18 +122,29 @@ class UserWriteRepo(BaseRepo):
         self.session.merge(user)
         self.session.flush()
 
-    def hard_delete_logged_users_by_user_ids(self, user_ids: list[UUID]) -> None:
+    def hard_delete_logged_users_by_user_ids_without_commit(
+        self, user_ids: list[UUID]
+    ) -> None:
         self.session.exec(
-            delete(LoggedUser).where(LoggedUser.id.in_(user_ids))  # type: ignore
+            delete(LoggedUser).where(LoggedUser.user_id.in_(user_ids))  # type: ignore
         )
-        self.session.commit()
 
-    def hard_delete_by_user_ids(self, user_ids: list[UUID]) -> None:
-        self.session.exec(delete(User).where(User.id.in_(user_ids)))  # type: ignore
-        self.session.commit()
+    def hard_delete_by_user_ids_without_commit(self, user_ids: list[UUID]) -> None:
+        team_ids = (
+            self.session.execute(
+                delete(User)
+                .where(User.id.in_(user_ids))  # type: ignore
+                .returning(User.team_id)
+            )
+            .scalars()
+            .all()
+        )
+        if team_ids:
+            TeamWriteRepo(self.session).bump_data_versions_without_commit(set(team_ids))
 
 
 class UserReadRepo(BaseRepo):
+    @cached_lookup
     def get_by_id(self, user_id: UUID | str) -> User:
         if isinstance(user_id, str):
             user_id = UUID(user_id)
@@ -136,10 +156,28 @@ class UserReadRepo(BaseRepo):
             )
         ).first()
 
-    def get_logged_user_by_token(self, refresh_token: str) -> LoggedUser:
+    def get_session_generation(self, user_id: UUID) -> int | None:
         return self.session.exec(
-            select(LoggedUser).where(  # type: ignore
-                LoggedUser.refresh_token == refresh_token
+            select(User.session_generation)  # type: ignore
+            .join(Team, Team.id == User.team_id)
+            .where(
+                User.id == user_id,
+                User.deleted == False,
+                Team.deleted == False,
+            )
+        ).first()
+
+    def get_logged_user_and_user_by_token_hash(
+        self, token_hash: str
+    ) -> tuple[LoggedUser, User] | None:
+        return self.session.exec(
+            select(LoggedUser, User)  # type: ignore
+            .join(User, User.id == LoggedUser.user_id)
+            .join(Team, Team.id == User.team_id)
+            .where(
+                LoggedUser.token_hash == token_hash,
+                User.deleted == False,
+                Team.deleted == False,
             )
         ).first()
 
@@ -155,6 +193,7 @@ class UserReadRepo(BaseRepo):
             )
         ).all()
 
+    @cached_lookup
     def get_by_email(self, email: str) -> User:
         return self.session.exec(
             select(User).where(  # type: ignore
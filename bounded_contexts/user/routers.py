@@ -15,7 +15,7 @@ from bounded_contexts.user.schemas import (
     FirstAccessStart,
     FirstAccessConfirmation,
 )
-from core.exceptions import AdminRequired, SuperAdminRequired
+from core.exceptions import AdminRequired
 from core.services.auth import validate_user_token
 from infra.database import get_session
 
@@ -183,14 +183,3 @@ async def delete_user(
     current_user: User = Depends(validate_user_token),
 ) -> None:
     return service.delete_user(user_id, current_user, session)
-
-
-@router.delete("/clear/logged-users", status_code=200)
-async def clear_expired_logged_users(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(validate_user_token),
-) -> int:
-    if not current_user.is_super_admin:
-        raise SuperAdminRequired()
-
-    return service.clear_expired_logged_users(session)
@@ -14,7 +14,7 @@ from bounded_contexts.team.exceptions import (
     TeamNotFoundByCode,
 )
 from bounded_contexts.team.repo import TeamReadRepo
-from bounded_contexts.terms_of_use.repo import TermsOfUseReadRepo
+from bounded_contexts.terms_of_use.service import get_active_terms_version
 from bounded_contexts.user.exceptions import (
     UserNotFound,
     EmailAlreadyInUse,
@@ -45,6 +45,12 @@ from core.services.auth import (
     general_validade_token,
     InvalidToken,
     create_refresh_token,
+    hash_refresh_token,
+    is_stateless_refresh_token,
+    read_stateless_refresh_token,
+    get_session_generation,
+    revoke_user_sessions,
+    forget_session_generation,
 )
 from core.services.email import send_email
 from core.services.password import verify_password, hash_password
@@ -79,7 +85,7 @@ def login(username: str, password: str, session: Session) -> JSONResponse:
         raise TeamSubscriptionExpired(is_admin=user.has_admin_privileges)
 
     terms_version_to_accept = None
-    active_terms_version = TermsOfUseReadRepo(session).get_active_version()
+    active_terms_version = get_active_terms_version(session)
     if not user.terms_accepted_version or (
         active_terms_version and user.terms_accepted_version < active_terms_version
     ):
@@ -104,7 +110,7 @@ def login(username: str, password: str, session: Session) -> JSONResponse:
         return response
 
     # Only create refresh token if user has already accepted terms
-    return create_refresh_token(response, user.id, is_demo_user, session)
+    return create_refresh_token(response, user, is_demo_user, session)
 
 
 def logout(refresh_token: str, session: Session) -> JSONResponse:
@@ -113,7 +119,10 @@ def logout(refresh_token: str, session: Session) -> JSONResponse:
             content={"detail": "refresh_token nao enviado"}, status_code=400
         )
 
-    delete_logged_user(refresh_token, session)
+    if is_stateless_refresh_token(refresh_token):
+        end_stateless_session(refresh_token, session)
+    else:
+        delete_logged_user(refresh_token, session)
     response = JSONResponse(
         content={"detail": "Logout realizado com sucesso"}, status_code=200
     )
@@ -131,10 +140,13 @@ def refresh_access_token(refresh_token: str, session: Session) -> JSONResponse:
     if not refresh_token:
         return JSONResponse(content={"error": "refresh_token inválido ou expirado"})
 
-    logged_user = get_logged_user_by_token(refresh_token, session)
+    if is_stateless_refresh_token(refresh_token):
+        return _refresh_stateless_access_token(refresh_token, session)
+
+    logged_user_and_user = get_logged_user_and_user_by_token(refresh_token, session)
 
     response = JSONResponse(content={"error": "refresh_token inválido ou expirado"})
-    if not logged_user:
+    if not logged_user_and_user:
         response.delete_cookie(
             key="refresh_token",
             httponly=True,
@@ -144,6 +156,8 @@ def refresh_access_token(refresh_token: str, session: Session) -> JSONResponse:
         )
         return response
 
+    logged_user, user = logged_user_and_user
+
     if not logged_user.expires_at.tzinfo:
         # SQLite test db does not support timezone-aware datetimes
         logged_user.expires_at = logged_user.expires_at.replace(tzinfo=utcnow().tzinfo)
@@ -164,8 +178,6 @@ def refresh_access_token(refresh_token: str, session: Session) -> JSONResponse:
         )
         return response
 
-    user = logged_user.user
-
     access_token = create_jwt_token(
         data={
             "sub": str(user.id),
@@ -176,6 +188,34 @@ def refresh_access_token(refresh_token: str, session: Session) -> JSONResponse:
     return JSONResponse(content={"access_token": access_token})
 
 
+def _refresh_stateless_access_token(
+    refresh_token: str, session: Session
+) -> JSONResponse:
+    """Signature check plus a cached session generation, no logged_user row."""
+    payload = read_stateless_refresh_token(refresh_token)
+    if not payload or payload["gen"] != get_session_generation(
+        UUID(payload["sub"]), session
+    ):
+        response = JSONResponse(content={"error": "refresh_token inválido ou expirado"})
+        response.delete_cookie(
+            key="refresh_token",
+            httponly=True,
+            secure=REFRESH_TOKEN_SECURE_BOOL,
+            samesite="none",
+            domain=".forquilha.app.br",
+        )
+        return response
+
+    access_token = create_jwt_token(
+        data={
+            "sub": payload["sub"],
+            "team_id": payload["team_id"],
+        }
+    )
+
+    return JSONResponse(content={"access_token": access_token})
+
+
 def authenticate_user(email: str, password: str, session: Session) -> User:
     user = UserReadRepo(session=session).get_by_email(email)
     if not user or not verify_password(password, user.hashed_password):
@@ -186,21 +226,20 @@ def authenticate_user(email: str, password: str, session: Session) -> User:
 
 def create_logged_user(user_id: UUID, is_demo_user: bool, session: Session) -> str:
     refresh_token = secrets.token_urlsafe(32)
-    UserWriteRepo(session).create_logged_user(user_id, refresh_token, is_demo_user)
+    UserWriteRepo(session).create_logged_user(
+        user_id, hash_refresh_token(refresh_token), is_demo_user
+    )
     return refresh_token
 
 
 def delete_logged_user(refresh_token: str, session: Session) -> None:
-    logged = UserReadRepo(session).get_logged_user_by_token(refresh_token)
-    if not logged:
+    logged_user_and_user = get_logged_user_and_user_by_token(refresh_token, session)
+    if not logged_user_and_user:
         return
 
     # Demo child user is deleted on logout
-    user = logged.user
-    created_by = (
-        UserReadRepo(session).get_by_id(user.created_by) if user.created_by else None
-    )
-    if created_by and created_by.email == DEMO_USER_EMAIL:
+    logged, user = logged_user_and_user
+    if _is_demo_child_user(user, session):
         # Logged demo user will be deleted on cascade
         UserWriteRepo(session=session).delete(user)
         return
@@ -208,8 +247,41 @@ def delete_logged_user(refresh_token: str, session: Session) -> None:
     UserWriteRepo(session).delete_logged_user(logged)
 
 
-def get_logged_user_by_token(refresh_token: str, session: Session) -> LoggedUser | None:
-    return UserReadRepo(session).get_logged_user_by_token(refresh_token)
+def end_stateless_session(refresh_token: str, session: Session) -> None:
+    """
+    A signed token can't be deleted: the user's session generation is bumped,
+    which ends the user's sessions on every device.
+    """
+    payload = read_stateless_refresh_token(refresh_token, ignore_exp=True)
+    if not payload:
+        return
+
+    user = UserReadRepo(session).get_by_id(payload["sub"])
+    if not user or payload["gen"] != user.session_generation:
+        return
+
+    if _is_demo_child_user(user, session):
+        user_id = user.id
+        UserWriteRepo(session=session).delete(user)
+        forget_session_generation(user_id)
+        return
+
+    revoke_user_sessions(user.id, session)
+
+
+def _is_demo_child_user(user: User, session: Session) -> bool:
+    created_by = (
+        UserReadRepo(session).get_by_id(user.created_by) if user.created_by else None
+    )
+    return bool(created_by and created_by.email == DEMO_USER_EMAIL)
+
+
+def get_logged_user_and_user_by_token(
+    refresh_token: str, session: Session
+) -> tuple[LoggedUser, User] | None:
+    return UserReadRepo(session).get_logged_user_and_user_by_token_hash(
+        hash_refresh_token(refresh_token)
+    )
 
 
 def send_reset_password_email(email: str, session: Session) -> str:
@@ -247,6 +319,7 @@ def reset_password(reset_data: ResetPasswordRequest, session: Session) -> None:
 
     user.hashed_password = hash_password(reset_data.new_password)
     UserWriteRepo(session).save(user, user.id)
+    revoke_user_sessions(user.id, session)
 
     if "test" in ENV_CONFIG:
         return
@@ -527,4 +600,7 @@ def _validate_delete_request(current_user: User, user_to_delete: User) -> None:
 
 
 def clear_expired_logged_users(session: Session) -> int:
-    return UserWriteRepo(session=session).clear_expired_logged_users()
+    # Kept for a day after expiring, so a refresh gets the expired response
+    return UserWriteRepo(session=session).delete_expired_logged_users(
+        expired_before=utcnow() - timedelta(days=1)
+    )
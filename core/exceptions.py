@@ -14,7 +14,31 @@ class SuperAdminRequired(HTTPException):
     detail = "You not that important."
 
 
+@dataclass
+class ProfileNotFound(HTTPException):
+    status_code = 404
+    detail = "Profile not found"
+
+
+@dataclass
+class InvalidCronSecret(HTTPException):
+    status_code = 401
+    detail = "Invalid cron secret"
+
+
 @dataclass
 class StartDateBiggerThanEnd(HTTPException):
     status_code = 400
     detail = "Data de início maior que data de término"
+
+
+@dataclass
+class DemoUserNotFound(HTTPException):
+    status_code = 404
+    detail = "Demo user not found"
+
+
+@dataclass
+class InvalidTeamSnapshot(HTTPException):
+    status_code = 400
+    detail = "Arquivo de snapshot inválido."
@@ -0,0 +1,29 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, Text
+from sqlmodel import Field, SQLModel
+
+from libs.datetime import utcnow
+
+
+class RequestProfile(SQLModel, table=True):
+    """A request's sampling profile (infra/profiler.py), kept until expires_at."""
+
+    __tablename__ = "request_profile"
+
+    id: str = Field(
+        default_factory=lambda: uuid4().hex, primary_key=True, max_length=32
+    )
+    route: str
+    team_id: UUID
+    # "header" (asked by a super admin) or "sampled"
+    trigger: str = Field(max_length=10)
+    started_at: datetime = Field(
+        default_factory=utcnow, sa_type=DateTime(timezone=True)
+    )
+    duration_ms: float = 0
+    samples: int = 0
+    # Collapsed stacks, one "stack count" line each
+    collapsed: str = Field(default="", sa_type=Text)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
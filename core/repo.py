@@ -1,6 +1,60 @@
+from functools import wraps
+from typing import Callable, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState
 from sqlmodel import Session
 
+_REPO_CACHE_KEY = "repo_cache"
+
+_Lookup = TypeVar("_Lookup", bound=Callable)
+
 
 class BaseRepo:
     def __init__(self, session: Session):
         self.session = session
+
+
+def cached_lookup(method: _Lookup) -> _Lookup:
+    """
+    Memoizes a read repo lookup (get_by_id, get_by_code...) for the session's
+    lifetime - a request, since get_session is resolved once per request - so
+    the repos built by nested services share it. Any write clears it.
+
+    Caches the same instances the identity map would return, None included.
+    """
+
+    @wraps(method)
+    def wrapper(self: BaseRepo, *args, **kwargs):
+        # UUID and str ids (e.g. straight from the token) share an entry
+        key = (
+            type(self).__name__,
+            method.__name__,
+            *(str(arg) if isinstance(arg, UUID) else arg for arg in args),
+            *sorted(kwargs.items()),
+        )
+        cache = self.session.info.setdefault(_REPO_CACHE_KEY, {})
+        if key not in cache:
+            cache[key] = method(self, *args, **kwargs)
+        return cache[key]
+
+    return wrapper  # type: ignore
+
+
+def clear_repo_cache(session: Session) -> None:
+    session.info.pop(_REPO_CACHE_KEY, None)
+
+
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_repo_cache_on_write(session: Session, *_args) -> None:
+    clear_repo_cache(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _clear_repo_cache_on_statement(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk INSERT/UPDATE/DELETE statements don't go through a flush
+    if not orm_execute_state.is_select:
+        clear_repo_cache(orm_execute_state.session)
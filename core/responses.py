@@ -0,0 +1,72 @@
+import gzip
+from dataclasses import dataclass
+from typing import Any, Self
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    Serializes pydantic models (or lists/dicts of them) straight through
+    pydantic-core, in a single pass.
+
+    When a route returns a response instance FastAPI skips the response_model
+    step, which would validate the already built models again and then dump
+    them to python objects before encoding. The route's return annotation is
+    still used for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def fast_json_response(
+    content: Any, response: Response | None = None, status_code: int = 200
+) -> PydanticJSONResponse:
+    """
+    :param response: The route's injected Response, whose headers (e.g. the
+        ones set by TeamETag) FastAPI would otherwise drop, since it only
+        merges them into responses it builds itself.
+    """
+    headers = dict(response.headers) if response is not None else None
+    if headers:
+        headers.pop("content-length", None)
+    return PydanticJSONResponse(content, status_code=status_code, headers=headers)
+
+
+@dataclass(frozen=True)
+class PrecompressedBody:
+    """
+    Body compressed once (e.g. at import or when cached) instead of on every
+    request by the compression middleware.
+    """
+
+    content: bytes
+    gzipped: bytes
+    media_type: str
+
+    @classmethod
+    def from_content(cls, content: str | bytes, media_type: str) -> Self:
+        if isinstance(content, str):
+            content = content.encode()
+        return cls(
+            content=content,
+            gzipped=gzip.compress(content, compresslevel=9, mtime=0),
+            media_type=media_type,
+        )
+
+    def response(
+        self, request: Request, headers: dict[str, str] | None = None
+    ) -> Response:
+        headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+        if not accepts_gzip(request):
+            return Response(self.content, media_type=self.media_type, headers=headers)
+
+        headers["Content-Encoding"] = "gzip"
+        return Response(self.gzipped, media_type=self.media_type, headers=headers)
+
+
+def accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "")
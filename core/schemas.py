@@ -1,3 +1,6 @@
+from datetime import datetime
+from uuid import UUID
+
 from pydantic import BaseModel
 
 
@@ -12,3 +15,13 @@ class StatsSchema(BaseModel):
     yellow_cards: int = 0
     red_cards: int = 0
     mvps: int = 0
+
+
+class ProfileSummary(BaseSchema):
+    id: str
+    route: str
+    team_id: UUID
+    trigger: str
+    started_at: datetime
+    duration_ms: float
+    samples: int
@@ -31,6 +31,7 @@ from bounded_contexts.team.schemas import (
 )
 from bounded_contexts.team.service import team_code_generator
 from bounded_contexts.terms_of_use.repo import TermsOfUseReadRepo, TermsOfUseWriteRepo
+from bounded_contexts.terms_of_use.service import invalidate_active_terms_cache
 from bounded_contexts.user.models import User
 from bounded_contexts.user.repo import UserReadRepo
 from bounded_contexts.user.schemas import UserCreate, UserResponse
@@ -215,3 +216,5 @@ def publish_terms_of_use(
             status_code=500,
             detail=f"An error occurred while publishing Terms of Use: {str(e)}",
         )
+
+    invalidate_active_terms_cache()
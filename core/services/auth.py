@@ -1,7 +1,10 @@
+import hashlib
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
+from threading import Lock
 from uuid import UUID
 
+from cachetools import TTLCache
 from jose import jwt, JWTError
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -9,19 +12,34 @@ from sqlmodel import Session
 from starlette.responses import JSONResponse
 
 from bounded_contexts.user.models import User
-from bounded_contexts.user.repo import UserReadRepo
+from bounded_contexts.user.repo import UserReadRepo, UserWriteRepo
 from core.settings import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     JWT_ALGORITHM,
     JWT_KEY,
     REFRESH_TOKEN_SECURE_BOOL,
     REFRESH_TOKEN_EXPIRE_DAYS,
+    DEMO_REFRESH_TOKEN_EXPIRE_HOURS,
     ENV_CONFIG,
+    STATELESS_REFRESH_TOKENS,
+    SESSION_GENERATION_CACHE_TTL_SECONDS,
+    SESSION_GENERATION_CACHE_MAXSIZE,
 )
 from infra.database import get_session
+from infra.tracing import set_trace_attribute
 
 security = HTTPBearer()
 
+REFRESH_TOKEN_TYPE = "refresh"
+
+# user_id -> session_generation (None for deleted users or teams). Invalidated here on
+# revoke, the TTL covers the other instances
+_session_generations: TTLCache = TTLCache(
+    maxsize=SESSION_GENERATION_CACHE_MAXSIZE, ttl=SESSION_GENERATION_CACHE_TTL_SECONDS
+)
+_session_generations_lock = Lock()
+_NOT_CACHED = object()
+
 
 @dataclass
 class _InvalidAccessToken(HTTPException):
@@ -54,7 +72,7 @@ def validate_user_token(
         payload = jwt.decode(token, JWT_KEY, algorithms=[JWT_ALGORITHM])
         user_id: str = payload.get("sub")
         team_id: str = payload.get("team_id")
-        if not user_id or not team_id:
+        if not user_id or not team_id or payload.get("type") == REFRESH_TOKEN_TYPE:
             raise _InvalidAccessToken()
     except JWTError:
         raise _InvalidAccessToken()
@@ -63,6 +81,7 @@ def validate_user_token(
     if not user or str(user.team_id) != team_id:
         raise _InvalidAccessToken()
 
+    set_trace_attribute("team_id", team_id)
     return user
 
 
@@ -74,6 +93,8 @@ def general_validade_token(
         payload = jwt.decode(
             token, JWT_KEY, algorithms=[JWT_ALGORITHM], options=options
         )
+        if payload.get("type") == REFRESH_TOKEN_TYPE:
+            raise JWTError("Refresh tokens are only valid for a refresh")
         return payload["sub"]
     except Exception:
         if raise_custom_error:
@@ -81,12 +102,20 @@ def general_validade_token(
         raise
 
 
+def hash_refresh_token(refresh_token: str) -> str:
+    # The token is random (not a password), a fast digest is enough
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
 def create_refresh_token(
-    response: JSONResponse, user_id: UUID, is_demo_user: bool, session: Session
+    response: JSONResponse, user: User, is_demo_user: bool, session: Session
 ) -> JSONResponse:
-    from bounded_contexts.user.service import create_logged_user
+    if STATELESS_REFRESH_TOKENS:
+        refresh_token = create_stateless_refresh_token(user, is_demo_user)
+    else:
+        from bounded_contexts.user.service import create_logged_user
 
-    refresh_token = create_logged_user(user_id, is_demo_user, session)
+        refresh_token = create_logged_user(user.id, is_demo_user, session)
 
     if ENV_CONFIG == "production":
         response.set_cookie(
@@ -109,3 +138,70 @@ def create_refresh_token(
         )
 
     return response
+
+
+def create_stateless_refresh_token(user: User, is_demo_user: bool) -> str:
+    """
+    Signed refresh token: valid while the user's session_generation is the
+    one it carries (see revoke_user_sessions), no logged_user row is created.
+    """
+    expires_delta = (
+        timedelta(hours=DEMO_REFRESH_TOKEN_EXPIRE_HOURS)
+        if is_demo_user
+        else timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    )
+    return create_jwt_token(
+        data={
+            "sub": str(user.id),
+            "team_id": str(user.team_id),
+            "gen": user.session_generation,
+            "type": REFRESH_TOKEN_TYPE,
+        },
+        expires_delta=expires_delta,
+    )
+
+
+def is_stateless_refresh_token(refresh_token: str) -> bool:
+    # The stored ones are url-safe random strings, without dots
+    return refresh_token.count(".") == 2
+
+
+def read_stateless_refresh_token(
+    refresh_token: str, ignore_exp: bool = False
+) -> dict | None:
+    options = {"verify_exp": False} if ignore_exp else {}
+    try:
+        payload = jwt.decode(
+            refresh_token, JWT_KEY, algorithms=[JWT_ALGORITHM], options=options
+        )
+    except JWTError:
+        return None
+
+    if payload.get("type") != REFRESH_TOKEN_TYPE or not isinstance(
+        payload.get("gen"), int
+    ):
+        return None
+    return payload
+
+
+def get_session_generation(user_id: UUID, session: Session) -> int | None:
+    with _session_generations_lock:
+        generation = _session_generations.get(user_id, _NOT_CACHED)
+    if generation is not _NOT_CACHED:
+        return generation
+
+    generation = UserReadRepo(session).get_session_generation(user_id)
+    with _session_generations_lock:
+        _session_generations[user_id] = generation
+    return generation
+
+
+def revoke_user_sessions(user_id: UUID, session: Session) -> None:
+    """Ends every session of the user, stored or stateless."""
+    UserWriteRepo(session).revoke_sessions(user_id)
+    forget_session_generation(user_id)
+
+
+def forget_session_generation(user_id: UUID) -> None:
+    with _session_generations_lock:
+        _session_generations.pop(user_id, None)
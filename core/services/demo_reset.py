@@ -0,0 +1,248 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from time import perf_counter
+from uuid import UUID, uuid4
+
+from loguru import logger
+from sqlmodel import Session
+
+from bounded_contexts.championship.models import Championship
+from bounded_contexts.championship.repo import ChampionshipWriteRepo
+from bounded_contexts.game_and_stats.availability.repo import AvailabilityWriteRepo
+from bounded_contexts.game_and_stats.game.repo import GameWriteRepo
+from bounded_contexts.game_and_stats.models import Game, GamePlayerStat, StatOptions
+from bounded_contexts.game_and_stats.stats.repo import GamePlayerStatWriteRepo
+from bounded_contexts.player.models import Player, PlayerPositions
+from bounded_contexts.player.repo import PlayerWriteRepo
+from bounded_contexts.team.models import Team
+from bounded_contexts.user.repo import UserReadRepo, UserWriteRepo
+from core.consts import DEMO_USER_EMAIL, DEFAULT_PRIMARY_COLOR
+from core.exceptions import DemoUserNotFound
+from core.settings import FRIENDLY_CHAMPIONSHIP_NAME, BEFORE_SYSTEM_CHAMPIONSHIP_NAME
+from libs.datetime import brasilia_now, utcnow
+
+
+@dataclass(frozen=True)
+class SeedPlayer:
+    name: str
+    shirt_number: int
+    position: PlayerPositions
+
+
+@dataclass(frozen=True)
+class SeedGame:
+    """Friendly game, players referenced by name."""
+
+    adversary: str
+    hours_ago: int
+    team_score: int
+    adversary_score: int
+    players: tuple[str, ...]
+    # (goal, assist) - None goal for own goals, None assist for solo goals
+    goals_and_assists: tuple[tuple[str | None, str | None], ...] = ()
+    yellow_cards: tuple[tuple[str, int], ...] = ()
+    red_cards: tuple[str, ...] = ()
+    mvps: tuple[tuple[str, int], ...] = ()
+
+
+@dataclass(frozen=True)
+class DemoSeed:
+    foundation_date: date
+    players: tuple[SeedPlayer, ...]
+    games: tuple[SeedGame, ...] = ()
+
+
+DEMO_SEED = DemoSeed(
+    foundation_date=date(2018, 11, 15),
+    players=(
+        SeedPlayer("Cláudio", shirt_number=7, position=PlayerPositions.PONTA),
+        SeedPlayer("Danilo", shirt_number=8, position=PlayerPositions.MEIO_CAMPO),
+    ),
+    games=(
+        SeedGame(
+            adversary="Outro Time FC",
+            hours_ago=12,
+            team_score=2,
+            adversary_score=1,
+            players=("Cláudio", "Danilo"),
+            goals_and_assists=(("Cláudio", "Danilo"), ("Danilo", None)),
+            yellow_cards=(("Cláudio", 1),),
+            mvps=(("Cláudio", 2), ("Danilo", 3)),
+        ),
+    ),
+)
+
+
+def reset_demo_team(session: Session, seed: DemoSeed = DEMO_SEED) -> dict:
+    """
+    Deletes all the demo team's data (except its super user and the demo user)
+    and re-creates it from the seed, in a single transaction - a failure
+    leaves the team untouched.
+
+    Players images are not removed here, the caller does it after the commit.
+
+    :return: Team id, rows created and the duration of each phase.
+    """
+    start = perf_counter()
+
+    user_read_repo = UserReadRepo(session)
+    demo_user = user_read_repo.get_by_email(DEMO_USER_EMAIL)
+    if not demo_user:
+        raise DemoUserNotFound()
+
+    team_id = demo_user.team_id
+    super_user = user_read_repo.get_team_super_user(team_id)
+
+    _delete_team_data_without_commit(team_id, {demo_user.id, super_user.id}, session)
+    deleted_at = perf_counter()
+
+    rows = _seed_without_commit(team_id, super_user.id, seed, session)
+    seeded_at = perf_counter()
+
+    session.commit()
+    committed_at = perf_counter()
+
+    report = {
+        "team_id": str(team_id),
+        "rows": rows,
+        "delete_ms": _ms(start, deleted_at),
+        "seed_ms": _ms(deleted_at, seeded_at),
+        "commit_ms": _ms(seeded_at, committed_at),
+        "total_ms": _ms(start, committed_at),
+    }
+    logger.info(f"Demo team reset: {report}")
+    return report
+
+
+def _delete_team_data_without_commit(
+    team_id: UUID, keep_user_ids: set[UUID], session: Session
+) -> None:
+    AvailabilityWriteRepo(session).hard_delete_all_by_team_id_without_commit(team_id)
+    GamePlayerStatWriteRepo(session).hard_delete_all_by_team_id_without_commit(team_id)
+    GameWriteRepo(session).hard_delete_all_by_team_id_without_commit(team_id)
+    ChampionshipWriteRepo(session).hard_delete_all_by_team_id_without_commit(team_id)
+    PlayerWriteRepo(session).hard_delete_all_by_team_id_without_commit(team_id)
+
+    user_ids = set(UserReadRepo(session).get_ids_by_team_id(team_id)) - keep_user_ids
+    if user_ids:
+        user_write_repo = UserWriteRepo(session)
+        user_write_repo.hard_delete_logged_users_by_user_ids_without_commit(
+            list(user_ids)
+        )
+        user_write_repo.hard_delete_by_user_ids_without_commit(list(user_ids))
+
+
+def _seed_without_commit(
+    team_id: UUID, super_user_id: UUID, seed: DemoSeed, session: Session
+) -> dict[str, int]:
+    now = brasilia_now()
+
+    friendly = Championship(
+        team_id=team_id,
+        name=FRIENDLY_CHAMPIONSHIP_NAME,
+        start_date=date(1800, 1, 1),
+        is_league_format=True,
+        created_by=super_user_id,
+    )
+    before_system = Championship(
+        team_id=team_id,
+        name=BEFORE_SYSTEM_CHAMPIONSHIP_NAME,
+        start_date=date(1800, 1, 1),
+        end_date=(now - timedelta(days=1)).date(),
+        is_league_format=True,
+        created_by=super_user_id,
+    )
+
+    players = {
+        seed_player.name: Player(
+            team_id=team_id,
+            name=seed_player.name,
+            shirt_number=seed_player.shirt_number,
+            position=seed_player.position,
+            created_by=super_user_id,
+        )
+        for seed_player in seed.players
+    }
+    player_ids = {name: player.id for name, player in players.items()}
+
+    games, stats = [], []
+    for seed_game in seed.games:
+        game = Game(
+            team_id=team_id,
+            championship_id=friendly.id,
+            adversary=seed_game.adversary,
+            date_hour=now - timedelta(hours=seed_game.hours_ago),
+            team_score=seed_game.team_score,
+            adversary_score=seed_game.adversary_score,
+            created_by=super_user_id,
+        )
+        games.append(game)
+        stats += _seed_game_stats(
+            seed_game, game.id, team_id, player_ids, super_user_id
+        )
+
+    team = session.get(Team, team_id)
+    team.foundation_date = seed.foundation_date
+    team.season_start_date = date(now.year, 1, 1)
+    team.season_end_date = None
+    team.primary_color = DEFAULT_PRIMARY_COLOR
+    team.updated_at = utcnow()
+    team.updated_by = super_user_id
+
+    # One flush: the unit of work batches each table in a multi-row INSERT
+    session.add_all([friendly, before_system, *players.values(), *games, *stats])
+    session.flush()
+
+    return {
+        "championships": 2,
+        "players": len(players),
+        "games": len(games),
+        "stats": len(stats),
+    }
+
+
+def _seed_game_stats(
+    seed_game: SeedGame,
+    game_id: UUID,
+    team_id: UUID,
+    player_ids: dict[str, UUID],
+    created_by: UUID,
+) -> list[GamePlayerStat]:
+    def _stat(
+        stat: StatOptions,
+        player: str | None,
+        quantity: int = 1,
+        related_stat_id: UUID | None = None,
+    ) -> GamePlayerStat:
+        return GamePlayerStat(
+            id=uuid4(),
+            team_id=team_id,
+            game_id=game_id,
+            player_id=player_ids[player] if player else None,
+            related_stat_id=related_stat_id,
+            stat=stat,
+            quantity=quantity,
+            created_by=created_by,
+        )
+
+    stats = [_stat(StatOptions.PLAYED, player) for player in seed_game.players]
+    for goal_player, assist_player in seed_game.goals_and_assists:
+        goal = _stat(StatOptions.GOAL, goal_player)
+        stats.append(goal)
+        if assist_player:
+            stats.append(
+                _stat(StatOptions.ASSIST, assist_player, related_stat_id=goal.id)
+            )
+    stats += [
+        _stat(StatOptions.YELLOW_CARD, player, quantity)
+        for player, quantity in seed_game.yellow_cards
+    ]
+    stats += [_stat(StatOptions.RED_CARD, player) for player in seed_game.red_cards]
+    stats += [
+        _stat(StatOptions.MVP, player, quantity) for player, quantity in seed_game.mvps
+    ]
+    return stats
+
+
+def _ms(start: float, end: float) -> float:
+    return round((end - start) * 1000, 2)
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from hashlib import sha256
+
+from fastapi import HTTPException, Depends, Request, Response
+from sqlmodel import Session
+
+from bounded_contexts.team.repo import TeamReadRepo
+from bounded_contexts.user.models import User
+from core.services.auth import validate_user_token
+from infra.database import get_session
+from libs.datetime import brasilia_now
+
+
+@dataclass
+class NotModified(HTTPException):
+    """Answered by starlette as an empty 304 response, keeping the headers."""
+
+    etag: str
+    cache_control: str = "no-cache"
+    status_code = 304
+    detail = None
+
+    def __post_init__(self):
+        self.headers = {"ETag": self.etag, "Cache-Control": self.cache_control}
+
+
+def make_etag(*parts) -> str:
+    digest = sha256(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    # Weak comparison, as recommended for If-None-Match (RFC 9110 13.1.2)
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+
+class TeamETag:
+    """
+    Conditional GET for team scoped reads, as a route dependency.
+
+    The ETag comes from the team's data_version (bumped on every write to the
+    team's rows), so a matching If-None-Match is answered with 304 before the
+    route runs any repo query.
+
+    :param vary_by_date: For responses that change with the day (e.g.
+        championship status) even without writes.
+    """
+
+    def __init__(self, vary_by_date: bool = False):
+        self.vary_by_date = vary_by_date
+
+    def __call__(
+        self,
+        request: Request,
+        response: Response,
+        session: Session = Depends(get_session),
+        current_user: User = Depends(validate_user_token),
+    ) -> None:
+        data_version = TeamReadRepo(session).get_data_version(current_user.team_id)
+        if data_version is None:
+            return
+
+        etag = make_etag(
+            request.url.path,
+            request.url.query,
+            current_user.team_id,
+            current_user.id,
+            data_version,
+            brasilia_now().date() if self.vary_by_date else "",
+        )
+        cache_control = "private, no-cache"
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModified(etag=etag, cache_control=cache_control)
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
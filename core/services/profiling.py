@@ -0,0 +1,56 @@
+import random
+from typing import AsyncIterator
+
+from fastapi import Depends, Request, Response
+from sqlmodel import Session
+
+from bounded_contexts.user.models import User
+from core.models.request_profile import RequestProfile
+from core.exceptions import SuperAdminRequired
+from core.services.auth import validate_user_token
+from core.settings import PROFILER_SAMPLE_RATE, PROFILER_SAMPLED_ROUTES
+from infra.database import get_session
+from infra.profiler import RequestProfileWriteRepo, profiled
+
+PROFILE_HEADER = "X-Profile-Request"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+async def profile_request(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(validate_user_token),
+    session: Session = Depends(get_session),
+) -> AsyncIterator[None]:
+    """
+    Router dependency that profiles the request when a super admin asks for
+    it (X-Profile-Request header) or, on PROFILER_SAMPLED_ROUTES, for a
+    PROFILER_SAMPLE_RATE share of them. The profile's id goes back in
+    X-Profile-Id, for GET /admin/profiles/{profile_id}. It's saved once the
+    request is handled, in a session of its own: committing the request's
+    one would commit whatever the route left in it.
+
+    The routes are async, so the event loop thread is the one sampled: other
+    requests it serves meanwhile show up in the profile too.
+    """
+    route_name = f"{request.method} {request.scope['route'].path}"
+    if request.headers.get(PROFILE_HEADER):
+        if not current_user.is_super_admin:
+            raise SuperAdminRequired()
+        trigger = "header"
+    elif (
+        route_name in PROFILER_SAMPLED_ROUTES and random.random() < PROFILER_SAMPLE_RATE
+    ):
+        trigger = "sampled"
+    else:
+        yield
+        return
+
+    profile = RequestProfile(
+        route=route_name, team_id=current_user.team_id, trigger=trigger
+    )
+    response.headers[PROFILE_ID_HEADER] = profile.id
+    with profiled(profile):
+        yield
+    with Session(session.get_bind()) as profile_session:
+        RequestProfileWriteRepo(profile_session).create(profile)
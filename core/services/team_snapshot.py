@@ -0,0 +1,197 @@
+import gzip
+import json
+from datetime import date, datetime
+from time import perf_counter
+from uuid import UUID
+
+from loguru import logger
+from sqlalchemy import Table, delete, insert, select, update
+from sqlmodel import Session
+
+from bounded_contexts.championship.models import Championship
+from bounded_contexts.game_and_stats.models import (
+    Game,
+    GamePlayerStat,
+    GamePlayerAvailability,
+)
+from bounded_contexts.player.models import Player
+from bounded_contexts.team.exceptions import TeamNotFound
+from bounded_contexts.team.models import Team
+from bounded_contexts.terms_of_use.models import UserTermsAcceptance
+from bounded_contexts.user.logged_user.models import LoggedUser
+from bounded_contexts.user.models import User
+from core.exceptions import InvalidTeamSnapshot
+
+SNAPSHOT_FORMAT = "team-snapshot"
+SNAPSHOT_VERSION = 1
+INSERT_BATCH_SIZE = 1000
+
+# Insert order - players before users (user.player_id), games before stats
+SNAPSHOT_TABLES: tuple[Table, ...] = (
+    Championship.__table__,
+    Player.__table__,
+    User.__table__,
+    Game.__table__,
+    GamePlayerStat.__table__,
+    GamePlayerAvailability.__table__,
+)
+
+
+def export_team_snapshot(team_id: UUID, session: Session) -> bytes:
+    """
+    All the team's rows (users included, with their hashed passwords), as a
+    gzipped columnar JSON: one list of values per column, per table.
+    """
+    if not session.get(Team, team_id):
+        raise TeamNotFound()
+
+    connection = session.connection()
+    tables = {}
+    for table in SNAPSHOT_TABLES:
+        columns = {column.name: [] for column in table.columns}
+        result = connection.execute(
+            select(table)
+            .where(table.c.team_id == team_id)
+            .execution_options(yield_per=INSERT_BATCH_SIZE)
+        )
+        for row in result.mappings():
+            for name, values in columns.items():
+                values.append(_encode(row[name]))
+        tables[table.name] = columns
+
+    snapshot = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "team_id": str(team_id),
+        "tables": tables,
+    }
+    return gzip.compress(json.dumps(snapshot, separators=(",", ":")).encode())
+
+
+def restore_team_snapshot(
+    content: bytes, session: Session, target_team_id: UUID | None = None
+) -> dict:
+    """
+    Replaces all the team's rows with the snapshot ones, in a single
+    transaction. The team row itself must already exist.
+
+    :param target_team_id: Loads the rows into another team of a database
+        without the snapshot's rows (e.g. a local clone of production data),
+        ids are kept. Defaults to the snapshot's team.
+    :return: Rows restored per table and the duration of each phase.
+    """
+    start = perf_counter()
+    snapshot = _load(content)
+    team_id = target_team_id or UUID(snapshot["team_id"])
+    if not session.get(Team, team_id):
+        raise TeamNotFound()
+
+    _delete_team_rows_without_commit(team_id, session)
+    deleted_at = perf_counter()
+
+    rows_count = {}
+    connection = session.connection()
+    for table in SNAPSHOT_TABLES:
+        rows = _decode_rows(table, snapshot["tables"].get(table.name, {}), team_id)
+        rows_count[table.name] = len(rows)
+
+        if table is GamePlayerStat.__table__:
+            # Goals go in before the assists pointing to them (related_stat_id)
+            rows.sort(key=lambda row: row["related_stat_id"] is not None)
+
+        for i in range(0, len(rows), INSERT_BATCH_SIZE):
+            connection.execute(insert(table), rows[i : i + INSERT_BATCH_SIZE])
+    loaded_at = perf_counter()
+
+    # Core statements skip the flush that bumps it
+    connection.execute(
+        update(Team.__table__)
+        .where(Team.__table__.c.id == team_id)
+        .values(data_version=Team.__table__.c.data_version + 1)
+    )
+    session.commit()
+    committed_at = perf_counter()
+
+    report = {
+        "team_id": str(team_id),
+        "rows": rows_count,
+        "delete_ms": _ms(start, deleted_at),
+        "load_ms": _ms(deleted_at, loaded_at),
+        "commit_ms": _ms(loaded_at, committed_at),
+        "total_ms": _ms(start, committed_at),
+    }
+    logger.info(f"Team snapshot restored: {report}")
+    return report
+
+
+def _delete_team_rows_without_commit(team_id: UUID, session: Session) -> None:
+    connection = session.connection()
+    team_user_ids = select(User.__table__.c.id).where(
+        User.__table__.c.team_id == team_id
+    )
+    for table in (LoggedUser.__table__, UserTermsAcceptance.__table__):
+        connection.execute(delete(table).where(table.c.user_id.in_(team_user_ids)))
+
+    for table in reversed(SNAPSHOT_TABLES):
+        connection.execute(delete(table).where(table.c.team_id == team_id))
+
+
+def _load(content: bytes) -> dict:
+    try:
+        snapshot = json.loads(gzip.decompress(content))
+    except (OSError, EOFError, ValueError):
+        raise InvalidTeamSnapshot()
+
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("format") != SNAPSHOT_FORMAT
+        or snapshot.get("version") != SNAPSHOT_VERSION
+    ):
+        raise InvalidTeamSnapshot()
+    return snapshot
+
+
+def _encode(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _decode_rows(table: Table, columns: dict[str, list], team_id: UUID) -> list[dict]:
+    decoders = {}
+    for name in columns:
+        if name not in table.columns:
+            raise InvalidTeamSnapshot()
+        decoders[name] = _decoder(table.columns[name].type)
+
+    decoded_columns = {
+        name: [None if value is None else decoders[name](value) for value in values]
+        for name, values in columns.items()
+    }
+    rows = [
+        dict(zip(decoded_columns, values)) for values in zip(*decoded_columns.values())
+    ]
+    for row in rows:
+        row["team_id"] = team_id
+    return rows
+
+
+def _decoder(column_type):
+    try:
+        python_type = column_type.python_type
+    except NotImplementedError:
+        python_type = None
+
+    if python_type is UUID:
+        return UUID
+    if python_type is datetime:
+        return datetime.fromisoformat
+    if python_type is date:
+        return date.fromisoformat
+    return lambda value: value
+
+
+def _ms(start: float, end: float) -> float:
+    return round((end - start) * 1000, 2)
@@ -21,14 +21,65 @@ JWT_KEY = os.getenv("JWT_KEY")
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 8
+DEMO_REFRESH_TOKEN_EXPIRE_HOURS = 2
+# Signed refresh tokens checked against user.session_generation, no logged_user
+STATELESS_REFRESH_TOKENS = bool(os.getenv("STATELESS_REFRESH_TOKENS"))
 REFRESH_TOKEN_SECURE_BOOL = bool(os.getenv("REFRESH_TOKEN_SECURE_BOOL"))
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 SUPER_USER_PWD = os.getenv("SUPER_USER_PWD")
+# Sent by Vercel Cron as "Authorization: Bearer <CRON_SECRET>"
+CRON_SECRET = os.getenv("CRON_SECRET")
 
 # Bussiness logic
 FRIENDLY_CHAMPIONSHIP_NAME = "Amistosos"
 BEFORE_SYSTEM_CHAMPIONSHIP_NAME = "Antes do Forquilha"
 
+# Cache
+ACTIVE_TERMS_CACHE_TTL_SECONDS = 60
+# Also how long a revoked stateless session lasts on the other instances
+SESSION_GENERATION_CACHE_TTL_SECONDS = 30
+SESSION_GENERATION_CACHE_MAXSIZE = 10_000
+CHAMPIONSHIP_SUMMARIES_CACHE_MAXSIZE = 1000  # teams
+# A safety net: data_version is what invalidates it
+CHAMPIONSHIP_SUMMARIES_CACHE_TTL_SECONDS = 600
+
+# Realtime
+AVAILABILITY_EVENTS_HEARTBEAT_SECONDS = 15
+
+# Tracing
+# OTLP/HTTP collector (e.g. http://localhost:4318), tracing is off without it
+OTLP_TRACES_ENDPOINT = os.getenv("OTLP_TRACES_ENDPOINT")
+TRACE_EXPORT_QUEUE_SIZE = 1000  # traces
+TRACE_MAX_SPANS = 2000  # per trace, e.g. a large games import
+SLOW_QUERY_THRESHOLD_MS = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+
+# Logging
+LOG_QUEUE_SIZE = 10_000  # records waiting for the writer thread
+ACCESS_LOG_SAMPLE_RATE = 1.0
+# Route template -> share of its access logs kept
+ACCESS_LOG_ROUTE_SAMPLE_RATES = {
+    "GET /games/next-game": 0.1,
+    "GET /games/last-games": 0.1,
+    "GET /stats/month-top-scorer": 0.1,
+    "GET /database-check": 0.0,
+}
+
+# Profiling
+# Share of the sampled routes' requests profiled, besides the ones asked for
+PROFILER_SAMPLE_RATE = float(os.getenv("PROFILER_SAMPLE_RATE", 0))
+PROFILER_SAMPLED_ROUTES = {"POST /players/stats-filter", "POST /games/filter"}
+PROFILER_INTERVAL_MS = 5
+PROFILES_TTL_DAYS = 7
+PROFILES_LISTED = 50  # by GET /admin/profiles, newest first
+
+# Compression
+GZIP_MINIMUM_SIZE_BYTES = 1000
+GZIP_COMPRESS_LEVEL = 6
+
+# Exports and imports
+EXPORT_ROWS_PER_CHUNK = 500
+GAMES_IMPORT_MAX_ROWS = 2000
+
 # Email
 APP_EMAIL = os.getenv("APP_EMAIL")
 APP_EMAIL_PASSWORD = os.getenv("APP_EMAIL_PASSWORD")
@@ -0,0 +1,8 @@
+"""
+Benchmarks of the hot services on a large synthetic dataset.
+
+    python -m infra.benchmarks --output results.json
+    python -m infra.benchmarks --database-url postgresql://... --baseline old.json
+
+See infra/benchmarks/__main__.py for the options.
+"""
@@ -0,0 +1,73 @@
+"""
+The benchmarked services, each called as its route would, on a fresh session
+per round (the per request caches start empty, as in production).
+"""
+
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlmodel import Session
+
+from bounded_contexts.game_and_stats.game.schemas import GameFilter
+from bounded_contexts.game_and_stats.game.service import (
+    get_games_filtered_and_paginated,
+)
+from bounded_contexts.game_and_stats.stats.service import (
+    get_month_top_scorer,
+    get_season_stats_summary,
+)
+from bounded_contexts.player.schemas import PlayersStatsFilter
+from bounded_contexts.player.service import (
+    get_players_and_stats,
+    get_players_filtered_by_stats,
+)
+from bounded_contexts.user.service import login
+from core.enums import StageOptions
+from infra.benchmarks.generator import BENCHMARK_PASSWORD, BenchmarkTeam
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    name: str
+    run: Callable[[BenchmarkTeam, Session], object]
+
+
+def _games_filtered(team: BenchmarkTeam, session: Session) -> object:
+    filter_data = GameFilter(
+        stages=[StageOptions.SEMI_FINAL, StageOptions.FINAL], order_by="date_hour_desc"
+    )
+    return get_games_filtered_and_paginated(team.id, filter_data, 20, 0, session)
+
+
+def _players_filtered_by_stats(team: BenchmarkTeam, session: Session) -> object:
+    filter_data = PlayersStatsFilter(championships=team.championship_ids[-6:])
+    return get_players_filtered_by_stats(filter_data, team.id, session)
+
+
+CASES = [
+    BenchmarkCase(
+        "get_players_and_stats",
+        lambda team, session: get_players_and_stats(team.id, session),
+    ),
+    BenchmarkCase("get_players_filtered_by_stats", _players_filtered_by_stats),
+    BenchmarkCase(
+        "get_games_paginated",
+        lambda team, session: get_games_filtered_and_paginated(
+            team.id, GameFilter(), 20, 0, session
+        ),
+    ),
+    BenchmarkCase("get_games_filtered_and_paginated", _games_filtered),
+    BenchmarkCase(
+        "get_season_stats_summary",
+        lambda team, session: get_season_stats_summary(team.id, session),
+    ),
+    BenchmarkCase(
+        "get_month_top_scorer",
+        lambda team, session: get_month_top_scorer(team.id, session),
+    ),
+    # bcrypt bound, also writes the session row
+    BenchmarkCase(
+        "login",
+        lambda team, session: login(team.admin_email, BENCHMARK_PASSWORD, session),
+    ),
+]
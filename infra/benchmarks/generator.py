@@ -0,0 +1,381 @@
+"""
+Deterministic synthetic data: the same seed and reference date always
+generate the same rows (ids included), so runs on different machines or
+databases are comparable.
+
+Per team: 30 players, an admin user, a friendly championship plus a league
+and a cup per season, weekly games with full stats and availabilities.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from uuid import UUID
+
+from sqlalchemy import func, insert
+from sqlmodel import Session, SQLModel, select
+
+from bounded_contexts.championship.models import Championship
+from bounded_contexts.game_and_stats.models import (
+    AvailabilityStatus,
+    Game,
+    GamePlayerAvailability,
+    GamePlayerStat,
+    StatOptions,
+)
+from bounded_contexts.player.models import Player, PlayerPositions
+from bounded_contexts.team.models import Team
+from bounded_contexts.user.models import User
+from core.enums import StageOptions
+from core.services.password import hash_password
+from core.settings import FRIENDLY_CHAMPIONSHIP_NAME
+from libs.datetime import brasilia_now
+
+BENCHMARK_PASSWORD = "benchmark"
+INSERT_BATCH_SIZE = 5000
+_TEAM_CODE_PREFIX = "bench-"
+
+# Last games of each season's cup, in order
+_CUP_STAGES = [
+    StageOptions.OITAVAS_DE_FINAL,
+    StageOptions.QUARTAS_DE_FINAL,
+    StageOptions.SEMI_FINAL,
+    StageOptions.FINAL,
+]
+_AVAILABILITY_WEIGHTS = {
+    AvailabilityStatus.AVAILABLE: 6,
+    AvailabilityStatus.NOT_AVAILABLE: 2,
+    AvailabilityStatus.DOUBT: 1,
+}
+
+
+@dataclass
+class GeneratorConfig:
+    teams: int = 200
+    players_per_team: int = 30
+    seasons: int = 10
+    games_per_season: int = 40
+    players_per_game: int = 14
+    seed: int = 42
+    # Last season's games go up to it, the later ones are left unplayed
+    reference_date: date = field(default_factory=lambda: brasilia_now().date())
+
+
+@dataclass
+class BenchmarkTeam:
+    """What the benchmark cases need to know about a generated team."""
+
+    id: UUID
+    admin_email: str
+    player_ids: list[UUID]
+    championship_ids: list[UUID]
+
+
+class _Rows:
+    def __init__(self):
+        self.by_model: dict[type[SQLModel], list[dict]] = {}
+
+    def add(self, instance: SQLModel) -> None:
+        self.by_model.setdefault(type(instance), []).append(instance.model_dump())
+
+    def insert(self, session: Session) -> None:
+        # Parents first, for the foreign keys
+        for model in (
+            Team,
+            Player,
+            User,
+            Championship,
+            Game,
+            GamePlayerStat,
+            GamePlayerAvailability,
+        ):
+            rows = self.by_model.pop(model, [])
+            for start in range(0, len(rows), INSERT_BATCH_SIZE):
+                session.execute(insert(model), rows[start : start + INSERT_BATCH_SIZE])
+        session.commit()
+
+
+def generate(session: Session, config: GeneratorConfig) -> list[BenchmarkTeam]:
+    """Inserts the teams with plain executemany INSERTs, one commit per team."""
+    rng = random.Random(config.seed)
+    # bcrypt is slow on purpose: one hash shared by every user
+    hashed_password = hash_password(BENCHMARK_PASSWORD)
+
+    teams = []
+    for team_number in range(config.teams):
+        rows = _Rows()
+        teams.append(_generate_team(team_number, config, rng, hashed_password, rows))
+        rows.insert(session)
+    return teams
+
+
+def team_admin_email(team_number: int) -> str:
+    return f"admin-{team_number}@benchmark.local"
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _generate_team(
+    team_number: int,
+    config: GeneratorConfig,
+    rng: random.Random,
+    hashed_password: str,
+    rows: _Rows,
+) -> BenchmarkTeam:
+    team_id = _uuid(rng)
+    current_season = config.reference_date.year
+    first_season = current_season - config.seasons + 1
+    rows.add(
+        Team(
+            id=team_id,
+            name=f"Benchmark FC {team_number}",
+            code=f"{_TEAM_CODE_PREFIX}{team_number:06d}",
+            foundation_date=date(first_season - 1, 1, 1),
+            season_start_date=date(current_season, 1, 1),
+            paid_until=date(2099, 1, 1),
+            max_players=config.players_per_team,
+        )
+    )
+
+    positions = list(PlayerPositions)
+    player_ids = [_uuid(rng) for _ in range(config.players_per_team)]
+    for number, player_id in enumerate(player_ids, start=1):
+        rows.add(
+            Player(
+                id=player_id,
+                team_id=team_id,
+                name=f"Jogador {team_number}-{number}",
+                shirt_number=number,
+                position=positions[number % len(positions)],
+            )
+        )
+
+    admin_email = team_admin_email(team_number)
+    rows.add(
+        User(
+            id=_uuid(rng),
+            team_id=team_id,
+            player_id=player_ids[0],
+            name=f"Admin {team_number}",
+            email=admin_email,
+            hashed_password=hashed_password,
+            is_admin=True,
+        )
+    )
+
+    friendly_id = _uuid(rng)
+    rows.add(
+        Championship(
+            id=friendly_id,
+            team_id=team_id,
+            name=FRIENDLY_CHAMPIONSHIP_NAME,
+            start_date=date(1800, 1, 1),
+            is_league_format=True,
+        )
+    )
+    championship_ids = [friendly_id]
+    for season in range(first_season, current_season + 1):
+        championship_ids += _generate_season(
+            team_id, season, friendly_id, player_ids, config, rng, rows
+        )
+
+    return BenchmarkTeam(
+        id=team_id,
+        admin_email=admin_email,
+        player_ids=player_ids,
+        championship_ids=championship_ids,
+    )
+
+
+def _generate_season(
+    team_id: UUID,
+    season: int,
+    friendly_id: UUID,
+    player_ids: list[UUID],
+    config: GeneratorConfig,
+    rng: random.Random,
+    rows: _Rows,
+) -> list[UUID]:
+    is_current = season == config.reference_date.year
+    league_id, cup_id = _uuid(rng), _uuid(rng)
+    end_date = None if is_current else date(season, 12, 31)
+    rows.add(
+        Championship(
+            id=league_id,
+            team_id=team_id,
+            name=f"Liga {season}",
+            start_date=date(season, 1, 1),
+            end_date=end_date,
+            is_league_format=True,
+            final_position=None if is_current else rng.randint(1, 20),
+        )
+    )
+    rows.add(
+        Championship(
+            id=cup_id,
+            team_id=team_id,
+            name=f"Copa {season}",
+            start_date=date(season, 1, 1),
+            end_date=end_date,
+            is_league_format=False,
+        )
+    )
+
+    first_sunday = date(season, 1, 7 - date(season, 1, 1).weekday())
+    cup_games = len(_CUP_STAGES)
+    for game_number in range(config.games_per_season):
+        game_date = first_sunday + timedelta(weeks=game_number)
+        cup_game_number = game_number - (config.games_per_season - cup_games)
+        if cup_game_number >= 0:
+            championship_id = cup_id
+            round_, stage = None, _CUP_STAGES[cup_game_number]
+        elif game_number % 10 == 9:
+            championship_id, round_, stage = friendly_id, None, None
+        else:
+            championship_id, round_, stage = league_id, game_number + 1, None
+
+        _generate_game(
+            team_id,
+            championship_id,
+            datetime.combine(game_date, time(16)),
+            round_,
+            stage,
+            player_ids,
+            is_played=game_date <= config.reference_date,
+            config=config,
+            rng=rng,
+            rows=rows,
+        )
+
+    return [league_id, cup_id]
+
+
+def _generate_game(
+    team_id: UUID,
+    championship_id: UUID,
+    date_hour: datetime,
+    round_: int | None,
+    stage: StageOptions | None,
+    player_ids: list[UUID],
+    is_played: bool,
+    config: GeneratorConfig,
+    rng: random.Random,
+    rows: _Rows,
+) -> None:
+    game_id = _uuid(rng)
+    statuses = rng.choices(
+        list(_AVAILABILITY_WEIGHTS),
+        weights=list(_AVAILABILITY_WEIGHTS.values()),
+        k=len(player_ids),
+    )
+    for player_id, status in zip(player_ids, statuses):
+        rows.add(
+            GamePlayerAvailability(
+                id=_uuid(rng),
+                team_id=team_id,
+                game_id=game_id,
+                player_id=player_id,
+                status=status,
+            )
+        )
+
+    team_score = adversary_score = None
+    if is_played:
+        team_score, adversary_score = rng.randint(0, 5), rng.randint(0, 4)
+    rows.add(
+        Game(
+            id=game_id,
+            team_id=team_id,
+            championship_id=championship_id,
+            adversary=f"Adversário {rng.randint(1, 60)}",
+            date_hour=date_hour,
+            round=round_,
+            stage=stage,
+            is_home=rng.random() < 0.5,
+            team_score=team_score,
+            adversary_score=adversary_score,
+            available_count=statuses.count(AvailabilityStatus.AVAILABLE),
+            not_available_count=statuses.count(AvailabilityStatus.NOT_AVAILABLE),
+            doubt_count=statuses.count(AvailabilityStatus.DOUBT),
+        )
+    )
+    if not is_played:
+        return
+
+    def _stat(
+        stat: StatOptions,
+        player_id: UUID | None,
+        quantity: int = 1,
+        related_stat_id: UUID | None = None,
+    ) -> UUID:
+        stat_id = _uuid(rng)
+        rows.add(
+            GamePlayerStat(
+                id=stat_id,
+                team_id=team_id,
+                game_id=game_id,
+                player_id=player_id,
+                related_stat_id=related_stat_id,
+                stat=stat,
+                quantity=quantity,
+            )
+        )
+        return stat_id
+
+    lineup = rng.sample(player_ids, k=min(config.players_per_game, len(player_ids)))
+    for player_id in lineup:
+        _stat(StatOptions.PLAYED, player_id)
+    for _ in range(team_score):
+        # Some own goals, player_id None
+        scorer = rng.choice(lineup) if rng.random() < 0.95 else None
+        goal_id = _stat(StatOptions.GOAL, scorer)
+        if rng.random() < 0.7:
+            assistant = rng.choice([p for p in lineup if p != scorer])
+            _stat(StatOptions.ASSIST, assistant, related_stat_id=goal_id)
+    for player_id in rng.sample(lineup, k=rng.randint(0, 3)):
+        _stat(StatOptions.YELLOW_CARD, player_id, rng.randint(1, 2))
+    if rng.random() < 0.1:
+        _stat(StatOptions.RED_CARD, rng.choice(lineup))
+    _stat(StatOptions.MVP, rng.choice(lineup))
+
+
+def count_teams(session: Session) -> int:
+    return session.exec(
+        select(func.count(Team.id)).where(Team.code.startswith(_TEAM_CODE_PREFIX))
+    ).one()
+
+
+def load_teams(session: Session, limit: int) -> list[BenchmarkTeam]:
+    """The teams of a database populated by an earlier run."""
+    teams = session.exec(
+        select(Team)
+        .where(Team.code.startswith(_TEAM_CODE_PREFIX))
+        .order_by(Team.code)
+        .limit(limit)
+    ).all()
+    loaded = []
+    for team in teams:
+        admin = session.exec(
+            select(User).where(User.team_id == team.id, User.is_admin == True)
+        ).first()
+        player_ids = session.exec(
+            select(Player.id)
+            .where(Player.team_id == team.id)
+            .order_by(Player.shirt_number)
+        ).all()
+        championship_ids = session.exec(
+            select(Championship.id)
+            .where(Championship.team_id == team.id)
+            .order_by(Championship.start_date, Championship.name)
+        ).all()
+        loaded.append(
+            BenchmarkTeam(
+                id=team.id,
+                admin_email=admin.email,
+                player_ids=list(player_ids),
+                championship_ids=list(championship_ids),
+            )
+        )
+    return loaded
@@ -0,0 +1,94 @@
+import json
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import mean, median, quantiles
+from time import perf_counter
+from typing import Callable
+
+from sqlmodel import Session
+
+from infra.benchmarks.cases import BenchmarkCase
+from infra.benchmarks.generator import BenchmarkTeam
+
+
+def run_cases(
+    cases: list[BenchmarkCase],
+    teams: list[BenchmarkTeam],
+    make_session: Callable[[], Session],
+    rounds: int,
+    warmup_rounds: int = 2,
+) -> dict[str, dict]:
+    """
+    Times every case round-robin over the teams, so no single team's pages
+    stay hot in the database cache. Timings in milliseconds.
+    """
+    results = {}
+    for case in cases:
+        timings = []
+        for round_number in range(warmup_rounds + rounds):
+            team = teams[round_number % len(teams)]
+            with make_session() as session:
+                start = perf_counter()
+                case.run(team, session)
+                elapsed_ms = (perf_counter() - start) * 1000
+            if round_number >= warmup_rounds:
+                timings.append(elapsed_ms)
+
+        results[case.name] = {
+            "rounds": rounds,
+            "min_ms": round(min(timings), 3),
+            "median_ms": round(median(timings), 3),
+            "mean_ms": round(mean(timings), 3),
+            "p95_ms": round(_p95(timings), 3),
+        }
+        print(
+            f"{case.name:<34} median {results[case.name]['median_ms']:9.2f} ms | "
+            f"p95 {results[case.name]['p95_ms']:9.2f} ms"
+        )
+    return results
+
+
+def _p95(timings: list[float]) -> float:
+    if len(timings) < 2:
+        return timings[0]
+    return quantiles(timings, n=20, method="inclusive")[-1]
+
+
+def save_results(path: Path, results: dict[str, dict], metadata: dict) -> None:
+    report = {
+        "metadata": {
+            **metadata,
+            "python": platform.python_version(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+    path.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+
+def load_results(path: Path) -> dict[str, dict]:
+    return json.loads(path.read_text())["results"]
+
+
+def find_regressions(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    max_regression: float,
+    metric: str = "median_ms",
+) -> list[str]:
+    """
+    Entries whose metric got slower than the baseline's by more than
+    max_regression (0.2 = 20%). Entries missing on either side are skipped.
+    """
+    regressions = []
+    for name, result in results.items():
+        if metric not in result or metric not in baseline.get(name, {}):
+            continue
+        before, after = baseline[name][metric], result[metric]
+        if after > before * (1 + max_regression):
+            regressions.append(
+                f"{name}: {metric} {before:.2f} -> {after:.2f} "
+                f"(+{(after / before - 1) * 100:.0f}%)"
+            )
+    return regressions
@@ -0,0 +1,10 @@
+"""
+HTTP load tests: virtual users replay a traffic profile against a running
+app, whose database was populated by infra.benchmarks.
+
+    python -m infra.benchmarks --database-url $DATABASE_URL --generate-only
+    fastapi run api/main.py  # same DATABASE_URL
+    python -m infra.benchmarks.load --profile sunday_evening --slo slo.json
+
+See infra/benchmarks/load/__main__.py for the options.
+"""
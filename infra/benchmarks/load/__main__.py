@@ -0,0 +1,88 @@
+"""
+Runs a traffic profile against a running app and saves the per route
+report (requests, errors, throughput, p50/p95/p99) as JSON. Exits with 1
+when an SLO is broken or, with --baseline, when a route's p95 regressed
+more than --max-regression.
+
+python -m infra.benchmarks.load --profile login_storm --users 100 --duration 30
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from infra.benchmarks.generator import team_admin_email
+from infra.benchmarks.harness import find_regressions, load_results, save_results
+from infra.benchmarks.load.profiles import PROFILES
+from infra.benchmarks.load.runner import LoadRun, check_slos
+
+DEFAULT_SLO_FILE = Path(__file__).parent / "slo.json"
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--profile", choices=list(PROFILES), required=True)
+    parser.add_argument("--users", type=int, default=20, help="Virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds")
+    parser.add_argument(
+        "--teams", type=int, default=20, help="Generated teams the users log into"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=Path("load_results.json"))
+    parser.add_argument("--slo", type=Path, default=DEFAULT_SLO_FILE)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    profile = PROFILES[args.profile]
+    print(f"{profile.name}: {profile.description}")
+
+    load_run = LoadRun(
+        base_url=args.base_url,
+        profile=profile,
+        users=args.users,
+        duration_seconds=args.duration,
+        team_emails=[team_admin_email(number) for number in range(args.teams)],
+        seed=args.seed,
+    )
+    report = asyncio.run(load_run.run())
+
+    for route, summary in report.items():
+        print(
+            f"{route:<40} {summary['requests']:6d} req "
+            f"{summary['throughput_rps']:7.2f} req/s | "
+            f"p50 {summary.get('p50_ms', 0):8.2f} | "
+            f"p95 {summary.get('p95_ms', 0):8.2f} | "
+            f"p99 {summary.get('p99_ms', 0):8.2f} ms | "
+            f"errors {summary['errors']}"
+        )
+    save_results(
+        args.output,
+        report,
+        metadata={
+            "profile": profile.name,
+            "base_url": args.base_url,
+            "users": args.users,
+            "duration_seconds": args.duration,
+        },
+    )
+    print(f"\nSaved to {args.output}")
+
+    failures = check_slos(report, json.loads(args.slo.read_text()))
+    if args.baseline:
+        failures += find_regressions(
+            report, load_results(args.baseline), args.max_regression, "p95_ms"
+        )
+    for failure in failures:
+        print(f"FAILED {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Traffic profiles: the weighted requests a virtual user picks from, after
+each one waiting a random think time.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from infra.benchmarks.generator import BENCHMARK_PASSWORD
+from libs.datetime import brasilia_now
+
+
+@dataclass
+class VirtualUser:
+    email: str
+    rng: random.Random
+    access_token: str | None = None
+    player_ids: list[str] = field(default_factory=list)
+    # The current season's league, where the post match games are created
+    league_id: str | None = None
+    game_ids: list[str] = field(default_factory=list)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        if not self.access_token:
+            return {}
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    def some_game_id(self) -> str | None:
+        return self.rng.choice(self.game_ids) if self.game_ids else None
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    url: str
+    json: dict | None = None
+    data: dict | None = None
+
+
+@dataclass(frozen=True)
+class Step:
+    method: str
+    # Path template, the report's key (e.g. /stats/game/{game_id})
+    route: str
+    weight: int
+    build: Callable[[VirtualUser], RequestSpec | None] | None = None
+    # Called with the response's json, e.g. to keep the created ids
+    on_success: Callable[[VirtualUser, Any], None] | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.route}"
+
+    def request(self, user: VirtualUser) -> RequestSpec | None:
+        """None when the user can't make it yet (e.g. no game to read)."""
+        return self.build(user) if self.build else RequestSpec(url=self.route)
+
+
+@dataclass(frozen=True)
+class TrafficProfile:
+    name: str
+    description: str
+    steps: list[Step]
+    think_time_seconds: tuple[float, float]
+    # Requests without an access token (a login storm logs in on each one)
+    authenticated: bool = True
+
+    def pick(self, rng: random.Random) -> Step:
+        return rng.choices(self.steps, weights=[step.weight for step in self.steps])[0]
+
+
+def _game_url(template: str) -> Callable[[VirtualUser], RequestSpec | None]:
+    def _build(user: VirtualUser) -> RequestSpec | None:
+        game_id = user.some_game_id()
+        return RequestSpec(url=template.format(game_id=game_id)) if game_id else None
+
+    return _build
+
+
+def _new_game(user: VirtualUser) -> RequestSpec | None:
+    if not user.league_id or len(user.player_ids) < 11:
+        return None
+
+    players = user.rng.sample(user.player_ids, k=11)
+    team_score = user.rng.randint(0, 4)
+    return RequestSpec(
+        url="/games/",
+        json={
+            "championship_id": user.league_id,
+            "adversary": f"Adversário {user.rng.randint(1, 60)}",
+            "date_hour": brasilia_now().replace(microsecond=0, tzinfo=None).isoformat(),
+            "round": user.rng.randint(1, 38),
+            "team_score": team_score,
+            "adversary_score": user.rng.randint(0, 4),
+            "players": players,
+            "goals_and_assists": [
+                {
+                    "goal_player_id": user.rng.choice(players),
+                    "assist_player_id": None,
+                }
+                for _ in range(team_score)
+            ],
+            "mvps": [{"player_id": user.rng.choice(players), "quantity": 1}],
+        },
+    )
+
+
+def _keep_game_id(user: VirtualUser, game_id: str) -> None:
+    user.game_ids.append(game_id)
+
+
+def _login(user: VirtualUser) -> RequestSpec:
+    return RequestSpec(
+        url="/users/login",
+        data={"username": user.email, "password": BENCHMARK_PASSWORD},
+    )
+
+
+SUNDAY_EVENING = TrafficProfile(
+    name="sunday_evening",
+    description="Players checking the dashboard, stats and last games",
+    steps=[
+        Step("GET", "/games/next-game", 3),
+        Step("GET", "/games/last-games", 3),
+        Step("GET", "/stats/month-top-scorer", 2),
+        Step("GET", "/stats/season-summary", 2),
+        Step("GET", "/players/", 3),
+        Step("GET", "/championships/", 2),
+        Step("GET", "/championships/summaries", 1),
+        Step("POST", "/games/filter", 2, lambda user: RequestSpec("/games/filter", {})),
+        Step(
+            "POST",
+            "/players/stats-filter",
+            1,
+            lambda user: RequestSpec("/players/stats-filter", {}),
+        ),
+        Step("GET", "/stats/game/{game_id}", 2, _game_url("/stats/game/{game_id}")),
+        Step(
+            "GET",
+            "/player-availability/{game_id}",
+            1,
+            _game_url("/player-availability/{game_id}"),
+        ),
+    ],
+    think_time_seconds=(1.0, 3.0),
+)
+
+POST_MATCH = TrafficProfile(
+    name="post_match",
+    description="Admins entering the game just played and reviewing it",
+    steps=[
+        Step("POST", "/games/", 2, _new_game, _keep_game_id),
+        Step(
+            "GET",
+            "/games/to-update/{game_id}",
+            2,
+            _game_url("/games/to-update/{game_id}"),
+        ),
+        Step("GET", "/stats/game/{game_id}", 3, _game_url("/stats/game/{game_id}")),
+        Step("POST", "/games/filter", 2, lambda user: RequestSpec("/games/filter", {})),
+        Step("GET", "/players/", 2),
+    ],
+    think_time_seconds=(2.0, 5.0),
+)
+
+LOGIN_STORM = TrafficProfile(
+    name="login_storm",
+    description="Everyone opening the app at once (e.g. after a push)",
+    steps=[Step("POST", "/users/login", 1, _login)],
+    think_time_seconds=(0.0, 0.5),
+    authenticated=False,
+)
+
+PROFILES = {
+    profile.name: profile for profile in (SUNDAY_EVENING, POST_MATCH, LOGIN_STORM)
+}
@@ -0,0 +1,201 @@
+import asyncio
+import random
+from dataclasses import dataclass, field
+from statistics import quantiles
+from time import monotonic, perf_counter
+
+import httpx
+from loguru import logger
+
+from infra.benchmarks.generator import BENCHMARK_PASSWORD
+from infra.benchmarks.load.profiles import TrafficProfile, VirtualUser, Step
+
+
+@dataclass
+class RouteTimings:
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, duration_seconds: float) -> dict:
+        requests = len(self.latencies_ms)
+        summary = {
+            "requests": requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / requests, 4) if requests else 0.0,
+            "throughput_rps": round(requests / duration_seconds, 2),
+        }
+        if requests > 1:
+            percentiles = quantiles(self.latencies_ms, n=100, method="inclusive")
+            summary |= {
+                "p50_ms": round(percentiles[49], 2),
+                "p95_ms": round(percentiles[94], 2),
+                "p99_ms": round(percentiles[98], 2),
+            }
+        elif requests:
+            summary |= {
+                "p50_ms": round(self.latencies_ms[0], 2),
+                "p95_ms": round(self.latencies_ms[0], 2),
+                "p99_ms": round(self.latencies_ms[0], 2),
+            }
+        return summary
+
+
+class LoadRun:
+    """
+    Runs the profile's virtual users concurrently until the deadline.
+    Timings are kept by route template, failed setups don't count.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        profile: TrafficProfile,
+        users: int,
+        duration_seconds: float,
+        team_emails: list[str],
+        seed: int = 42,
+    ):
+        self.base_url = base_url
+        self.profile = profile
+        self.users = users
+        self.duration_seconds = duration_seconds
+        self.team_emails = team_emails
+        self.seed = seed
+        self.timings: dict[str, RouteTimings] = {}
+
+    async def run(self) -> dict[str, dict]:
+        limits = httpx.Limits(max_connections=self.users)
+        async with httpx.AsyncClient(
+            base_url=self.base_url, limits=limits, timeout=30
+        ) as client:
+            virtual_users = [
+                VirtualUser(
+                    email=self.team_emails[number % len(self.team_emails)],
+                    rng=random.Random(self.seed + number),
+                )
+                for number in range(self.users)
+            ]
+            if self.profile.authenticated:
+                await asyncio.gather(
+                    *(self._set_up(client, user) for user in virtual_users)
+                )
+
+            started_at = monotonic()
+            deadline = started_at + self.duration_seconds
+            await asyncio.gather(
+                *(self._loop(client, user, deadline) for user in virtual_users)
+            )
+            elapsed = monotonic() - started_at
+
+        return self.report(elapsed)
+
+    def report(self, elapsed_seconds: float) -> dict[str, dict]:
+        report = {
+            route: timings.summary(elapsed_seconds)
+            for route, timings in sorted(self.timings.items())
+        }
+        total = RouteTimings()
+        for timings in self.timings.values():
+            total.latencies_ms += timings.latencies_ms
+            total.errors += timings.errors
+        report["total"] = total.summary(elapsed_seconds)
+        return report
+
+    async def _set_up(self, client: httpx.AsyncClient, user: VirtualUser) -> None:
+        """Logs in and loads what the profile's requests refer to."""
+        response = await client.post(
+            "/users/login",
+            data={"username": user.email, "password": BENCHMARK_PASSWORD},
+        )
+        response.raise_for_status()
+        user.access_token = response.json()["access_token"]
+
+        players = await client.get("/players/all-name-and-shirt", headers=user.headers)
+        user.player_ids = [player["id"] for player in players.json()]
+
+        championships = await client.get("/championships/", headers=user.headers)
+        user.league_id = next(
+            (
+                championship["id"]
+                for championship in championships.json()
+                if championship["is_league_format"]
+                and championship["status"] == "em andamento"
+                and championship["name"].startswith("Liga")
+            ),
+            None,
+        )
+
+        games = await client.post(
+            "/games/filter", params={"limit": 20}, json={}, headers=user.headers
+        )
+        user.game_ids = [game["id"] for game in games.json()["items"]]
+
+    async def _loop(
+        self, client: httpx.AsyncClient, user: VirtualUser, deadline: float
+    ) -> None:
+        while monotonic() < deadline:
+            step = self.profile.pick(user.rng)
+            await self._send(client, user, step)
+            await asyncio.sleep(user.rng.uniform(*self.profile.think_time_seconds))
+
+    async def _send(
+        self, client: httpx.AsyncClient, user: VirtualUser, step: Step
+    ) -> None:
+        spec = step.request(user)
+        if not spec:
+            return
+
+        timings = self.timings.setdefault(step.name, RouteTimings())
+        start = perf_counter()
+        try:
+            response = await client.request(
+                step.method,
+                spec.url,
+                json=spec.json,
+                data=spec.data,
+                headers=user.headers,
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"{step.name} failed: {e!r}")
+            timings.latencies_ms.append((perf_counter() - start) * 1000)
+            timings.errors += 1
+            return
+
+        timings.latencies_ms.append((perf_counter() - start) * 1000)
+        if response.is_error:
+            timings.errors += 1
+        elif step.on_success:
+            step.on_success(user, response.json())
+
+
+def check_slos(report: dict[str, dict], slos: dict) -> list[str]:
+    """
+    :param slos: {"default": {...}, "routes": {"GET /players/": {...}}}, with
+        any of p50_ms, p95_ms, p99_ms, max_error_rate, min_throughput_rps
+        (the last one for "total"). Route entries override the default.
+    """
+    violations = []
+    for route, summary in report.items():
+        limits = {**slos.get("default", {}), **slos.get("routes", {}).get(route, {})}
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if metric in limits and summary.get(metric, 0) > limits[metric]:
+                violations.append(
+                    f"{route}: {metric} {summary[metric]} > {limits[metric]}"
+                )
+        if "max_error_rate" in limits and (
+            summary["error_rate"] > limits["max_error_rate"]
+        ):
+            violations.append(
+                f"{route}: error_rate {summary['error_rate']} > "
+                f"{limits['max_error_rate']}"
+            )
+        if (
+            route == "total"
+            and "min_throughput_rps" in limits
+            and (summary["throughput_rps"] < limits["min_throughput_rps"])
+        ):
+            violations.append(
+                f"total: throughput_rps {summary['throughput_rps']} < "
+                f"{limits['min_throughput_rps']}"
+            )
+    return violations
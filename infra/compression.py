@@ -0,0 +1,78 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import (
+    GZipMiddleware,
+    GZipResponder,
+    IdentityResponder,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "text/html",
+    "text/plain",
+    "text/csv",
+)
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    starlette's GZipMiddleware restricted to an allow-list of content types
+    (text/event-stream stays excluded, as in starlette).
+
+    Responses that already negotiated their encoding - a Content-Encoding or a
+    Vary: Accept-Encoding header, as set by PrecompressedBody - pass through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 6,
+        content_types: tuple[str, ...] = COMPRESSIBLE_CONTENT_TYPES,
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.content_types = content_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        responder: IdentityResponder
+        if "gzip" in headers.get("Accept-Encoding", ""):
+            responder = _GZipResponder(
+                self.app, self.minimum_size, compresslevel=self.compresslevel
+            )
+        else:
+            responder = _IdentityResponder(self.app, self.minimum_size)
+
+        responder.content_types = self.content_types
+        await responder(scope, receive, send)
+
+
+class _AllowListMixin:
+    content_types: tuple[str, ...]
+
+    async def send_with_compression(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            already_negotiated = "accept-encoding" in headers.get("vary", "").lower()
+
+            await super().send_with_compression(message)
+            self.content_encoding_set |= already_negotiated
+            self.content_type_is_excluded |= not content_type.startswith(
+                self.content_types
+            )
+            return
+
+        await super().send_with_compression(message)
+
+
+class _GZipResponder(_AllowListMixin, GZipResponder):
+    pass
+
+
+class _IdentityResponder(_AllowListMixin, IdentityResponder):
+    pass
@@ -1,14 +1,144 @@
-from loguru import logger
+import atexit
+import json
+import queue
 import sys
+import threading
+from typing import TextIO
+
+from loguru import logger
+
+from core.settings import ENV_CONFIG, LOG_QUEUE_SIZE
+from infra import request_context
+
+_TEXT_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+# QueuedJSONSink writes the records above it synchronously
+_QUEUED_LEVEL_NO = logger.level("INFO").no
+
+
+class QueuedJSONSink:
+    """
+    Loguru sink that hands the INFO records to a writer thread, which
+    serializes them as JSON lines, so a burst of logs never waits on stdout.
+    The queue is bounded: when the writer falls behind, new records are
+    dropped and counted by level instead of piling up in memory.
+
+    Warnings and errors are written on the caller's thread instead: a
+    serverless instance can be frozen right after the response, before the
+    writer gets to them, and those are the records that can't be lost.
+    """
+
+    def __init__(self, stream: TextIO, queue_size: int):
+        self.stream = stream
+        self.written = 0
+        self.dropped: dict[str, int] = {}
+        # Serializes the writer thread's and the callers' writes
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[tuple[dict, str] | None] = queue.Queue(
+            maxsize=queue_size
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, message) -> None:
+        # The message is the formatted traceback only (see configure_logger)
+        if message.record["level"].no > _QUEUED_LEVEL_NO:
+            self._write(message.record, str(message), flush=True)
+            return
+
+        try:
+            self._queue.put_nowait((message.record, str(message)))
+        except queue.Full:
+            level = message.record["level"].name
+            self.dropped[level] = self.dropped.get(level, 0) + 1
+
+    def stats(self) -> dict:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": dict(self.dropped),
+        }
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Writes what's queued and stops the writer (at exit)."""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            record, exception = item
+            self._write(record, exception, flush=self._queue.empty())
+        with self._lock:
+            self.stream.flush()
+
+    def _write(self, record: dict, exception: str, flush: bool) -> None:
+        line = json.dumps(_as_json(record, exception), default=str)
+        with self._lock:
+            self.stream.write(line)
+            self.stream.write("\n")
+            self.written += 1
+            if flush:
+                self.stream.flush()
+
+
+def _as_json(record: dict, exception: str) -> dict:
+    extra = dict(record["extra"])
+    log = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "logger": f"{record['name']}:{record['function']}:{record['line']}",
+        "request_id": extra.pop("request_id", None),
+    }
+    if extra:
+        log["extra"] = extra
+    if exception:
+        log["exception"] = exception
+    return log
+
+
+def _add_request_id(record: dict) -> None:
+    record["extra"].setdefault("request_id", request_context.request_id.get())
+
+
+_json_sink: QueuedJSONSink | None = None
 
 
 def configure_logger():
+    """
+    JSON lines through QueuedJSONSink in production and homolog, colorized
+    text on stdout elsewhere. Records carry the request's id either way.
+    """
+    global _json_sink
     logger.remove()
+    logger.configure(patcher=_add_request_id)
+    if ENV_CONFIG not in ("production", "homolog"):
+        logger.add(sys.stdout, level="INFO", format=_TEXT_FORMAT)
+        return
+
+    _json_sink = QueuedJSONSink(sys.stdout, LOG_QUEUE_SIZE)
     logger.add(
-        sys.stdout,
+        _json_sink,
         level="INFO",
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>",
+        # Only the traceback is formatted on the caller's thread, plainly
+        format=lambda _record: "{exception}",
+        backtrace=False,
+        diagnose=False,
     )
+    atexit.register(_json_sink.flush)
+
+
+def logging_stats() -> dict:
+    return {
+        **(_json_sink.stats() if _json_sink else {}),
+        "sampled_out_access_logs": request_context.sampled_out_access_logs,
+    }
@@ -0,0 +1,48 @@
+"""add availability counters to game
+
+Revision ID: 5c3e9a1f7b20
+Revises: a05d7613c6f9
+Create Date: 2026-10-19 11:02:17.284903
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5c3e9a1f7b20"
+down_revision: Union[str, None] = "a05d7613c6f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = {
+    "available_count": "available",
+    "not_available_count": "not_available",
+    "doubt_count": "doubt",
+}
+
+
+def upgrade() -> None:
+    for column in COUNTERS:
+        op.add_column(
+            "game",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    for column, status in COUNTERS.items():
+        op.execute(f"""
+            UPDATE game SET {column} = (
+                SELECT count(*) FROM game_player_availability
+                WHERE game_player_availability.game_id = game.id
+                AND game_player_availability.status = '{status}'
+                AND game_player_availability.deleted = false
+            )
+            """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in COUNTERS:
+        op.drop_column("game", column)
@@ -0,0 +1,53 @@
+"""hash logged_user refresh token
+
+Revision ID: 8d2b6e4c1a93
+Revises: 5c3e9a1f7b20
+Create Date: 2026-10-19 15:41:08.512377
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2b6e4c1a93"
+down_revision: Union[str, None] = "5c3e9a1f7b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "logged_user", sa.Column("token_hash", sa.String(length=64), nullable=True)
+    )
+    # Same digest as core.services.auth.hash_refresh_token: sessions stay valid
+    op.execute("""
+        UPDATE logged_user
+        SET token_hash = encode(sha256(convert_to(refresh_token, 'UTF8')), 'hex')
+        """)
+    op.alter_column("logged_user", "token_hash", nullable=False)
+    op.create_index(
+        op.f("ix_logged_user_token_hash"), "logged_user", ["token_hash"], unique=True
+    )
+    op.create_index(
+        op.f("ix_logged_user_expires_at"), "logged_user", ["expires_at"], unique=False
+    )
+    op.drop_constraint("uq_logged_user_refresh_token", "logged_user", type_="unique")
+    op.drop_column("logged_user", "refresh_token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens can't be recovered from the digests: every session is dropped
+    op.execute("DELETE FROM logged_user")
+    op.add_column(
+        "logged_user", sa.Column("refresh_token", sa.String(), nullable=False)
+    )
+    op.create_unique_constraint(
+        "uq_logged_user_refresh_token", "logged_user", ["refresh_token"]
+    )
+    op.drop_index(op.f("ix_logged_user_expires_at"), table_name="logged_user")
+    op.drop_index(op.f("ix_logged_user_token_hash"), table_name="logged_user")
+    op.drop_column("logged_user", "token_hash")
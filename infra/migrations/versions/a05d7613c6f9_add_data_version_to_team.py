@@ -0,0 +1,30 @@
+"""add data_version to team
+
+Revision ID: a05d7613c6f9
+Revises: ae24113733a4
+Create Date: 2026-10-19 09:12:41.503218
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a05d7613c6f9"
+down_revision: Union[str, None] = "ae24113733a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "team",
+        sa.Column("data_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("team", "data_version")
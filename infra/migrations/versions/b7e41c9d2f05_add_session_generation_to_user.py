@@ -0,0 +1,32 @@
+"""add session_generation to user
+
+Revision ID: b7e41c9d2f05
+Revises: 8d2b6e4c1a93
+Create Date: 2026-10-19 16:27:53.104622
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e41c9d2f05"
+down_revision: Union[str, None] = "8d2b6e4c1a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user",
+        sa.Column(
+            "session_generation", sa.Integer(), nullable=False, server_default="0"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("user", "session_generation")
@@ -0,0 +1,40 @@
+"""create request_profile table
+
+Revision ID: c93f1d27a6e4
+Revises: b7e41c9d2f05
+Create Date: 2026-10-19 18:02:11.408215
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c93f1d27a6e4"
+down_revision: Union[str, None] = "b7e41c9d2f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "request_profile",
+        sa.Column("id", sa.String(length=32), primary_key=True, nullable=False),
+        sa.Column("route", sa.String(), nullable=False),
+        sa.Column("team_id", sa.Uuid(), nullable=False),
+        sa.Column("trigger", sa.String(length=10), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_ms", sa.Float(), nullable=False),
+        sa.Column("samples", sa.Integer(), nullable=False),
+        sa.Column("collapsed", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_request_profile_expires_at", "request_profile", ["expires_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_request_profile_expires_at", table_name="request_profile")
+    op.drop_table("request_profile")
@@ -0,0 +1,129 @@
+"""
+A sampling profiler for a single request: a background thread reads the
+request thread's stack every few milliseconds (sys._current_frames), so the
+profiled code runs untouched, and counts the stacks in the collapsed format
+flamegraph.pl, speedscope and inferno read:
+
+    main (api/main.py:10);create_player (bounded_contexts/...:42) 17
+
+The profiles are saved in the request_profile table, where any instance
+reads them, for PROFILES_TTL_DAYS.
+"""
+
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+from typing import Iterator
+
+from sqlalchemy import delete
+from sqlalchemy.orm import defer
+from sqlmodel import select
+
+from core.models.request_profile import RequestProfile
+from core.repo import BaseRepo
+from core.settings import PROFILER_INTERVAL_MS, PROFILES_LISTED, PROFILES_TTL_DAYS
+from libs.datetime import utcnow
+
+_PROJECT_ROOT = str(Path(__file__).parent.parent) + "/"
+_MAX_STACK_DEPTH = 200
+
+
+class SamplingProfiler:
+    def __init__(self, thread_id: int, interval_ms: float = PROFILER_INTERVAL_MS):
+        self.thread_id = thread_id
+        self.interval_seconds = interval_ms / 1000
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._sampler.join()
+
+    def collapsed(self) -> str:
+        return "\n".join(
+            f"{stack} {count}" for stack, count in self.stacks.most_common()
+        )
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval_seconds):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame:
+                self.stacks[collapse_stack(frame)] += 1
+
+
+def collapse_stack(frame: FrameType) -> str:
+    """The frame's stack, outermost call first."""
+    frames = []
+    current: FrameType | None = frame
+    while current and len(frames) < _MAX_STACK_DEPTH:
+        code = current.f_code
+        frames.append(
+            f"{code.co_qualname} ({_short_path(code.co_filename)}:{current.f_lineno})"
+        )
+        current = current.f_back
+    return ";".join(reversed(frames))
+
+
+def _short_path(filename: str) -> str:
+    if "site-packages/" in filename:
+        return filename.rsplit("site-packages/", 1)[1]
+    return filename.removeprefix(_PROJECT_ROOT)
+
+
+class RequestProfileWriteRepo(BaseRepo):
+    def create(self, profile: RequestProfile) -> None:
+        """Also deletes the expired profiles, so no job has to."""
+        profile.expires_at = profile.started_at + timedelta(days=PROFILES_TTL_DAYS)
+        self.session.exec(
+            delete(RequestProfile).where(  # type: ignore
+                RequestProfile.expires_at <= utcnow()
+            )
+        )
+        self.session.add(profile)
+        self.session.commit()
+
+
+class RequestProfileReadRepo(BaseRepo):
+    def get_by_id(self, profile_id: str) -> RequestProfile | None:
+        return self.session.exec(
+            select(RequestProfile).where(
+                RequestProfile.id == profile_id,
+                RequestProfile.expires_at > utcnow(),
+            )
+        ).first()
+
+    def get_latest(self, limit: int = PROFILES_LISTED) -> list[RequestProfile]:
+        """Newest first, without the collapsed stacks."""
+        return self.session.exec(
+            select(RequestProfile)
+            .where(RequestProfile.expires_at > utcnow())
+            .order_by(RequestProfile.started_at.desc())
+            .limit(limit)
+            .options(defer(RequestProfile.collapsed))
+        ).all()
+
+
+@contextmanager
+def profiled(profile: RequestProfile) -> Iterator[RequestProfile]:
+    """Runs the sampling profiler on the calling thread, filling the profile."""
+    profiler = SamplingProfiler(threading.get_ident())
+    start = perf_counter()
+    profiler.start()
+    try:
+        yield profile
+    finally:
+        profiler.stop()
+        profile.duration_ms = round((perf_counter() - start) * 1000, 2)
+        profile.samples = profiler.stacks.total()
+        profile.collapsed = profiler.collapsed()
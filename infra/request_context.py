@@ -0,0 +1,74 @@
+import random
+import re
+from contextvars import ContextVar
+from time import perf_counter
+from uuid import uuid4
+
+from loguru import logger
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.settings import ACCESS_LOG_ROUTE_SAMPLE_RATES, ACCESS_LOG_SAMPLE_RATE
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Ids from the client (or a proxy) are kept only when they look like one
+_VALID_REQUEST_ID = re.compile(r"[\w.:-]{1,64}")
+
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+sampled_out_access_logs = 0
+
+
+class RequestContextMiddleware:
+    """
+    Gives each request an id - the client's X-Request-ID or a new one - that
+    every log record made while handling it carries and the response echoes.
+
+    Writes the access log, sampled per route (ACCESS_LOG_ROUTE_SAMPLE_RATES)
+    since the dashboard routes make most of it. Server errors are always kept.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming_id = Headers(scope=scope).get(REQUEST_ID_HEADER, "")
+        current_id = (
+            incoming_id if _VALID_REQUEST_ID.fullmatch(incoming_id) else uuid4().hex
+        )
+        token = request_id.set(current_id)
+        status_code = 500
+        start = perf_counter()
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = current_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            _access_log(scope, status_code, (perf_counter() - start) * 1000)
+            request_id.reset(token)
+
+
+def _access_log(scope: Scope, status_code: int, duration_ms: float) -> None:
+    global sampled_out_access_logs
+    route = scope.get("route")
+    route_name = f"{scope['method']} {route.path if route else scope['path']}"
+    rate = ACCESS_LOG_ROUTE_SAMPLE_RATES.get(route_name, ACCESS_LOG_SAMPLE_RATE)
+    if status_code < 500 and random.random() >= rate:
+        sampled_out_access_logs += 1
+        return
+
+    logger.bind(
+        route=route_name,
+        status_code=status_code,
+        duration_ms=round(duration_ms, 2),
+        sample_rate=rate,
+    ).info(f"{route_name} {status_code} {duration_ms:.0f}ms")
@@ -0,0 +1,126 @@
+"""
+Compares FastAPI's response_model serialization with the pydantic-core path
+(core/responses.py) on the payloads of a 500-game, 60-player team.
+
+Run with: python -m infra.scripts.benchmark_json_responses
+"""
+
+import asyncio
+from datetime import timedelta
+from statistics import median
+from time import perf_counter
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from api.main import app
+from bounded_contexts.game_and_stats.game.schemas import (
+    GameResponse,
+    GamesPageResponse,
+    NameAndId,
+)
+from bounded_contexts.player.models import PlayerPositions
+from bounded_contexts.player.schemas import PlayerResponse
+from core.responses import PydanticJSONResponse
+from libs.datetime import brasilia_now
+
+GAMES = 500
+PLAYERS = 60
+ROUNDS = 50
+
+
+def _games_page() -> GamesPageResponse:
+    championships = [NameAndId(id=uuid4(), name=f"Campeonato {i}") for i in range(10)]
+    now = brasilia_now()
+    games = [
+        GameResponse(
+            id=uuid4(),
+            championship=championships[i % len(championships)],
+            adversary=f"Adversário {i}",
+            date_hour=now - timedelta(days=7 * i),
+            round=i % 38 + 1,
+            stage=None,
+            is_home=i % 2 == 0,
+            is_wo=False,
+            team_score=i % 5,
+            adversary_score=i % 3,
+            team_penalty_score=None,
+            adversary_penalty_score=None,
+        )
+        for i in range(GAMES)
+    ]
+    return GamesPageResponse(items=games, total=GAMES, limit=GAMES, offset=0)
+
+
+def _players() -> list[PlayerResponse]:
+    positions = list(PlayerPositions)
+    return [
+        PlayerResponse(
+            id=uuid4(),
+            name=f"Jogador {i}",
+            image_url=f"https://example.com/players/{i}.png",
+            shirt_number=i,
+            position=positions[i % len(positions)],
+            played=GAMES // 2,
+            goals=i * 3,
+            assists=i * 2,
+            yellow_cards=i % 7,
+            red_cards=i % 2,
+            mvps=i % 11,
+            has_before_system_stats=False,
+        )
+        for i in range(PLAYERS)
+    ]
+
+
+def _response_field(path: str, method: str):
+    for route in app.routes:
+        if (
+            isinstance(route, APIRoute)
+            and route.path == path
+            and method in route.methods
+        ):
+            return route.response_field
+    raise ValueError(f"Route not found: {method} {path}")
+
+
+async def _time_ms(render) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = perf_counter()
+        await render()
+        timings.append((perf_counter() - start) * 1000)
+    return median(timings)
+
+
+async def _run(name: str, content, path: str, method: str) -> None:
+    field = _response_field(path, method)
+
+    async def fastapi_path() -> bytes:
+        # What FastAPI does when a route returns models for its response_model
+        serialized = await serialize_response(field=field, response_content=content)
+        return JSONResponse(serialized).body
+
+    async def pydantic_core_path() -> bytes:
+        return PydanticJSONResponse(content).body
+
+    assert len(await fastapi_path()) == len(await pydantic_core_path())
+
+    fastapi_ms = await _time_ms(fastapi_path)
+    pydantic_core_ms = await _time_ms(pydantic_core_path)
+    print(
+        f"{name:<20} response_model: {fastapi_ms:7.2f} ms | "
+        f"pydantic-core: {pydantic_core_ms:7.2f} ms | "
+        f"{fastapi_ms / pydantic_core_ms:5.1f}x"
+    )
+
+
+async def _main() -> None:
+    print(f"Median of {ROUNDS} rounds\n")
+    await _run(f"{GAMES} games", _games_page(), "/games/filter", "POST")
+    await _run(f"{PLAYERS} players", _players(), "/players/", "GET")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
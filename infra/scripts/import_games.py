@@ -0,0 +1,43 @@
+"""
+Imports a team's historical games from a CSV or JSON file (format in
+bounded_contexts/game_and_stats/game_import/parser.py), created by the team's
+super user. Uses the DATABASE_URL database.
+
+python -m infra.scripts.import_games <team_id> <file> [--dry-run]
+"""
+
+import argparse
+from pathlib import Path
+from uuid import UUID
+
+from bounded_contexts.game_and_stats.game_import.service import import_games
+from bounded_contexts.user.repo import UserReadRepo
+from infra.database import get_session
+
+
+def _import(team_id: UUID, path: Path, dry_run: bool) -> None:
+    session = next(get_session())
+    try:
+        super_user = UserReadRepo(session).get_team_super_user(team_id)
+        if not super_user:
+            raise SystemExit(f"Team {team_id} has no super user")
+
+        report = import_games(
+            path.read_bytes(), path.name, super_user, session, dry_run
+        )
+    finally:
+        session.close()
+
+    print(f"Games imported: {report.imported}")
+    for row_error in report.errors:
+        print(f"Row {row_error.row}: {' '.join(row_error.errors)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Historical games import")
+    parser.add_argument("team_id", type=UUID)
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args()
+    _import(args.team_id, args.file, args.dry_run)
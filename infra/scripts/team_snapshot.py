@@ -0,0 +1,51 @@
+"""
+Exports a team's rows to a snapshot file, or restores one (replacing the
+team's current rows). Uses the DATABASE_URL database.
+
+python -m infra.scripts.team_snapshot export <team_id> <file>
+python -m infra.scripts.team_snapshot restore <file> [--team-id <team_id>]
+"""
+
+import argparse
+from pathlib import Path
+from uuid import UUID
+
+from core.services.team_snapshot import export_team_snapshot, restore_team_snapshot
+from infra.database import get_session
+
+
+def _export(team_id: UUID, path: Path) -> None:
+    session = next(get_session())
+    try:
+        path.write_bytes(export_team_snapshot(team_id, session))
+    finally:
+        session.close()
+    print(f"Snapshot saved to {path} ({path.stat().st_size} bytes)")
+
+
+def _restore(path: Path, team_id: UUID | None) -> None:
+    session = next(get_session())
+    try:
+        report = restore_team_snapshot(path.read_bytes(), session, team_id)
+    finally:
+        session.close()
+    print(f"Snapshot restored: {report}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Team snapshot and restore")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export")
+    export_parser.add_argument("team_id", type=UUID)
+    export_parser.add_argument("file", type=Path)
+
+    restore_parser = commands.add_parser("restore")
+    restore_parser.add_argument("file", type=Path)
+    restore_parser.add_argument("--team-id", type=UUID, default=None)
+
+    args = parser.parse_args()
+    if args.command == "export":
+        _export(args.team_id, args.file)
+    else:
+        _restore(args.file, args.team_id)
@@ -0,0 +1,437 @@
+"""
+Request tracing: a span for the request, each service function and repo
+method and each SQL statement, exported to an OTLP/HTTP collector (e.g. a
+local Jaeger or otel-collector on :4318) with the JSON encoding.
+
+Off unless OTLP_TRACES_ENDPOINT is set. The service and repo wrappers are
+installed only then, and record nothing outside a traced request.
+
+The slow query log doesn't depend on it: statements over
+SLOW_QUERY_THRESHOLD_MS are always logged, with the types of the bound
+parameters instead of their values.
+"""
+
+import importlib
+import inspect
+import os
+import pkgutil
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter, time_ns
+from types import ModuleType
+from typing import Any, Callable, Iterator
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.repo import BaseRepo
+from core.settings import (
+    OTLP_TRACES_ENDPOINT,
+    SLOW_QUERY_THRESHOLD_MS,
+    TRACE_EXPORT_QUEUE_SIZE,
+    TRACE_MAX_SPANS,
+)
+
+SERVICE_NAME = "team-manager-backend"
+# Where the service functions live, instrumented by instrument_services
+SERVICE_PACKAGES = ("bounded_contexts", "core.services")
+
+_SPAN_KIND_INTERNAL = 1
+_SPAN_KIND_SERVER = 2
+_SPAN_KIND_CLIENT = 3
+_STATUS_ERROR = 2
+
+
+@dataclass
+class Trace:
+    id: str
+    # Copied to every span on export (team_id, http.route)
+    attributes: dict[str, Any] = field(default_factory=dict)
+    spans: list["Span"] = field(default_factory=list)
+    dropped_spans: int = 0
+
+
+@dataclass
+class Span:
+    name: str
+    trace: Trace
+    id: str
+    parent_id: str | None
+    kind: int = _SPAN_KIND_INTERNAL
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_trace() -> Trace | None:
+    span = _current_span.get()
+    return span.trace if span else None
+
+
+def set_trace_attribute(key: str, value: Any) -> None:
+    """Tags the whole trace, e.g. with the authenticated user's team_id."""
+    trace = current_trace()
+    if trace:
+        trace.attributes[key] = value
+
+
+@contextmanager
+def start_trace(name: str, **attributes) -> Iterator[Span]:
+    trace = Trace(id=os.urandom(16).hex())
+    root = Span(
+        name,
+        trace,
+        id=os.urandom(8).hex(),
+        parent_id=None,
+        kind=_SPAN_KIND_SERVER,
+        attributes=attributes,
+    )
+    try:
+        with _recorded(root):
+            yield root
+    finally:
+        if _exporter:
+            _exporter.export(trace)
+
+
+@contextmanager
+def span(name: str, kind: int = _SPAN_KIND_INTERNAL, **attributes) -> Iterator[None]:
+    """A child of the current span, nothing outside a trace."""
+    parent = _current_span.get()
+    if not parent:
+        yield
+        return
+
+    trace = parent.trace
+    if len(trace.spans) >= TRACE_MAX_SPANS:
+        trace.dropped_spans += 1
+        yield
+        return
+
+    child = Span(
+        name,
+        trace,
+        id=os.urandom(8).hex(),
+        parent_id=parent.id,
+        kind=kind,
+        attributes=attributes,
+    )
+    with _recorded(child):
+        yield
+
+
+@contextmanager
+def _recorded(span_: Span) -> Iterator[Span]:
+    token = _current_span.set(span_)
+    span_.start_ns = time_ns()
+    try:
+        yield span_
+    except BaseException as e:
+        span_.error = repr(e)
+        raise
+    finally:
+        span_.end_ns = time_ns()
+        _current_span.reset(token)
+        span_.trace.spans.append(span_)
+
+
+def traced(function: Callable, name: str | None = None) -> Callable:
+    name = name or f"{function.__module__}.{function.__qualname__}"
+
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            if not _current_span.get():
+                return await function(*args, **kwargs)
+            with span(name):
+                return await function(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _current_span.get():
+            return function(*args, **kwargs)
+        with span(name):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+# -------- Instrumentation --------
+def instrument_repos() -> None:
+    """Wraps the public methods of every repo imported so far."""
+    for repo in _subclasses(BaseRepo):
+        for attribute, value in list(vars(repo).items()):
+            if attribute.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(repo, attribute, traced(value, f"{repo.__name__}.{attribute}"))
+
+
+def _subclasses(cls: type) -> Iterator[type]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _subclasses(subclass)
+
+
+def instrument_services() -> None:
+    """
+    Wraps the public functions of the service modules. Other modules that
+    imported them by name (from ... import create_player) get the wrapped
+    function too, the routers' Depends keep the original.
+    """
+    wrapped = {}
+    for module in _service_modules():
+        for attribute, value in list(vars(module).items()):
+            if (
+                attribute.startswith("_")
+                or not inspect.isfunction(value)
+                or value.__module__ != module.__name__
+                # Only the creation of their iterator would be timed
+                or inspect.isgeneratorfunction(value)
+                or inspect.isasyncgenfunction(value)
+            ):
+                continue
+            wrapped[value] = traced(value)
+
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith(("bounded_contexts", "core", "api")):
+            continue
+        for attribute, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value in wrapped:
+                setattr(module, attribute, wrapped[value])
+
+
+def _service_modules() -> Iterator[ModuleType]:
+    for package_name in SERVICE_PACKAGES:
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.walk_packages(
+            package.__path__, prefix=f"{package_name}."
+        ):
+            if package_name == "core.services" or module_info.name.endswith(".service"):
+                yield importlib.import_module(module_info.name)
+
+
+class TracingMiddleware:
+    """The request's root span, named by the route template once routed."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        with start_trace(
+            f"{method} {scope['path']}", **{"http.method": method}
+        ) as root:
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    root.attributes["http.status_code"] = message["status"]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = scope.get("route")
+                if route:
+                    root.name = f"{method} {route.path}"
+                    root.trace.attributes["http.route"] = route.path
+
+
+# -------- SQL --------
+def install_query_hooks(engine: Engine) -> None:
+    """The slow query log and, inside a trace, a span per statement."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # On the statement's execution context, dropped with it when it fails
+    if context is not None:
+        context._trace_start = (perf_counter(), time_ns())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_trace_start", None)
+    if not started:
+        return
+    started_at, start_ns = started
+    elapsed_ms = (perf_counter() - started_at) * 1000
+
+    if elapsed_ms >= SLOW_QUERY_THRESHOLD_MS:
+        trace = current_trace()
+        logger.bind(trace_id=trace.id if trace else None).warning(
+            f"Slow query ({elapsed_ms:.0f} ms): {' '.join(statement.split())} "
+            f"| parameters: {parameter_shapes(parameters, executemany)}"
+        )
+
+    parent = _current_span.get()
+    if not parent:
+        return
+    trace = parent.trace
+    if len(trace.spans) >= TRACE_MAX_SPANS:
+        trace.dropped_spans += 1
+        return
+    trace.spans.append(
+        Span(
+            f"SQL {statement.split(None, 1)[0].upper()}",
+            trace,
+            id=os.urandom(8).hex(),
+            parent_id=parent.id,
+            kind=_SPAN_KIND_CLIENT,
+            start_ns=start_ns,
+            end_ns=time_ns(),
+            attributes={
+                "db.system": conn.dialect.name,
+                "db.statement": statement,
+                "db.parameters": parameter_shapes(parameters, executemany),
+            },
+        )
+    )
+
+
+def parameter_shapes(parameters, executemany: bool = False) -> str:
+    """The bound parameters' types (and sizes), never their values."""
+    if executemany:
+        first = parameters[0] if parameters else ()
+        return f"{len(parameters)} x {parameter_shapes(first)}"
+    if isinstance(parameters, dict):
+        return str({name: _shape(value) for name, value in parameters.items()})
+    return str([_shape(value) for value in parameters or ()])
+
+
+def _shape(value: Any) -> str:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+# -------- Export --------
+class OTLPExporter:
+    """
+    Posts the finished traces to the collector from a background thread, so
+    the request never waits on it. When the collector falls behind, traces
+    over the queue size are dropped and counted.
+    """
+
+    def __init__(self, endpoint: str, queue_size: int, batch_size: int = 50):
+        self.url = f"{endpoint.rstrip('/')}/v1/traces"
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue: queue.Queue[Trace] = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(
+            target=self._run, name="otlp-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, trace: Trace) -> None:
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        with httpx.Client(timeout=5) as client:
+            while True:
+                traces = [self._queue.get()]
+                while len(traces) < self.batch_size and not self._queue.empty():
+                    traces.append(self._queue.get_nowait())
+                try:
+                    client.post(self.url, json=otlp_payload(traces))
+                except httpx.HTTPError as e:
+                    logger.warning(f"Trace export failed: {e!r}")
+
+
+def otlp_payload(traces: list[Trace]) -> dict:
+    """The OTLP/HTTP JSON encoding of ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": SERVICE_NAME})
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [
+                            _otlp_span(span_, trace)
+                            for trace in traces
+                            for span_ in trace.spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _otlp_span(span_: Span, trace: Trace) -> dict:
+    attributes = {**trace.attributes, **span_.attributes}
+    if span_.parent_id is None and trace.dropped_spans:
+        attributes["dropped_spans"] = trace.dropped_spans
+
+    otlp_span = {
+        "traceId": trace.id,
+        "spanId": span_.id,
+        "name": span_.name,
+        "kind": span_.kind,
+        "startTimeUnixNano": str(span_.start_ns),
+        "endTimeUnixNano": str(span_.end_ns),
+        "attributes": _otlp_attributes(attributes),
+    }
+    if span_.parent_id:
+        otlp_span["parentSpanId"] = span_.parent_id
+    if span_.error:
+        otlp_span["status"] = {"code": _STATUS_ERROR, "message": span_.error}
+    return otlp_span
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+def _otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_exporter: OTLPExporter | None = None
+
+
+def configure_tracing(app: FastAPI, engine: Engine) -> None:
+    global _exporter
+    install_query_hooks(engine)
+    if not OTLP_TRACES_ENDPOINT:
+        return
+
+    instrument_repos()
+    instrument_services()
+    app.add_middleware(TracingMiddleware)
+    _exporter = OTLPExporter(OTLP_TRACES_ENDPOINT, TRACE_EXPORT_QUEUE_SIZE)
+    logger.info(f"Tracing to {OTLP_TRACES_ENDPOINT}")
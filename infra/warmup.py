@@ -0,0 +1,80 @@
+from time import perf_counter
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from loguru import logger
+from pydantic import BaseModel
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import configure_mappers
+
+
+def warm_up(app: FastAPI, engine: Engine) -> dict[str, float]:
+    """
+    Moves the cold start costs out of the first user request: SQLAlchemy mapper
+    configuration (cross-module relationships), the first pool connection and
+    the pydantic validators/serializers of every route model.
+
+    Never raises - a failing step is logged and the app keeps starting.
+
+    :return: Duration of each step (and the total) in milliseconds.
+    """
+    metrics = {}
+    start = perf_counter()
+
+    metrics["mappers_ms"] = _timed(configure_mappers)
+    metrics["database_ms"] = _timed(lambda: _open_pool_connection(engine))
+    metrics["validators_ms"] = _timed(lambda: _build_route_validators(app))
+    metrics["total_ms"] = round((perf_counter() - start) * 1000, 2)
+
+    logger.info(f"Warmup finished: {metrics}")
+    return metrics
+
+
+def _timed(step) -> float | None:
+    start = perf_counter()
+    try:
+        step()
+    except Exception as e:
+        logger.warning(f"Warmup step failed: {e}")
+        return None
+    return round((perf_counter() - start) * 1000, 2)
+
+
+def _open_pool_connection(engine: Engine) -> None:
+    # The connection goes back to the pool, so the first request reuses it
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def _build_route_validators(app: FastAPI) -> None:
+    for model in _route_models(app):
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        # Accessing them forces pydantic-core to finish any deferred build
+        model.__pydantic_validator__
+        model.__pydantic_serializer__
+
+
+def _route_models(app: FastAPI) -> set[type[BaseModel]]:
+    models = set()
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+
+        fields = [route.response_field, route.body_field]
+        fields += [param for param in route.dependant.body_params]
+        for field in fields:
+            if field is None:
+                continue
+            models.update(_models_in_annotation(field.field_info.annotation))
+    return models
+
+
+def _models_in_annotation(annotation) -> set[type[BaseModel]]:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {annotation}
+
+    models = set()
+    for arg in getattr(annotation, "__args__", ()):
+        models.update(_models_in_annotation(arg))
+    return models
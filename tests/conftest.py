@@ -17,6 +17,7 @@ from bounded_contexts.game_and_stats.models import (
     AvailabilityStatus,
 )
 from bounded_contexts.terms_of_use.models import TermsOfUse
+from bounded_contexts.terms_of_use.service import invalidate_active_terms_cache
 from core.enums import StageOptions
 from bounded_contexts.player.models import Player, PlayerPositions
 from bounded_contexts.team.models import Team
@@ -45,6 +46,13 @@ def override_dependency():
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_in_process_caches():
+    # Mocks write straight to the db, bypassing the invalidation paths
+    invalidate_active_terms_cache()
+    yield
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_database():
     init_test_db()
@@ -1,12 +1,18 @@
 from datetime import date, timedelta, datetime
 
+import time_machine
 from fastapi.testclient import TestClient
+from sqlmodel import select
+
 from api.main import app
 from bounded_contexts.team.schemas import RegisterTeamResponse
+from core.models.request_profile import RequestProfile
+from core.services import profiling
 from core.settings import (
     MIGRATIONS_PWD,
     FRIENDLY_CHAMPIONSHIP_NAME,
     BEFORE_SYSTEM_CHAMPIONSHIP_NAME,
+    PROFILES_TTL_DAYS,
 )
 from libs.datetime import brasilia_now
 
@@ -66,3 +72,110 @@ def test_renew_subscription(mock_user_gen, mock_team_gen):
         "2025-12-30": ["Renew1"],
         "2026-01-15": ["Renew2"],
     }
+
+
+def test_team_snapshot_and_restore(
+    clean_db,
+    mock_user_gen,
+    mock_player_gen,
+    mock_game_player_stat,
+    mock_game_player_availability,
+):
+    mock_user_gen(is_admin=False)
+    response = client.get(f"/admin/teams/{mock_player_gen().team_id}/snapshot")
+    assert response.status_code == 403
+
+    user = mock_user_gen(is_super_admin=True)
+    team_id = user.team_id
+
+    response = client.get(f"/admin/teams/{team_id}/snapshot")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    snapshot = response.content
+
+    players_before = client.get("/players").json()
+    games_before = client.post("/games/filter", json={}).json()
+
+    # A bad change to roll back
+    for player in players_before:
+        response = client.delete(f"/players/{player['id']}")
+        assert response.status_code == 204
+    assert client.get("/players").json() == []
+
+    response = client.post(
+        f"/admin/teams/restore/{MIGRATIONS_PWD}",
+        files={"snapshot": ("snapshot.json.gz", snapshot, "application/gzip")},
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["team_id"] == str(team_id)
+    assert report["rows"]["player"] == len(players_before)
+    assert report["rows"]["user"] == 2
+    assert report["rows"]["game_player_stat"] == 1
+    assert report["rows"]["game_player_availability"] == 1
+
+    assert client.get("/players").json() == players_before
+    assert client.post("/games/filter", json={}).json() == games_before
+
+    response = client.post(
+        f"/admin/teams/restore/{MIGRATIONS_PWD}",
+        files={"snapshot": ("snapshot.json.gz", b"not a snapshot", "application/gzip")},
+    )
+    assert response.status_code == 400
+
+
+def test_profile_requests(
+    clean_db,
+    db_session,
+    mock_user_gen,
+    mock_player_gen,
+    mock_friendly_championship,
+    monkeypatch,
+):
+    mock_user_gen(is_admin=True)
+    mock_player_gen()
+    headers = {"X-Profile-Request": "1"}
+    response = client.post("/players/stats-filter", json={}, headers=headers)
+    assert response.status_code == 403
+    assert client.get("/admin/profiles").status_code == 403
+
+    mock_user_gen(is_super_admin=True)
+    response = client.post("/players/stats-filter", json={}, headers=headers)
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+
+    # Sampled, without the header
+    monkeypatch.setattr(profiling, "PROFILER_SAMPLE_RATE", 1.0)
+    etag = client.get("/players").headers["etag"]
+    response = client.post("/games/filter", json={})
+    assert response.status_code == 200
+    sampled_id = response.headers["X-Profile-Id"]
+    # Saving a profile isn't a write to the team's data
+    assert client.get("/players", headers={"If-None-Match": etag}).status_code == 304
+    assert "X-Profile-Id" not in client.get("/players").headers
+
+    response = client.get("/admin/profiles")
+    assert response.status_code == 200
+    sampled, profile = response.json()[:2]
+    assert sampled["id"] == sampled_id
+    assert sampled["route"] == "POST /games/filter"
+    assert sampled["trigger"] == "sampled"
+    assert profile["id"] == profile_id
+    assert profile["route"] == "POST /players/stats-filter"
+    assert profile["trigger"] == "header"
+
+    response = client.get(f"/admin/profiles/{profile_id}")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    counts = [int(line.rsplit(" ", 1)[1]) for line in response.text.splitlines()]
+    assert sum(counts) == profile["samples"]
+
+    assert client.get("/admin/profiles/unknown").status_code == 404
+
+    # Saved in the db for PROFILES_TTL_DAYS, the next one clears the expired
+    with time_machine.travel(datetime.now() + timedelta(days=PROFILES_TTL_DAYS)):
+        assert client.get("/admin/profiles").json() == []
+        assert client.get(f"/admin/profiles/{profile_id}").status_code == 404
+
+        client.post("/players/stats-filter", json={}, headers=headers)
+    assert len(db_session.exec(select(RequestProfile)).all()) == 1
@@ -3,6 +3,7 @@ from uuid import uuid4
 
 from fastapi.testclient import TestClient
 import time_machine
+from sqlalchemy import event
 
 from api.main import app
 from bounded_contexts.championship.models import (
@@ -10,8 +11,16 @@ from bounded_contexts.championship.models import (
     ChampionshipFormats,
 )
 from core.enums import StageOptions
-from bounded_contexts.championship.schemas import ChampionshipResponse
+from bounded_contexts.championship.schemas import (
+    ChampionshipResponse,
+    ChampionshipSummary,
+)
+from bounded_contexts.game_and_stats.game.schemas import GameStatsIn
+from bounded_contexts.game_and_stats.game.validation import GameValidationContext
+from bounded_contexts.game_and_stats.models import StatOptions
+from bounded_contexts.game_and_stats.stats.service import update_game_stats
 from core.settings import FRIENDLY_CHAMPIONSHIP_NAME, BEFORE_SYSTEM_CHAMPIONSHIP_NAME
+from tests.database import engine
 
 client = TestClient(app)
 
@@ -72,20 +81,33 @@ def test_get_championships(mock_championship_gen):
         start_date=date(2024, 12, 25),
     )
 
-    response = client.get("/championships")
-    assert response.status_code == 200
+    statements = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
 
-    names_in_correct_order = [
-        name_in_progress_champ2,
-        name_in_progress_champ,
-        name_upcoming_champ,
-        name_finished_champ,
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = client.get("/championships")
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    assert response.status_code == 200
+    # Besides the team data_version one (conditional GET)
+    assert len([s for s in statements if "FROM championship" in s]) == 1
+
+    names_and_status_in_correct_order = [
+        (name_in_progress_champ2, ChampionshipStatus.EM_ANDAMENTO),
+        (name_in_progress_champ, ChampionshipStatus.EM_ANDAMENTO),
+        (name_upcoming_champ, ChampionshipStatus.NAO_INICIADO),
+        (name_finished_champ, ChampionshipStatus.FINALIZADO),
     ]
 
     response_body = response.json()
     assert len(response_body) == 4
     for index, champ in enumerate(response_body):
-        assert champ["name"] == names_in_correct_order[index]
+        assert (champ["name"], champ["status"]) == (
+            names_and_status_in_correct_order[index]
+        )
 
 
 @time_machine.travel("2025-01-01")
@@ -290,3 +312,114 @@ def test_filter_championships(clean_db, mock_championship_gen):
     assert len(response_body) == 2
     assert response_body[0]["id"] == str(champ1.id)
     assert response_body[1]["id"] == str(champ4.id)
+
+
+def test_get_championships_summaries(
+    clean_db,
+    db_session,
+    mock_user,
+    mock_championship_gen,
+    mock_game_gen,
+    mock_player_gen,
+    mock_game_player_stat_gen,
+):
+    knockout = mock_championship_gen()
+    league = mock_championship_gen(is_league_format=True)
+    empty = mock_championship_gen()
+    quarter_final = mock_game_gen(
+        championship_id=knockout.id,
+        stage=StageOptions.QUARTAS_DE_FINAL,
+        team_score=3,
+        adversary_score=1,
+    )
+    mock_game_gen(
+        championship_id=knockout.id,
+        stage=StageOptions.SEMI_FINAL,
+        team_score=0,
+        adversary_score=0,
+    )
+    mock_game_gen(
+        championship_id=knockout.id,
+        stage=StageOptions.FINAL,
+        team_score=1,
+        adversary_score=2,
+    )
+    # Not played yet
+    mock_game_gen(championship_id=knockout.id, stage=StageOptions.FINAL)
+    mock_game_gen(
+        championship_id=league.id,
+        stage=None,
+        round=1,
+        is_wo=True,
+        team_score=0,
+        adversary_score=0,
+    )
+    ana, bia = mock_player_gen(name="Ana"), mock_player_gen(name="Bia")
+    for player, quantity in ((ana, 2), (bia, 2)):
+        mock_game_player_stat_gen(
+            game_id=quarter_final.id,
+            player_id=player.id,
+            stat=StatOptions.GOAL,
+            quantity=quantity,
+        )
+    mock_game_player_stat_gen(
+        game_id=quarter_final.id, player_id=bia.id, stat=StatOptions.ASSIST
+    )
+
+    response = client.get("/championships/summaries")
+    assert response.status_code == 200
+    summaries = {
+        summary["championship_id"]: ChampionshipSummary.model_validate(summary)
+        for summary in response.json()
+    }
+    # mock_championship (from mock_game_gen) included
+    assert len(summaries) == 4
+
+    summary = summaries[str(knockout.id)]
+    assert (
+        summary.games,
+        summary.wins,
+        summary.draws,
+        summary.losses,
+        summary.goals_for,
+        summary.goals_against,
+    ) == (4, 1, 1, 1, 4, 3)
+    assert [(stage.stage, stage.games) for stage in summary.stages] == [
+        (StageOptions.QUARTAS_DE_FINAL, 1),
+        (StageOptions.SEMI_FINAL, 1),
+        (StageOptions.FINAL, 2),
+    ]
+    assert summary.furthest_stage == StageOptions.FINAL
+    # Tied
+    assert [(leader.player_name, leader.total) for leader in summary.top_scorers] == [
+        ("Ana", 2),
+        ("Bia", 2),
+    ]
+    assert [leader.player_id for leader in summary.top_assisters] == [bia.id]
+    assert summary.top_mvps == []
+
+    summary = summaries[str(league.id)]
+    assert (summary.games, summary.wins, summary.stages) == (1, 1, [])
+    assert summaries[str(empty.id)].games == 0
+
+    # Cached until a game write
+    mock_game_gen(
+        championship_id=empty.id,
+        stage=StageOptions.FINAL,
+        team_score=1,
+        adversary_score=0,
+    )
+    response = client.get(f"/championships/{empty.id}/summary")
+    assert response.status_code == 200
+    assert response.json()["wins"] == 1
+
+    response = client.get(f"/championships/{uuid4()}/summary")
+    assert response.status_code == 404
+
+    # Stats cleared through update_game_and_stats' stats only path
+    context = GameValidationContext.load(mock_user.team_id, None, None, db_session)
+    update_game_stats(GameStatsIn(), quarter_final.id, mock_user, db_session, context)
+    db_session.commit()
+    response = client.get(f"/championships/{knockout.id}/summary")
+    assert response.json()["top_scorers"] == []
+    assert response.json()["top_assisters"] == []
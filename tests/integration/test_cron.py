@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlmodel import select
+
+from api import cron
+from api.main import app
+
+from bounded_contexts.championship.models import Championship
+from bounded_contexts.game_and_stats.models import Game, GamePlayerStat
+from bounded_contexts.player.models import Player
+from bounded_contexts.user.logged_user.models import LoggedUser
+from bounded_contexts.user.models import User
+from core.consts import DEMO_USER_EMAIL
+from core.services.auth import hash_refresh_token
+from core.services.demo_reset import reset_demo_team, DEMO_SEED
+from libs.datetime import utcnow
+
+client = TestClient(app)
+
+
+def test_reset_demo_team(
+    clean_db,
+    db_session,
+    mock_team,
+    mock_user_gen,
+    mock_player_gen,
+    mock_game_gen,
+    mock_game_player_stat_gen,
+):
+    super_user = mock_user_gen(is_super_admin=True)
+    demo_user = mock_user_gen(email=DEMO_USER_EMAIL)
+    visitor = mock_user_gen()
+    db_session.add(
+        LoggedUser(
+            user_id=visitor.id,
+            token_hash=hash_refresh_token("visitor-token"),
+            expires_at=utcnow() + timedelta(days=1),
+        )
+    )
+    db_session.commit()
+    visitor_id = visitor.id
+    kept_user_ids = {super_user.id, demo_user.id}
+
+    for _ in range(3):
+        mock_player_gen()
+    mock_game_gen()
+    mock_game_player_stat_gen()
+
+    report = reset_demo_team(db_session)
+
+    assert report["team_id"] == str(mock_team.id)
+    assert report["rows"] == {"championships": 2, "players": 2, "games": 1, "stats": 8}
+    assert report["total_ms"] >= report["delete_ms"]
+
+    db_session.expire_all()
+    players = db_session.exec(select(Player)).all()
+    assert sorted(p.name for p in players) == sorted(p.name for p in DEMO_SEED.players)
+    assert len(db_session.exec(select(Game)).all()) == 1
+    assert len(db_session.exec(select(Championship)).all()) == 2
+    assert len(db_session.exec(select(GamePlayerStat)).all()) == 8
+
+    user_ids = set(db_session.exec(select(User.id)).all())
+    assert user_ids == kept_user_ids
+    assert not db_session.exec(
+        select(LoggedUser).where(LoggedUser.user_id == visitor_id)
+    ).all()
+
+
+def test_clear_expired_sessions(db_session, mock_user_gen, monkeypatch):
+    user = mock_user_gen()
+    for token, expires_in in (
+        ("long-expired", timedelta(days=-3)),
+        ("just-expired", timedelta(hours=-1)),
+        ("active", timedelta(days=1)),
+    ):
+        db_session.add(
+            LoggedUser(
+                user_id=user.id,
+                token_hash=hash_refresh_token(token),
+                expires_at=utcnow() + expires_in,
+            )
+        )
+    db_session.commit()
+    user_id = user.id
+
+    response = client.get("/cron/clear-expired-sessions")
+    assert response.status_code == 401
+    response = client.get(
+        "/cron/clear-expired-sessions", headers={"Authorization": "Bearer wrong"}
+    )
+    assert response.status_code == 401
+
+    monkeypatch.setattr(cron, "CRON_SECRET", "cron-secret")
+    response = client.get(
+        "/cron/clear-expired-sessions",
+        headers={"Authorization": "Bearer cron-secret"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"deleted_sessions": 1}
+
+    token_hashes = set(
+        db_session.exec(
+            select(LoggedUser.token_hash).where(LoggedUser.user_id == user_id)
+        ).all()
+    )
+    assert token_hashes == {
+        hash_refresh_token("just-expired"),
+        hash_refresh_token("active"),
+    }
@@ -1,10 +1,22 @@
+import asyncio
+import csv
+import io
+import json
 from datetime import datetime, date
 from uuid import UUID
 
 import time_machine
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
+from api import cron
 from api.main import app
+from bounded_contexts.game_and_stats.availability import service as availability_service
+from bounded_contexts.game_and_stats.availability.broker import (
+    InProcessBroker,
+    get_availability_broker,
+    set_availability_broker,
+)
 from bounded_contexts.game_and_stats.availability.schemas import (
     GamePlayersAvailabilityResponse,
 )
@@ -13,6 +25,12 @@ from bounded_contexts.game_and_stats.game.schemas import (
     GameResponse,
     NextGameResponse,
     LastGameResponse,
+    GameStatsIn,
+)
+from bounded_contexts.game_and_stats.game_import.schemas import GamesImportResponse
+from bounded_contexts.game_and_stats.exceptions import (
+    StatPlayerNotInGamePlayers,
+    SomePlayersNotFound,
 )
 from bounded_contexts.game_and_stats.models import (
     AvailabilityStatus,
@@ -25,7 +43,10 @@ from bounded_contexts.game_and_stats.stats.schemas import (
     SeasonStatsSummaryResponse,
     SeasonMVP,
 )
+from bounded_contexts.game_and_stats.game.validation import GameValidationContext
+from bounded_contexts.game_and_stats.stats.service import update_game_stats
 from core.enums import StageOptions
+from tests.database import engine
 
 client = TestClient(app)
 
@@ -108,6 +129,46 @@ def test_create_and_get_game_and_stats(
     assert response_body["mvps"][0][1] == 2
 
 
+def test_create_game_validation_in_one_query(
+    mock_user, mock_championship, mock_player_gen, mock_team_gen
+):
+    players = [mock_player_gen() for _ in range(3)]
+    other_team_player = mock_player_gen(team_id=mock_team_gen().id)
+
+    data = {
+        "championship_id": str(mock_championship.id),
+        "adversary": "Adversary Team",
+        "date_hour": "2022-11-21T14:00:00",
+        "team_score": 1,
+        "adversary_score": 0,
+        "players": [str(p.id) for p in players],
+        "goals_and_assists": [
+            {"goal_player_id": str(players[0].id), "assist_player_id": None},
+        ],
+    }
+    selects = []
+
+    def _count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = client.post("/games", json=data)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert response.status_code == 201
+    # Team, championship and players together, the others refresh the new game
+    validation_selects = [s for s in selects if "FROM game \n" not in s]
+    assert len(validation_selects) == 1
+
+    data["players"].append(str(other_team_player.id))
+    response = client.post("/games", json=data)
+    assert response.status_code == 404
+    assert response.json()["detail"] == SomePlayersNotFound.detail
+
+
 def test_error_create_game_invalid_championship(mock_user, mock_championship):
     # 1 - invalid format
     data = {
@@ -363,6 +424,26 @@ def test_update_game_and_stats(
     assert game_db["mvps"][0]["quantity"] == 2
 
 
+def test_clearing_game_stats_changes_the_etag(
+    db_session, mock_user, mock_game_player_stat
+):
+    game_id = mock_game_player_stat.game_id
+    response = client.get(f"/stats/game/{game_id}")
+    assert response.json()["goals_and_assists"]
+    etag = response.headers["etag"]
+
+    # update_game_and_stats' stats only path (SQLite's naive datetimes always
+    # count as a game info change there): only the stats' Core DELETE runs
+    context = GameValidationContext.load(mock_user.team_id, None, None, db_session)
+    update_game_stats(GameStatsIn(), game_id, mock_user, db_session, context)
+    db_session.commit()
+
+    response = client.get(f"/stats/game/{game_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["goals_and_assists"] == []
+
+
 def test_error_update_game_invalid_championship(
     mock_user, mock_game_player_stat, mock_championship_gen
 ):
@@ -440,6 +521,106 @@ def test_create_game_player_availability(mock_user_gen, mock_game, mock_player):
     assert response.status_code == 201
 
 
+def test_availability_changes_are_published(mock_user_gen, mock_game, mock_player):
+    mock_user_gen(player=mock_player)
+    published = []
+
+    class _FakeBroker:
+        def publish(self, game_id, message):
+            published.append((game_id, json.loads(message)))
+
+    set_availability_broker(_FakeBroker())
+    try:
+        data = {"game_id": str(mock_game.id), "status": AvailabilityStatus.AVAILABLE}
+        response = client.post("/player-availability", json=data)
+        assert response.status_code == 201
+
+        response = client.delete(f"/player-availability/{mock_game.id}")
+        assert response.status_code == 204
+    finally:
+        set_availability_broker(InProcessBroker())
+
+    assert [game_id for game_id, _ in published] == [mock_game.id, mock_game.id]
+    assert published[0][1]["player_name"] == mock_player.name
+    assert published[0][1]["status"] == AvailabilityStatus.AVAILABLE
+    assert published[0][1]["confirmed_players"] == 1
+    assert published[1][1]["status"] is None
+    assert published[1][1]["confirmed_players"] == 0
+
+
+def _read_events(path: str, count: int) -> tuple[dict, list[str]]:
+    """
+    Drives the app by hand, since TestClient waits for the (endless) stream
+    to end. Disconnects once count events arrived.
+    """
+
+    async def scenario():
+        start, events = {}, []
+        requested, enough = False, asyncio.Event()
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await enough.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body" and message["body"]:
+                events.append(message["body"].decode())
+                if len(events) >= count:
+                    enough.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        await asyncio.wait_for(app(scope, receive, send), timeout=5)
+        return start, events
+
+    return asyncio.run(scenario())
+
+
+def test_availability_events_stream(mock_user_gen, mock_game, mock_player, monkeypatch):
+    mock_user_gen(player=mock_player)
+    get_snapshot = availability_service.get_game_players_availability
+
+    def _snapshot_then_change(*args):
+        snapshot = get_snapshot(*args)
+        # A change committed right after the listing was read
+        get_availability_broker().publish(mock_game.id, '{"changed": true}')
+        return snapshot
+
+    monkeypatch.setattr(
+        availability_service, "get_game_players_availability", _snapshot_then_change
+    )
+
+    start, (snapshot, change) = _read_events(
+        f"/player-availability/{mock_game.id}/events", count=2
+    )
+    assert start["status"] == 200
+    assert snapshot.startswith("event: snapshot\ndata: ")
+    assert json.loads(snapshot.split("data: ", 1)[1])["available"] == []
+    assert change == 'event: availability\ndata: {"changed": true}\n\n'
+    assert get_availability_broker().subscribers_count(mock_game.id) == 0
+
+    response = client.get(f"/player-availability/{UUID(int=1)}/events")
+    assert response.status_code == 404
+
+
 def test_error_create_game_player_availability(mock_user_gen, mock_game, mock_player):
     mock_user_gen()
 
@@ -487,6 +668,94 @@ def test_get_game_players_availability(
     assert response_body["not_available"][0] == player2.name
 
 
+def test_get_game_players_availability_in_one_query(
+    mock_user_gen, mock_game, mock_player_gen, mock_game_player_availability_gen
+):
+    mock_user_gen()
+    for _ in range(5):
+        player = mock_player_gen()
+        mock_game_player_availability_gen(
+            player_id=player.id, status=AvailabilityStatus.AVAILABLE
+        )
+
+    game_id = mock_game.id
+    statements = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = client.get(f"/player-availability/{game_id}")
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert response.status_code == 200
+    assert len(response.json()["available"]) == 5
+    assert len(statements) == 1
+
+
+def test_bulk_upsert_game_players_availability(
+    mock_user_gen,
+    mock_game,
+    mock_player_gen,
+    mock_team_gen,
+    mock_game_player_availability_gen,
+    update_object,
+):
+    game_id = mock_game.id
+    deleted_player, doubt_player, new_player = [mock_player_gen() for _ in range(3)]
+    deleted_availability = mock_game_player_availability_gen(
+        player_id=deleted_player.id, status=AvailabilityStatus.AVAILABLE
+    )
+    deleted_availability.deleted = True
+    update_object(deleted_availability)
+    mock_game_player_availability_gen(
+        player_id=doubt_player.id, status=AvailabilityStatus.DOUBT
+    )
+
+    data = {
+        "players": [
+            {"player_id": str(deleted_player.id), "status": "not_available"},
+            {"player_id": str(doubt_player.id), "status": "available"},
+            {"player_id": str(new_player.id), "status": "available"},
+        ]
+    }
+
+    # Only admins
+    mock_user_gen(is_admin=False)
+    response = client.put(f"/player-availability/{game_id}/bulk", json=data)
+    assert response.status_code == 403
+
+    mock_user_gen()
+    response = client.put(f"/player-availability/{game_id}/bulk", json=data)
+    assert response.status_code == 200
+
+    response = client.get(f"/player-availability/{game_id}")
+    response_body = response.json()
+    assert sorted(response_body["available"]) == sorted(
+        [doubt_player.name, new_player.name]
+    )
+    assert response_body["not_available"] == [deleted_player.name]
+    assert response_body["doubt"] == []
+
+    # Players from another team
+    other_team_player = mock_player_gen(team_id=mock_team_gen().id)
+    data = {"players": [{"player_id": str(other_team_player.id), "status": "doubt"}]}
+    response = client.put(f"/player-availability/{game_id}/bulk", json=data)
+    assert response.status_code == 404
+
+    # Repeated players
+    data = {
+        "players": [
+            {"player_id": str(new_player.id), "status": "doubt"},
+            {"player_id": str(new_player.id), "status": "available"},
+        ]
+    }
+    response = client.put(f"/player-availability/{game_id}/bulk", json=data)
+    assert response.status_code == 422
+
+
 def test_update_game_players_availability(
     mock_user_gen, mock_player, mock_game_player_availability
 ):
@@ -538,6 +807,55 @@ def test_get_next_game(mock_user, mock_game_gen, mock_championship_gen):
     assert response_body["confirmed_players"] == 0
 
 
+@time_machine.travel("2025-01-01")
+def test_next_game_confirmed_players_counter(
+    clean_db,
+    mock_user_gen,
+    mock_player_gen,
+    mock_game_gen,
+    mock_championship_gen,
+    mock_game_player_availability_gen,
+    monkeypatch,
+):
+    champ = mock_championship_gen(start_date=datetime(2025, 1, 1))
+    game = mock_game_gen(championship_id=champ.id, date_hour=datetime(2025, 1, 2))
+    game_id = game.id
+    player1 = mock_player_gen()
+    player2 = mock_player_gen()
+    mock_user_gen(player=player1)
+
+    data = {"game_id": str(game_id), "status": AvailabilityStatus.AVAILABLE}
+    response = client.post("/player-availability", json=data)
+    assert response.status_code == 201
+
+    response = client.get("/games/next-game")
+    assert response.json()["confirmed_players"] == 1
+
+    # Written without the repo, the counter drifts until the repair job runs
+    mock_game_player_availability_gen(game_id=game_id, player_id=player2.id)
+    response = client.get("/games/next-game")
+    assert response.json()["confirmed_players"] == 1
+
+    response = client.get("/cron/repair-availability-counters")
+    assert response.status_code == 401
+
+    monkeypatch.setattr(cron, "CRON_SECRET", "cron-secret")
+    response = client.get(
+        "/cron/repair-availability-counters",
+        headers={"Authorization": "Bearer cron-secret"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"fixed_games": 1}
+
+    response = client.get("/games/next-game")
+    assert response.json()["confirmed_players"] == 2
+
+    response = client.delete(f"/player-availability/{game_id}")
+    assert response.status_code == 204
+    response = client.get("/games/next-game")
+    assert response.json()["confirmed_players"] == 1
+
+
 @time_machine.travel("2025-01-17")
 def test_get_month_top_scorer(
     mock_user,
@@ -799,3 +1117,221 @@ def test_get_season_stats_summary(
     SeasonMVP.model_validate(mvp)
     assert mvp["name"] == player2.name[:30]
     assert mvp["points"] == 3
+
+
+def test_export_csv(
+    mock_team_gen,
+    mock_user_gen,
+    mock_game_gen,
+    mock_game_player_stat_gen,
+    mock_championship_gen,
+    mock_player_gen,
+):
+    team = mock_team_gen()
+    mock_user_gen(team_id=team.id)
+
+    # Without data -> Header only
+    response = client.get("/export/games.csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="jogos.csv"'
+    assert response.text.splitlines() == [
+        "id,date_hour,championship,adversary,is_home,is_wo,round,stage,team_score,"
+        "adversary_score,team_penalty_score,adversary_penalty_score"
+    ]
+
+    player1 = mock_player_gen(team_id=team.id, name="Ana")
+    player2 = mock_player_gen(team_id=team.id, name="Bia")
+    champ = mock_championship_gen(team_id=team.id, name="Copa")
+    game1 = mock_game_gen(
+        team_id=team.id,
+        championship_id=champ.id,
+        date_hour=datetime(2024, 5, 1, 16),
+        team_score=2,
+        adversary_score=1,
+    )
+    game2 = mock_game_gen(
+        team_id=team.id,
+        championship_id=champ.id,
+        date_hour=datetime(2025, 5, 1, 16),
+        team_score=1,
+        adversary_score=0,
+    )
+    for game, player, stat, quantity in (
+        (game1, player1, StatOptions.PLAYED, 1),
+        (game1, player1, StatOptions.GOAL, 1),
+        (game1, player1, StatOptions.GOAL, 1),
+        (game1, player2, StatOptions.PLAYED, 1),
+        (game1, player2, StatOptions.ASSIST, 1),
+        (game2, player1, StatOptions.PLAYED, 1),
+        (game2, player1, StatOptions.GOAL, 1),
+        (game2, player1, StatOptions.MVP, 3),
+    ):
+        mock_game_player_stat_gen(
+            team_id=team.id,
+            game_id=game.id,
+            player_id=player.id,
+            stat=stat,
+            quantity=quantity,
+        )
+
+    response = client.get("/export/games.csv")
+    assert response.status_code == 200
+    lines = list(csv.DictReader(io.StringIO(response.text)))
+    assert [line["id"] for line in lines] == [str(game1.id), str(game2.id)]
+    assert lines[0]["championship"] == "Copa"
+    assert lines[0]["team_score"] == "2"
+
+    response = client.get("/export/players-game-stats.csv")
+    assert response.status_code == 200
+    lines = list(csv.DictReader(io.StringIO(response.text)))
+    assert [
+        (
+            line["game_id"],
+            line["player"],
+            line["played"],
+            line["goals"],
+            line["assists"],
+        )
+        for line in lines
+    ] == [
+        (str(game1.id), "Ana", "1", "2", "0"),
+        (str(game1.id), "Bia", "1", "0", "1"),
+        (str(game2.id), "Ana", "1", "1", "0"),
+    ]
+
+    response = client.get("/export/players-season-stats.csv")
+    assert response.status_code == 200
+    lines = list(csv.DictReader(io.StringIO(response.text)))
+    assert [
+        (line["season"], line["player"], line["played"], line["goals"], line["mvps"])
+        for line in lines
+    ] == [
+        ("2024", "Ana", "1", "2", "0"),
+        ("2024", "Bia", "1", "0", "0"),
+        ("2025", "Ana", "1", "1", "3"),
+    ]
+
+
+def test_export_csv_seasons_start_on_the_team_season_start_date(
+    mock_team_gen,
+    mock_user_gen,
+    mock_game_gen,
+    mock_game_player_stat_gen,
+    mock_player_gen,
+):
+    team = mock_team_gen(season_start_date=date(2023, 8, 1))
+    mock_user_gen(team_id=team.id)
+    player = mock_player_gen(team_id=team.id, name="Ana")
+    for date_hour, quantity in (
+        (datetime(2024, 7, 31, 20), 1),
+        (datetime(2024, 8, 1, 10), 2),
+        (datetime(2025, 5, 1, 16), 4),
+        (datetime(2025, 8, 2, 16), 8),
+    ):
+        game = mock_game_gen(team_id=team.id, date_hour=date_hour)
+        mock_game_player_stat_gen(
+            team_id=team.id,
+            game_id=game.id,
+            player_id=player.id,
+            stat=StatOptions.GOAL,
+            quantity=quantity,
+        )
+
+    response = client.get("/export/players-season-stats.csv")
+    assert response.status_code == 200
+    lines = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(line["season"], line["goals"]) for line in lines] == [
+        ("2023", "1"),
+        ("2024", "6"),
+        ("2025", "8"),
+    ]
+
+
+def test_import_games(
+    mock_team_gen, mock_user_gen, mock_championship_gen, mock_player_gen
+):
+    team = mock_team_gen()
+    mock_user_gen(team_id=team.id, is_admin=False)
+    response = client.post(
+        "/import/games", files={"file": ("jogos.csv", b"championship\n", "text/csv")}
+    )
+    assert response.status_code == 403
+
+    mock_user_gen(team_id=team.id)
+    mock_player_gen(team_id=team.id, name="Ana")
+    mock_player_gen(team_id=team.id, name="Bia")
+    mock_championship_gen(team_id=team.id, name="Copa", is_league_format=True)
+
+    content = (
+        "championship,adversary,date_hour,round,team_score,adversary_score,"
+        "players,goals_and_assists,yellow_cards,mvps\n"
+        "Copa,Rival,2024-05-01T16:00:00,1,2,1,Ana;Bia,Ana/Bia;Contra,Bia:2,Ana:3\n"
+        "Copa,Rival,2024-05-08T16:00:00,2,1,0,Ana;Carla,Carla,,\n"
+        "Liga,Rival,2024-05-15T16:00:00,,0,0,,,,\n"
+        "Copa,Rival,2024-05-22T16:00:00,3,1,0,Ana,Bia,,\n"
+    )
+    response = client.post(
+        "/import/games",
+        files={"file": ("jogos.csv", content.encode(), "text/csv")},
+        params={"dry_run": True},
+    )
+    assert response.status_code == 200
+    assert response.json()["imported"] == 0
+    assert client.post("/games/filter", json={}).json()["total"] == 0
+
+    response = client.post(
+        "/import/games", files={"file": ("jogos.csv", content.encode(), "text/csv")}
+    )
+    assert response.status_code == 200
+    response_body = response.json()
+    GamesImportResponse.model_validate(response_body)
+    assert response_body["imported"] == 1
+    assert response_body["errors"] == [
+        {"row": 2, "errors": ["Jogador não encontrado: Carla."]},
+        {"row": 3, "errors": ["Campeonato não encontrado: Liga."]},
+        {"row": 4, "errors": [StatPlayerNotInGamePlayers.detail]},
+    ]
+
+    game = client.post("/games/filter", json={}).json()["items"][0]
+    assert game["team_score"] == 2
+    stats = client.get(f"/stats/game/{game['id']}").json()
+    assert [player[-1] for player in stats["players"]] == ["Ana", "Bia"]
+    assert sorted(stats["goals_and_assists"], key=str) == [
+        {"player_name": "Ana", "assist_player_name": "Bia"},
+        {"player_name": "Contra", "assist_player_name": None},
+    ]
+    assert stats["yellow_cards"] == [["Bia", 2]]
+    assert stats["mvps"] == [["Ana", 3]]
+
+    # As in POST /games/, the assist may come from a player out of the game
+    content = (
+        "championship,adversary,date_hour,round,team_score,adversary_score,"
+        "players,goals_and_assists\n"
+        "Copa,Rival,2024-05-29T16:00:00,4,1,0,Ana,Ana/Bia\n"
+    )
+    response = client.post(
+        "/import/games", files={"file": ("jogos.csv", content.encode(), "text/csv")}
+    )
+    assert response.json() == {"imported": 1, "errors": []}
+
+    games = [
+        {
+            "championship": "Copa",
+            "adversary": "Rival",
+            "date_hour": "2024-06-01T16:00:00",
+            "round": 5,
+            "is_wo": True,
+        }
+    ]
+    response = client.post(
+        "/import/games",
+        files={"file": ("jogos.json", json.dumps(games).encode(), "application/json")},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"imported": 1, "errors": []}
+
+    response = client.post(
+        "/import/games", files={"file": ("jogos.txt", b"x", "text/plain")}
+    )
+    assert response.status_code == 400
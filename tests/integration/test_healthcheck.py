@@ -9,3 +9,16 @@ def test_database_startup_check():
     response = client.get("/database-check")
     assert response.status_code == 200
     assert response.json() == {"status": "ready"}
+
+
+def test_index_is_served_precompressed():
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "<html" in response.text.lower()
+
+    response = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
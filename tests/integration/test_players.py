@@ -522,3 +522,23 @@ def test_get_players_filtered_by_stats(
     assert len(response_body1) == 1
     assert response_body1[0]["id"] == str(player3.id)
     assert response_body1[0]["assists"] == 0
+
+
+def test_get_players_conditional_request(mock_user, mock_player_gen):
+    mock_player_gen(name="Conditional")
+
+    response = client.get("/players")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get("/players", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.content
+
+    # Any write to the team's rows bumps the version
+    mock_player_gen(name="Conditional 2")
+
+    response = client.get("/players", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert "Conditional 2" in [player["name"] for player in response.json()]
@@ -1,7 +1,9 @@
 from fastapi.testclient import TestClient
 
 from api.main import app
+from api.terms_of_use_htmls.current_version import TERMS_VERSION
 from bounded_contexts.terms_of_use.schemas import TermsOfUseResponse
+from core.settings import MIGRATIONS_PWD
 
 client = TestClient(app, base_url="https://api.forquilha.app.br")
 
@@ -53,3 +55,36 @@ def test_get_active_terms_of_use(mock_terms_of_use_gen):
     TermsOfUseResponse.model_validate(response_body)
     assert response_body["version"] == active_terms.version
     assert response_body["content"] == active_terms.content
+
+
+def test_get_active_terms_of_use_conditional_request(mock_terms_of_use_gen):
+    mock_terms_of_use_gen(version=4, is_active=True)
+
+    response = client.get("/terms_of_use/active")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag
+    assert "no-cache" in response.headers["cache-control"]
+
+    response = client.get("/terms_of_use/active", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+
+def test_publish_terms_of_use_invalidates_active_terms_cache(
+    clean_db, mock_user_gen, mock_terms_of_use_gen
+):
+    mock_user_gen(is_super_admin=True)
+    mock_terms_of_use_gen(version=1, is_active=True)
+
+    response = client.get("/terms_of_use/active")
+    assert response.json()["version"] == 1
+    old_etag = response.headers["etag"]
+
+    response = client.post(f"/admin/publish-terms-of-use/{MIGRATIONS_PWD}")
+    assert response.status_code == 201
+
+    response = client.get("/terms_of_use/active", headers={"If-None-Match": old_etag})
+    assert response.status_code == 200
+    assert response.json()["version"] == TERMS_VERSION
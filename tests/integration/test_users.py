@@ -2,13 +2,20 @@ from datetime import date, datetime
 from uuid import uuid4
 from zoneinfo import ZoneInfo
 
+import pytest
 import time_machine
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.testclient import TestClient
+from sqlmodel import select
 
 from api.main import app
+from bounded_contexts.team.models import Team
+from bounded_contexts.user.logged_user.models import LoggedUser
 from bounded_contexts.user.models import User
 from bounded_contexts.user.schemas import UserResponse, UserResponse, UserPlayer
 from core.consts import DEMO_USER_EMAIL
+from core.services.auth import hash_refresh_token, validate_user_token
 from core.services.password import verify_password
 
 client = TestClient(app, base_url="https://api.forquilha.app.br")
@@ -258,7 +265,9 @@ def test_delete_user(mock_user_gen):
     assert response.json()["detail"] == "Usuário não encontrado no sistema"
 
 
-def test_login_and_logout_success(clean_db, mock_user_gen, count_logged_users):
+def test_login_and_logout_success(
+    clean_db, db_session, mock_user_gen, count_logged_users
+):
     # 1 - login
     user = mock_user_gen(password="1234")
     data = {
@@ -283,6 +292,10 @@ def test_login_and_logout_success(clean_db, mock_user_gen, count_logged_users):
 
     logged_users = count_logged_users()
     assert logged_users == 1
+    # Only the token digest is stored
+    assert db_session.exec(select(LoggedUser.token_hash)).one() == (
+        hash_refresh_token(refresh_token)
+    )
 
     # 3 - logout
     response = client.post(f"/users/logout", cookies={"refresh_token": refresh_token})
@@ -292,6 +305,64 @@ def test_login_and_logout_success(clean_db, mock_user_gen, count_logged_users):
     assert logged_users == 0
 
 
+def _bearer(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_login_refresh_and_logout_with_stateless_refresh_token(
+    monkeypatch, db_session, mock_user_gen, count_logged_users
+):
+    monkeypatch.setattr("core.services.auth.STATELESS_REFRESH_TOKENS", True)
+    user = mock_user_gen(password="1234")
+    data = {
+        "username": user.email,
+        "password": "1234",
+    }
+    response = client.post(f"/users/login", data=data)
+    assert response.status_code == 200
+    refresh_token = response.cookies.jar._cookies["api.forquilha.app.br"]["/"][
+        "refresh_token"
+    ].value
+    # No session row
+    assert count_logged_users() == 0
+
+    response = client.post(f"/users/refresh", cookies={"refresh_token": refresh_token})
+    assert response.status_code == 200
+    access_token = response.json()["access_token"]
+    assert validate_user_token(_bearer(access_token), db_session).id == user.id
+    # Not accepted as an access token
+    with pytest.raises(HTTPException) as e:
+        validate_user_token(_bearer(refresh_token), db_session)
+    assert e.value.status_code == 401
+
+    response = client.post(f"/users/logout", cookies={"refresh_token": refresh_token})
+    assert response.status_code == 200
+
+    response = client.post(f"/users/refresh", cookies={"refresh_token": refresh_token})
+    assert "access_token" not in response.json()
+
+
+def test_stateless_refresh_token_of_deleted_team(
+    monkeypatch, db_session, mock_user_gen
+):
+    monkeypatch.setattr("core.services.auth.STATELESS_REFRESH_TOKENS", True)
+    user = mock_user_gen(password="1234")
+    response = client.post(
+        f"/users/login", data={"username": user.email, "password": "1234"}
+    )
+    refresh_token = response.cookies.jar._cookies["api.forquilha.app.br"]["/"][
+        "refresh_token"
+    ].value
+
+    team = db_session.get(Team, user.team_id)
+    team.deleted = True
+    db_session.add(team)
+    db_session.commit()
+
+    response = client.post(f"/users/refresh", cookies={"refresh_token": refresh_token})
+    assert "access_token" not in response.json()
+
+
 def test_login_and_logout_with_demo_user(mock_user_gen, count_logged_users):
     user = mock_user_gen(email=DEMO_USER_EMAIL)
 
@@ -0,0 +1,70 @@
+import os
+from datetime import date
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlmodel import Session
+
+from infra.benchmarks.generator import (
+    GeneratorConfig,
+    count_teams,
+    generate,
+    load_teams,
+)
+
+# A dedicated Postgres database: it's migrated and populated once, then reused
+DATABASE_URL = os.getenv("QUERY_PLANS_DATABASE_URL")
+UPDATE_SNAPSHOTS = bool(os.getenv("UPDATE_QUERY_PLANS"))
+# Fixed, so the data and the "current month" queries don't change over time
+REFERENCE_DATE = date(2025, 6, 15)
+GENERATOR_CONFIG = GeneratorConfig(teams=30, reference_date=REFERENCE_DATE)
+
+ALEMBIC_INI = os.path.join(os.path.dirname(__file__), "../../infra/alembic.ini")
+
+
+def pytest_collection_modifyitems(config, items):
+    if DATABASE_URL and DATABASE_URL.startswith("postgresql"):
+        return
+
+    skip = pytest.mark.skip(reason="QUERY_PLANS_DATABASE_URL (Postgres) not set")
+    for item in items:
+        if "query_plans" in str(item.fspath):
+            item.add_marker(skip)
+
+
+def _migrate() -> None:
+    # infra/migrations/env.py reads the url from DATABASE_URL
+    app_database_url = os.environ["DATABASE_URL"]
+    os.environ["DATABASE_URL"] = DATABASE_URL
+    try:
+        command.upgrade(Config(ALEMBIC_INI), "head")
+    finally:
+        os.environ["DATABASE_URL"] = app_database_url
+
+
+@pytest.fixture(scope="session")
+def plans_engine():
+    _migrate()
+    engine = create_engine(DATABASE_URL)
+    with Session(engine) as session:
+        if not count_teams(session):
+            generate(session, GENERATOR_CONFIG)
+            session.execute(text("ANALYZE"))
+            session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def plans_team(plans_engine):
+    with Session(plans_engine) as session:
+        return load_teams(session, limit=1)[0]
+
+
+@pytest.fixture()
+def plans_session(plans_engine):
+    with Session(plans_engine) as session:
+        yield session
+        session.rollback()
@@ -0,0 +1,83 @@
+"""
+Captures the SELECTs a repo call runs and reduces their Postgres plans to
+a stable shape: node types, relations and indexes, without costs, timings
+or row estimates (ANALYZE samples the rows at random, so even their order
+of magnitude can flip between runs).
+"""
+
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlalchemy import Engine, event
+
+SNAPSHOTS_DIR = Path(__file__).parent / "snapshots"
+
+_PLAN_KEYS = {
+    "Relation Name": "relation",
+    "Index Name": "index",
+    "Join Type": "join",
+    "Strategy": "strategy",
+    "Scan Direction": "direction",
+}
+
+
+@contextmanager
+def capture_selects(engine: Engine):
+    statements: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(
+            ("SELECT", "WITH")
+        ):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+
+def explain(engine: Engine, statement: str, parameters) -> dict:
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def plan_shape(plan: dict) -> dict:
+    shape = {"node": plan["Node Type"]}
+    for key, name in _PLAN_KEYS.items():
+        if key in plan:
+            shape[name] = plan[key]
+    if plan.get("Plans"):
+        shape["children"] = [plan_shape(child) for child in plan["Plans"]]
+    return shape
+
+
+def seq_scans(shape: dict) -> set[str]:
+    relations = set()
+    if shape["node"] == "Seq Scan":
+        relations.add(shape["relation"])
+    for child in shape.get("children", []):
+        relations |= seq_scans(child)
+    return relations
+
+
+def snapshot_path(case_name: str) -> Path:
+    return SNAPSHOTS_DIR / f"{case_name}.json"
+
+
+def read_snapshot(case_name: str) -> list[dict] | None:
+    path = snapshot_path(case_name)
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def write_snapshot(case_name: str, queries: list[dict]) -> None:
+    SNAPSHOTS_DIR.mkdir(exist_ok=True)
+    snapshot_path(case_name).write_text(
+        json.dumps(queries, indent=2, ensure_ascii=False) + "\n"
+    )
@@ -0,0 +1,205 @@
+"""
+Plan snapshots of the read repos' queries on a populated Postgres.
+
+Runs only with QUERY_PLANS_DATABASE_URL set. A changed plan shape (e.g. an
+index scan that became a seq scan) fails the test, as does a case without
+a snapshot. After reviewing it, record the new shapes with
+UPDATE_QUERY_PLANS=1 and commit the snapshot diff. New read repo methods
+get a case here.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable
+from uuid import UUID
+
+import pytest
+import time_machine
+from sqlmodel import Session, select
+
+from bounded_contexts.championship.repo import ChampionshipReadRepo
+from bounded_contexts.game_and_stats.availability.repo import AvailabilityReadRepo
+from bounded_contexts.game_and_stats.game.repo import GameReadRepo
+from bounded_contexts.game_and_stats.game.schemas import GameFilter
+from bounded_contexts.game_and_stats.models import Game, StatOptions
+from bounded_contexts.game_and_stats.stats.repo import GamePlayerStatReadRepo
+from bounded_contexts.player.repo import PlayerReadRepo
+from bounded_contexts.player.schemas import PlayersStatsFilter
+from bounded_contexts.team.repo import TeamReadRepo
+from bounded_contexts.user.repo import UserReadRepo
+from core.enums import StageOptions
+from infra.benchmarks.generator import BenchmarkTeam
+from libs.schemas import DateRangeSchema
+from tests.query_plans.conftest import REFERENCE_DATE, UPDATE_SNAPSHOTS
+from tests.query_plans.plans import (
+    capture_selects,
+    explain,
+    plan_shape,
+    read_snapshot,
+    seq_scans,
+    write_snapshot,
+)
+
+
+@dataclass(frozen=True)
+class PlanTarget:
+    team: BenchmarkTeam
+    # The team's last played game
+    game_id: UUID
+
+
+@dataclass(frozen=True)
+class PlanCase:
+    name: str
+    call: Callable[[Session, PlanTarget], object]
+
+
+CASES = [
+    PlanCase(
+        "game_get_all_paginated",
+        lambda session, target: GameReadRepo(session).get_all_paginated(
+            target.team.id, 20, 0
+        ),
+    ),
+    PlanCase(
+        "game_get_by_filters_paginated",
+        lambda session, target: GameReadRepo(session).get_by_filters_paginated(
+            target.team.id,
+            GameFilter(
+                championship_id=target.team.championship_ids[-1],
+                stages=[StageOptions.SEMI_FINAL, StageOptions.FINAL],
+                team_score_from=1,
+                order_by="date_hour_desc",
+            ),
+            20,
+            0,
+        ),
+    ),
+    PlanCase(
+        "game_get_by_filters_paginated_by_adversary",
+        lambda session, target: GameReadRepo(session).get_by_filters_paginated(
+            target.team.id, GameFilter(adversary="Adversário 1"), 20, 0
+        ),
+    ),
+    PlanCase(
+        "game_get_next_game_and_championship_name",
+        lambda session, target: GameReadRepo(
+            session
+        ).get_next_game_and_championship_name(target.team.id),
+    ),
+    PlanCase(
+        "game_get_last_games",
+        lambda session, target: GameReadRepo(session).get_last_games(target.team.id, 5),
+    ),
+    PlanCase(
+        "player_get_by_team_id",
+        lambda session, target: PlayerReadRepo(session).get_by_team_id(target.team.id),
+    ),
+    PlanCase(
+        "player_get_players_filtered_by_stats",
+        lambda session, target: PlayerReadRepo(session).get_players_filtered_by_stats(
+            PlayersStatsFilter(), target.team.id
+        ),
+    ),
+    PlanCase(
+        "player_get_players_filtered_by_stats_by_championships_and_dates",
+        lambda session, target: PlayerReadRepo(session).get_players_filtered_by_stats(
+            PlayersStatsFilter(
+                stat_name=StatOptions.ASSIST,
+                championships=target.team.championship_ids[-4:],
+                date_range=DateRangeSchema(
+                    start=date(REFERENCE_DATE.year - 1, 1, 1), end=REFERENCE_DATE
+                ),
+            ),
+            target.team.id,
+        ),
+    ),
+    PlanCase(
+        "stats_get_month_top_scorer",
+        lambda session, target: GamePlayerStatReadRepo(session).get_month_top_scorer(
+            target.team.id
+        ),
+    ),
+    PlanCase(
+        "stats_get_by_game_id",
+        lambda session, target: GamePlayerStatReadRepo(session).get_by_game_id(
+            target.game_id
+        ),
+    ),
+    PlanCase(
+        "availability_get_players_availability_by_game",
+        lambda session, target: AvailabilityReadRepo(
+            session
+        ).get_players_availability_by_game(target.game_id),
+    ),
+    PlanCase(
+        "championship_get_all_order_by_status_and_start_date",
+        lambda session, target: ChampionshipReadRepo(
+            session
+        ).get_all_order_by_status_and_start_date(target.team.id),
+    ),
+    PlanCase(
+        "championship_get_results_by_stage",
+        lambda session, target: ChampionshipReadRepo(session).get_results_by_stage(
+            target.team.id
+        ),
+    ),
+    PlanCase(
+        "championship_get_stat_leaders",
+        lambda session, target: ChampionshipReadRepo(session).get_stat_leaders(
+            target.team.id, [StatOptions.GOAL, StatOptions.ASSIST, StatOptions.MVP]
+        ),
+    ),
+    PlanCase(
+        "team_get_data_version",
+        lambda session, target: TeamReadRepo(session).get_data_version(target.team.id),
+    ),
+    PlanCase(
+        "user_get_by_email",
+        lambda session, target: UserReadRepo(session).get_by_email(
+            target.team.admin_email
+        ),
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def plans_target(plans_engine, plans_team) -> PlanTarget:
+    with Session(plans_engine) as session:
+        game_id = session.exec(
+            select(Game.id)
+            .where(Game.team_id == plans_team.id, Game.team_score != None)
+            .order_by(Game.date_hour.desc())
+        ).first()
+    return PlanTarget(team=plans_team, game_id=game_id)
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_query_plan(case, plans_engine, plans_session, plans_target):
+    with time_machine.travel(REFERENCE_DATE):
+        with capture_selects(plans_engine) as statements:
+            case.call(plans_session, plans_target)
+
+    queries = [
+        {"sql": sql, "plan": plan_shape(explain(plans_engine, sql, params))}
+        for sql, params in statements
+    ]
+    if UPDATE_SNAPSHOTS:
+        write_snapshot(case.name, queries)
+        return
+
+    snapshot = read_snapshot(case.name)
+    assert snapshot is not None, (
+        f"No snapshot for {case.name}. Record it with UPDATE_QUERY_PLANS=1 and "
+        "commit it"
+    )
+
+    new_seq_scans = [
+        sorted(seq_scans(query["plan"]) - seq_scans(recorded["plan"]))
+        for query, recorded in zip(queries, snapshot)
+    ]
+    assert not any(new_seq_scans), f"New seq scans: {new_seq_scans}"
+    assert queries == snapshot, (
+        "Query plan changed. Review it and rerun with UPDATE_QUERY_PLANS=1 to "
+        "record it"
+    )
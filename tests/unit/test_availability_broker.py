@@ -0,0 +1,36 @@
+import asyncio
+from uuid import uuid4
+
+from bounded_contexts.game_and_stats.availability.broker import InProcessBroker
+
+
+def test_in_process_broker_delivers_only_to_the_game_subscribers():
+    broker = InProcessBroker()
+    game_id, other_game_id = uuid4(), uuid4()
+
+    async def scenario():
+        async with broker.subscribe(game_id) as queue:
+            async with broker.subscribe(other_game_id) as other_queue:
+                assert broker.subscribers_count(game_id) == 1
+
+                broker.publish(game_id, "confirmed")
+                message = await asyncio.wait_for(queue.get(), timeout=1)
+
+                assert message == "confirmed"
+                assert other_queue.empty()
+
+    asyncio.run(scenario())
+    assert broker.subscribers_count(game_id) == 0
+    assert broker.subscribers_count(other_game_id) == 0
+
+
+def test_in_process_broker_accepts_publishes_from_other_threads():
+    broker = InProcessBroker()
+    game_id = uuid4()
+
+    async def scenario():
+        async with broker.subscribe(game_id) as queue:
+            await asyncio.to_thread(broker.publish, game_id, "from thread")
+            return await asyncio.wait_for(queue.get(), timeout=1)
+
+    assert asyncio.run(scenario()) == "from thread"
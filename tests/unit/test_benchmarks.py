@@ -0,0 +1,91 @@
+from datetime import date
+
+from sqlalchemy import create_engine, func
+from sqlmodel import Session, SQLModel, select
+
+from bounded_contexts.game_and_stats.models import Game, GamePlayerStat
+from bounded_contexts.player.models import Player
+from infra.benchmarks.generator import GeneratorConfig, generate, load_teams
+from infra.benchmarks.harness import find_regressions
+from infra.benchmarks.load.profiles import PROFILES
+from infra.benchmarks.load.runner import LoadRun, RouteTimings, check_slos
+
+
+def _generate(config: GeneratorConfig) -> tuple[Session, list]:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    session = Session(engine)
+    return session, generate(session, config)
+
+
+def test_generator_is_deterministic():
+    config = GeneratorConfig(
+        teams=2, seasons=2, games_per_season=8, reference_date=date(2025, 3, 1)
+    )
+    session, teams = _generate(config)
+    other_session, other_teams = _generate(config)
+
+    assert teams == other_teams
+    assert len(teams[0].player_ids) == 30
+    assert session.exec(select(func.count(Player.id))).one() == 60
+    assert session.exec(select(func.count(Game.id))).one() == 2 * 2 * 8
+    stats = select(GamePlayerStat.id, GamePlayerStat.quantity).order_by(
+        GamePlayerStat.id
+    )
+    assert session.exec(stats).all() == other_session.exec(stats).all()
+    # Games after the reference date aren't played
+    assert (
+        session.exec(select(func.count(Game.id)).where(Game.team_score == None)).one()
+        == other_session.exec(
+            select(func.count(Game.id)).where(Game.date_hour > date(2025, 3, 1))
+        ).one()
+    )
+
+    loaded = load_teams(session, limit=10)
+    assert {team.id for team in loaded} == {team.id for team in teams}
+
+
+def test_find_regressions():
+    baseline = {"fast": {"median_ms": 10.0}, "slow": {"median_ms": 10.0}}
+    results = {
+        "fast": {"median_ms": 11.0},
+        "slow": {"median_ms": 13.0},
+        "new": {"median_ms": 99.0},
+    }
+
+    regressions = find_regressions(results, baseline, max_regression=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("slow:")
+
+
+def test_load_report_and_slos():
+    load_run = LoadRun(
+        base_url="http://localhost",
+        profile=PROFILES["sunday_evening"],
+        users=1,
+        duration_seconds=10,
+        team_emails=["admin-0@benchmark.local"],
+    )
+    load_run.timings["GET /players/"] = RouteTimings(
+        latencies_ms=[float(ms) for ms in range(1, 101)], errors=2
+    )
+    load_run.timings["GET /games/next-game"] = RouteTimings(latencies_ms=[5.0])
+
+    report = load_run.report(elapsed_seconds=10)
+
+    assert report["GET /players/"]["p50_ms"] == 50.5
+    assert report["GET /players/"]["p99_ms"] == 99.01
+    assert report["GET /games/next-game"]["p95_ms"] == 5.0
+    assert report["total"]["requests"] == 101
+    assert report["total"]["throughput_rps"] == 10.1
+
+    slos = {
+        "default": {"p95_ms": 200, "max_error_rate": 0.01},
+        "routes": {"GET /games/next-game": {"p95_ms": 1}},
+    }
+    assert check_slos(report, slos) == [
+        "GET /games/next-game: p95_ms 5.0 > 1",
+        "GET /players/: error_rate 0.02 > 0.01",
+        "total: error_rate 0.0198 > 0.01",
+    ]
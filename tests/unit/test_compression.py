@@ -0,0 +1,45 @@
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from fastapi.testclient import TestClient
+
+from infra.compression import CompressionMiddleware
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+
+@app.get("/json")
+async def large_json():
+    return [{"name": f"Jogador {i}"} for i in range(100)]
+
+
+@app.get("/small")
+async def small_json():
+    return {"name": "Jogador"}
+
+
+@app.get("/image")
+async def image():
+    return Response(b"0" * 1000, media_type="image/png")
+
+
+@app.get("/events")
+async def events():
+    return PlainTextResponse("data: 1\n\n" * 100, media_type="text/event-stream")
+
+
+client = TestClient(app)
+
+
+def test_compresses_allowed_content_types_above_minimum_size():
+    response = client.get("/json", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert len(response.json()) == 100
+
+
+def test_does_not_compress_small_or_not_allowed_responses():
+    for path in ["/small", "/image", "/events"]:
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
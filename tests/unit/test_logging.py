@@ -0,0 +1,122 @@
+import io
+import json
+import threading
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from infra import request_context
+from infra.logger import QueuedJSONSink
+from infra.request_context import RequestContextMiddleware
+
+
+class _SlowStream(io.StringIO):
+    """Holds the writer thread on its first write until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.writing.set()
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+def _add_sink(sink: QueuedJSONSink) -> int:
+    # As configure_logger, whose request id patcher api.main installed
+    return logger.add(
+        sink,
+        format=lambda _record: "{exception}",
+        backtrace=False,
+        diagnose=False,
+    )
+
+
+def test_json_sink_queues_info_and_counts_drops_but_writes_errors_right_away():
+    stream = _SlowStream()
+    sink = QueuedJSONSink(stream, queue_size=1)
+    sink_id = _add_sink(sink)
+    token = request_context.request_id.set("req-1")
+    try:
+        logger.bind(team_id="team-1").info("first")
+        assert stream.writing.wait(timeout=5)
+        logger.info("queued")
+        logger.info("dropped")
+        assert sink.stats() == {
+            "queued": 1,
+            "written": 0,
+            "dropped": {"INFO": 1},
+        }
+
+        stream.release.set()
+        sink.flush()
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        logger.warning("careful")
+    finally:
+        request_context.request_id.reset(token)
+        logger.remove(sink_id)
+
+    # Written by the caller, the writer thread was already stopped
+    first, queued, failed, warning = (
+        json.loads(line) for line in stream.getvalue().splitlines()
+    )
+    assert first["message"] == "first"
+    assert first["level"] == "INFO"
+    assert first["request_id"] == "req-1"
+    assert first["extra"] == {"team_id": "team-1"}
+    assert queued["message"] == "queued" and "exception" not in queued
+    assert failed["level"] == "ERROR"
+    assert "ValueError: boom" in failed["exception"]
+    assert warning["message"] == "careful"
+    assert sink.stats()["written"] == 4
+
+
+def test_request_id_and_sampled_access_log(monkeypatch):
+    monkeypatch.setattr(
+        request_context, "ACCESS_LOG_ROUTE_SAMPLE_RATES", {"GET /quiet": 0.0}
+    )
+    monkeypatch.setattr(request_context, "sampled_out_access_logs", 0)
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+    messages = []
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        logger.info("inside")
+        return {"request_id": request_context.request_id.get()}
+
+    @app.get("/quiet")
+    def quiet():
+        return {}
+
+    sink_id = logger.add(
+        lambda message: messages.append(message.record),
+        format="{message}",
+    )
+    try:
+        client = TestClient(app)
+        response = client.get("/items/1", headers={"X-Request-ID": "abc-123"})
+        generated = client.get("/items/2", headers={"X-Request-ID": "bad id!"})
+        client.get("/quiet")
+    finally:
+        logger.remove(sink_id)
+
+    assert response.headers["X-Request-ID"] == "abc-123"
+    assert response.json() == {"request_id": "abc-123"}
+    assert generated.headers["X-Request-ID"] not in ("", "bad id!")
+    assert generated.json()["request_id"] == generated.headers["X-Request-ID"]
+
+    # /quiet's access log was sampled out
+    inside, access, _, _ = messages
+    assert inside["message"] == "inside"
+    assert inside["extra"]["request_id"] == "abc-123"
+    assert access["message"].startswith("GET /items/{item_id} 200 ")
+    assert access["extra"]["request_id"] == "abc-123"
+    assert access["extra"]["status_code"] == 200
+    assert request_context.sampled_out_access_logs == 1
@@ -0,0 +1,60 @@
+from sqlalchemy import event
+
+from bounded_contexts.team.models import Team
+from bounded_contexts.team.repo import TeamReadRepo, TeamWriteRepo
+from tests.database import engine, TestingSessionLocal
+
+
+class _SelectsCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.count += 1
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(engine, "before_cursor_execute", self)
+
+
+def test_lookups_are_shared_by_the_session_repos(mock_team):
+    session = TestingSessionLocal()
+    try:
+        with _SelectsCounter() as selects:
+            team = TeamReadRepo(session).get_by_id(mock_team.id)
+            # Other repo instance, id as str (as in the token)
+            assert TeamReadRepo(session).get_by_id(str(mock_team.id)) is team
+            assert TeamReadRepo(session).get_by_code("unknown") is None
+            assert TeamReadRepo(session).get_by_code("unknown") is None
+        assert selects.count == 2
+    finally:
+        session.close()
+
+
+def test_writes_clear_the_lookups(mock_team):
+    session = TestingSessionLocal()
+    try:
+        assert TeamReadRepo(session).get_by_code("new-code") is None
+
+        team = TeamReadRepo(session).get_by_id(mock_team.id)
+        team.deleted = True
+        TeamWriteRepo(session).save_without_commit(team, team.id)
+        session.flush()
+        assert TeamReadRepo(session).get_by_id(mock_team.id) is None
+        session.rollback()
+
+        session.add(
+            Team(
+                name="New",
+                foundation_date=mock_team.foundation_date,
+                code="new-code",
+            )
+        )
+        session.commit()
+        assert TeamReadRepo(session).get_by_code("new-code") is not None
+    finally:
+        session.close()
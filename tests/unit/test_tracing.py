@@ -0,0 +1,110 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from infra import tracing
+from infra.tracing import (
+    TracingMiddleware,
+    install_query_hooks,
+    otlp_payload,
+    parameter_shapes,
+    set_trace_attribute,
+    start_trace,
+    traced,
+)
+
+
+def test_spans_nest_and_slow_queries_log_parameter_shapes(monkeypatch):
+    monkeypatch.setattr(tracing, "SLOW_QUERY_THRESHOLD_MS", 0)
+    engine = create_engine("sqlite://")
+    install_query_hooks(engine)
+    messages = []
+    sink_id = logger.add(messages.append, format="{message}")
+
+    @traced
+    def find_players(team_id: str, names: list[str]):
+        with engine.connect() as connection:
+            return connection.execute(
+                text("SELECT :team_id, :names_count"),
+                {"team_id": team_id, "names_count": len(names)},
+            ).all()
+
+    try:
+        # Outside a trace only the slow query log runs
+        find_players("team-1", ["João"])
+        assert tracing.current_trace() is None
+
+        with start_trace("GET /players/") as root:
+            set_trace_attribute("team_id", "team-1")
+            find_players("team-1", ["João", "Zé"])
+
+        # Failed statements leave nothing behind on the connection
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM missing"))
+            assert connection.info == {}
+    finally:
+        logger.remove(sink_id)
+
+    trace = root.trace
+    sql, service, request = trace.spans
+    assert request is root and request.parent_id is None
+    assert service.name.endswith("find_players")
+    assert service.parent_id == root.id
+    assert sql.name == "SQL SELECT" and sql.parent_id == service.id
+    # SQLite's DBAPI takes them positionally
+    assert sql.attributes["db.parameters"] == "['str', 'int']"
+
+    assert len(messages) == 2
+    assert "Slow query" in messages[0] and "team-1" not in messages[0]
+    assert "parameters: ['str', 'int']" in messages[0]
+
+    spans = otlp_payload([trace])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert {span["traceId"] for span in spans} == {trace.id}
+    assert all(
+        {"key": "team_id", "value": {"stringValue": "team-1"}} in span["attributes"]
+        for span in spans
+    )
+    assert "parentSpanId" not in spans[-1]
+
+
+def test_parameter_shapes():
+    assert parameter_shapes({"ids": [1, 2, 3], "name": None}) == (
+        "{'ids': 'list[3]', 'name': 'NoneType'}"
+    )
+    assert parameter_shapes([(1, "a"), (2, "b")], executemany=True) == (
+        "2 x ['int', 'str']"
+    )
+
+
+def test_tracing_middleware_names_the_root_span_by_route(monkeypatch):
+    exported = []
+
+    class _Exporter:
+        def export(self, trace):
+            exported.append(trace)
+
+    monkeypatch.setattr(tracing, "_exporter", _Exporter())
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        if item_id < 0:
+            raise ValueError("negative")
+        return {"id": item_id}
+
+    client = TestClient(app, raise_server_exceptions=False)
+    assert client.get("/items/1").status_code == 200
+    assert client.get("/items/-1").status_code == 500
+
+    ok, failed = (trace.spans[-1] for trace in exported)
+    assert ok.name == "GET /items/{item_id}"
+    assert ok.trace.attributes["http.route"] == "/items/{item_id}"
+    assert ok.attributes["http.status_code"] == 200
+    assert ok.error is None
+    assert failed.name == "GET /items/{item_id}"
+    assert "negative" in failed.error
@@ -0,0 +1,20 @@
+from api.main import app
+from infra.warmup import warm_up, _route_models
+from bounded_contexts.game_and_stats.game.schemas import GameAndStatsToUpdateResponse
+from bounded_contexts.player.schemas import PlayerResponse
+from tests.database import engine
+
+
+def test_warm_up_runs_all_steps():
+    metrics = warm_up(app, engine)
+
+    assert set(metrics) == {"mappers_ms", "database_ms", "validators_ms", "total_ms"}
+    assert all(value is not None for value in metrics.values())
+
+
+def test_route_models_include_nested_and_list_responses():
+    models = _route_models(app)
+
+    assert GameAndStatsToUpdateResponse in models
+    # From list[PlayerResponse] annotations
+    assert PlayerResponse in models